@@ -0,0 +1,79 @@
+"""orders with stock reservation
+
+Revision ID: 5d7e3f1a9b20
+Revises: 8c4e2a91d0f3
+Create Date: 2026-10-19 21:12:40.204117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "5d7e3f1a9b20"
+down_revision: Union[str, None] = "8c4e2a91d0f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "orders",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("status", sa.SmallInteger(), nullable=False),
+        sa.Column("total", sa.Numeric(12, 2), nullable=False),
+        sa.Column("idempotency_key", sa.String(length=128), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("user_id", "idempotency_key"),
+    )
+    op.create_index("ix_orders_user", "orders", ["user_id", "id"])
+    op.create_index(
+        "ix_orders_reserved_expires_at",
+        "orders",
+        ["expires_at"],
+        postgresql_where=sa.text("status = 1"),
+    )
+    op.create_table(
+        "order_items",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("order_id", sa.Integer(), nullable=False),
+        sa.Column("variant_id", sa.Integer(), nullable=True),
+        sa.Column("product_id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=256), nullable=False),
+        sa.Column("sku", sa.String(length=64), nullable=False),
+        sa.Column("size", sa.String(length=16), nullable=False),
+        sa.Column("color", sa.String(length=32), nullable=False),
+        sa.Column("price", sa.Numeric(10, 2), nullable=False),
+        sa.Column("quantity", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["order_id"], ["orders.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(
+            ["variant_id"],
+            ["product_variants.id"],
+            ondelete="SET NULL",
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_order_items_order_id"),
+        "order_items",
+        ["order_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_order_items_order_id"), table_name="order_items")
+    op.drop_table("order_items")
+    op.drop_index("ix_orders_reserved_expires_at", table_name="orders")
+    op.drop_index("ix_orders_user", table_name="orders")
+    op.drop_table("orders")
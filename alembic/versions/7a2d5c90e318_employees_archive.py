@@ -0,0 +1,76 @@
+"""employees archive
+
+Revision ID: 7a2d5c90e318
+Revises: e61b8d3c4f07
+Create Date: 2026-10-20 00:21:09.604551
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "7a2d5c90e318"
+down_revision: Union[str, None] = "e61b8d3c4f07"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "employees",
+        sa.Column("Дата деактивации", sa.DateTime(timezone=True), nullable=True),
+    )
+    # Срок хранения уже деактивированных сотрудников отсчитывается от миграции
+    op.execute(
+        'UPDATE employees SET "Дата деактивации" = now() WHERE NOT "Профиль активен"',
+    )
+    op.create_index(
+        "ix_employees_deactivated_at",
+        "employees",
+        ["Дата деактивации"],
+        postgresql_where=sa.text('NOT "Профиль активен"'),
+    )
+    op.create_table(
+        "employees_archive",
+        sa.Column("company_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("Ссылка на телеграм", sa.String(length=256), nullable=True),
+        sa.Column("Ссылка на ВК", sa.String(length=256), nullable=True),
+        sa.Column("Номер телефона", sa.String(length=32), nullable=True),
+        sa.Column(
+            "Дополнительная информация о сотруднике",
+            sa.String(),
+            nullable=True,
+        ),
+        sa.Column("Дата деактивации", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "Дата архивации",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(["company_id"], ["companies.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("company_id", "user_id"),
+    )
+
+
+def downgrade() -> None:
+    # Архивные сотрудники возвращаются в employees неактивными
+    op.execute(
+        """
+        INSERT INTO employees
+            (company_id, user_id, "Ссылка на телеграм", "Ссылка на ВК", "Номер телефона",
+             "Дополнительная информация о сотруднике", "Профиль активен", "Дата деактивации")
+        SELECT
+            company_id, user_id, "Ссылка на телеграм", "Ссылка на ВК", "Номер телефона",
+            "Дополнительная информация о сотруднике", false, "Дата деактивации"
+        FROM employees_archive
+        ON CONFLICT DO NOTHING
+        """,
+    )
+    op.drop_table("employees_archive")
+    op.drop_index("ix_employees_deactivated_at", table_name="employees")
+    op.drop_column("employees", "Дата деактивации")
@@ -0,0 +1,140 @@
+"""product catalog
+
+Revision ID: 8c4e2a91d0f3
+Revises: 3b1f9c2d7e41
+Create Date: 2026-10-19 14:03:27.518342
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "8c4e2a91d0f3"
+down_revision: Union[str, None] = "3b1f9c2d7e41"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LISTING_COLUMNS = [
+    "company_name",
+    "name",
+    "min_price",
+    "max_price",
+    "sizes",
+    "colors",
+    "in_stock",
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "products",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("company_id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=256), nullable=False),
+        sa.Column("description", sa.String(), nullable=True),
+        sa.Column("category", sa.SmallInteger(), nullable=False),
+        sa.Column("is_published", sa.Boolean(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["company_id"], ["companies.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_products_company_category",
+        "products",
+        ["company_id", "category"],
+    )
+    op.create_table(
+        "product_variants",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("product_id", sa.Integer(), nullable=False),
+        sa.Column("sku", sa.String(length=64), nullable=False),
+        sa.Column("size", sa.String(length=16), nullable=False),
+        sa.Column("color", sa.String(length=32), nullable=False),
+        sa.Column("price", sa.Numeric(10, 2), nullable=False),
+        sa.ForeignKeyConstraint(["product_id"], ["products.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("product_id", "size", "color"),
+        sa.UniqueConstraint("sku"),
+    )
+    op.create_index(
+        op.f("ix_product_variants_product_id"),
+        "product_variants",
+        ["product_id"],
+    )
+    op.create_table(
+        "stock",
+        sa.Column("variant_id", sa.Integer(), nullable=False),
+        sa.Column("quantity", sa.Integer(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.CheckConstraint("quantity >= 0", name="ck_stock_quantity"),
+        sa.ForeignKeyConstraint(
+            ["variant_id"],
+            ["product_variants.id"],
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("variant_id"),
+    )
+    op.create_table(
+        "product_listings",
+        sa.Column("product_id", sa.Integer(), nullable=False),
+        sa.Column("company_id", sa.Integer(), nullable=False),
+        sa.Column("company_name", sa.String(length=256), nullable=False),
+        sa.Column("category", sa.SmallInteger(), nullable=False),
+        sa.Column("name", sa.String(length=256), nullable=False),
+        sa.Column("min_price", sa.Numeric(10, 2), nullable=True),
+        sa.Column("max_price", sa.Numeric(10, 2), nullable=True),
+        sa.Column("sizes", postgresql.ARRAY(sa.String(length=16)), nullable=False),
+        sa.Column("colors", postgresql.ARRAY(sa.String(length=32)), nullable=False),
+        sa.Column("in_stock", sa.Boolean(), nullable=False),
+        sa.Column("is_published", sa.Boolean(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["product_id"], ["products.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("product_id"),
+    )
+    op.create_index(
+        "ix_product_listings_company_category",
+        "product_listings",
+        ["company_id", "category", "product_id"],
+        postgresql_include=LISTING_COLUMNS,
+        postgresql_where=sa.text("is_published"),
+    )
+    op.create_index(
+        "ix_product_listings_category",
+        "product_listings",
+        ["category", "product_id"],
+        postgresql_include=["company_id", *LISTING_COLUMNS],
+        postgresql_where=sa.text("is_published"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_product_listings_category", table_name="product_listings")
+    op.drop_index(
+        "ix_product_listings_company_category",
+        table_name="product_listings",
+    )
+    op.drop_table("product_listings")
+    op.drop_table("stock")
+    op.drop_index(op.f("ix_product_variants_product_id"), table_name="product_variants")
+    op.drop_table("product_variants")
+    op.drop_index("ix_products_company_category", table_name="products")
+    op.drop_table("products")
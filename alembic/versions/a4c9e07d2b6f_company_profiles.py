@@ -0,0 +1,88 @@
+"""company profile read model
+
+Revision ID: a4c9e07d2b6f
+Revises: 5d7e3f1a9b20
+Create Date: 2026-10-19 23:05:12.518302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "a4c9e07d2b6f"
+down_revision: Union[str, None] = "5d7e3f1a9b20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _iso(column: str) -> str:
+    """Дата в формате ответов API (pydantic): UTC с "Z", микросекунды - только ненулевые."""
+    return (
+        f"""to_char({column} AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS')"""
+        f" || CASE WHEN date_part('microseconds', {column})::bigint % 1000000 = 0"
+        f" THEN '' ELSE to_char({column} AT TIME ZONE 'UTC', '.US') END || 'Z'"
+    )
+
+
+def upgrade() -> None:
+    op.create_table(
+        "company_profiles",
+        sa.Column("company_id", sa.Integer(), nullable=False),
+        sa.Column("employee_count", sa.Integer(), nullable=False),
+        sa.Column("rating", sa.Float(), nullable=True),
+        sa.Column("is_verified", sa.Boolean(), nullable=False),
+        sa.Column("is_hidden", sa.Boolean(), nullable=False),
+        sa.Column("document", postgresql.JSONB(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(["company_id"], ["companies.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("company_id"),
+    )
+    op.create_index(
+        "ix_company_profiles_visible",
+        "company_profiles",
+        ["company_id"],
+        postgresql_where=sa.text("is_verified AND NOT is_hidden"),
+    )
+    # Профили уже зарегистрированных компаний
+    op.execute(
+        f"""
+        INSERT INTO company_profiles
+            (company_id, employee_count, rating, is_verified, is_hidden, document)
+        SELECT
+            c.id,
+            count(e.user_id),
+            c."Рейтинг",
+            c."Подтверждена",
+            coalesce(c."Скрыта в системе", false),
+            jsonb_build_object(
+                'id', c.id,
+                'name', c."Название компании",
+                'director_fullname', c."ФИО директора",
+                'type', c."Тип компании",
+                'jur_address', c."Юридический адрес",
+                'fact_address', c."Фактический адрес",
+                'created_at', {_iso('c."Дата регистрации"')},
+                'updated_at', {_iso('c."Дата обновления"')},
+                'rating', c."Рейтинг",
+                'is_verified', c."Подтверждена",
+                'is_hidden', coalesce(c."Скрыта в системе", false),
+                'employee_count', count(e.user_id)
+            )
+        FROM companies c
+        LEFT JOIN employees e ON e.company_id = c.id AND e."Профиль активен"
+        GROUP BY c.id
+        """,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_company_profiles_visible", table_name="company_profiles")
+    op.drop_table("company_profiles")
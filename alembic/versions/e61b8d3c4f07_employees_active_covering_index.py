@@ -0,0 +1,65 @@
+"""partial covering index over active employees
+
+Revision ID: e61b8d3c4f07
+Revises: a4c9e07d2b6f
+Create Date: 2026-10-19 23:48:31.772019
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "e61b8d3c4f07"
+down_revision: Union[str, None] = "a4c9e07d2b6f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+DIRECTORY_COLUMNS = [
+    "Ссылка на телеграм",
+    "Ссылка на ВК",
+    "Номер телефона",
+    "Профиль активен",
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY не блокирует запись в employees, но требует выполнения вне транзакции
+    with op.get_context().autocommit_block():
+        # Недостроенный (INVALID) индекс неудачной попытки миграции
+        op.drop_index(
+            "ix_employees_company_active",
+            table_name="employees",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.create_index(
+            "ix_employees_company_active",
+            "employees",
+            ["company_id", "user_id"],
+            postgresql_include=DIRECTORY_COLUMNS,
+            postgresql_where=sa.text('"Профиль активен"'),
+            postgresql_concurrently=True,
+        )
+        # Поиск по company_id обслуживает первичный ключ (company_id, user_id)
+        op.drop_index(
+            "ix_employees_company_id",
+            table_name="employees",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_employees_company_id",
+            "employees",
+            ["company_id"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_employees_company_active",
+            table_name="employees",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,33 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.apps.cart.schemas import CartItemIn
+    from src.apps.cart.service import CartService
+
+
+class CartController:
+    def __init__(self, cart_service: CartService) -> None:
+        self._cart_service = cart_service
+
+    async def get(self, user_pk: int) -> dict:
+        return await self._cart_service.get(user_pk=user_pk)
+
+    async def add(self, user_pk: int, in_model: CartItemIn) -> dict:
+        return await self._cart_service.add(user_pk=user_pk, in_model=in_model)
+
+    async def update(self, user_pk: int, variant_pk: int, quantity: int) -> dict:
+        return await self._cart_service.update(
+            user_pk=user_pk,
+            variant_pk=variant_pk,
+            quantity=quantity,
+        )
+
+    async def remove(self, user_pk: int, variant_pk: int) -> None:
+        await self._cart_service.remove(user_pk=user_pk, variant_pk=variant_pk)
+
+    async def clear(self, user_pk: int) -> None:
+        await self._cart_service.clear(user_pk=user_pk)
+
+    async def checkout(self, user_pk: int) -> dict:
+        return await self._cart_service.checkout(user_pk=user_pk)
@@ -0,0 +1,30 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from fastapi import Depends
+
+from src.apps.cart.controller import CartController
+from src.apps.cart.service import CartService
+from src.apps.cart.storage import cart_storage
+from src.apps.catalog.repository import ProductRepository
+from src.core.sql.database import get_session
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def get_cart_service(
+    session: AsyncSession = Depends(get_session),
+) -> CartService:
+    yield CartService(
+        storage=cart_storage,
+        product_repo=ProductRepository(session=session),
+    )
+
+
+async def get_cart_controller(
+    cart_service: CartService = Depends(get_cart_service),
+) -> CartController:
+    yield CartController(cart_service=cart_service)
+
+
+__all__ = ["get_cart_controller", "get_cart_service"]
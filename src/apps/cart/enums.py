@@ -0,0 +1,13 @@
+from enum import Enum
+
+
+class CartItemStatus(str, Enum):
+    """
+    ok - товар доступен в нужном количестве
+    insufficient_stock - остатка не хватает
+    unavailable - товар снят с публикации или удален
+    """
+
+    OK = "ok"
+    INSUFFICIENT_STOCK = "insufficient_stock"
+    UNAVAILABLE = "unavailable"
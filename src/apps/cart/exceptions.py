@@ -0,0 +1,9 @@
+from fastapi.exceptions import HTTPException
+
+
+class CartLimitError(HTTPException):
+    """Превышено количество позиций в корзине."""
+
+
+class CartCheckoutError(HTTPException):
+    """Корзину нельзя оформить: она пуста или товары недоступны."""
@@ -0,0 +1,127 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from fastapi import APIRouter, Depends, status
+
+from src.apps.cart.depends import get_cart_controller
+from src.apps.cart.schemas import CartItemIn, CartLineOut, CartOut, CartQuantityIn
+from src.core.auth.strategy import get_current_user_id
+from src.core.http_response_schemas import BadRequest, Conflict, Unauthorized
+from src.core.sql.uow import UnitOfWorkRoute
+
+if TYPE_CHECKING:
+    from src.apps.cart.controller import CartController
+
+cart_router = APIRouter(route_class=UnitOfWorkRoute)
+
+
+@cart_router.get(
+    "",
+    response_model=CartOut,
+    description="Корзина текущего пользователя с актуальными ценами и остатками",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": CartOut},
+        status.HTTP_401_UNAUTHORIZED: {"model": Unauthorized},
+    },
+)
+async def cart_detail(
+    controller: CartController = Depends(get_cart_controller),
+    user_pk: int = Depends(get_current_user_id),
+) -> CartOut:
+    return await controller.get(user_pk=user_pk)
+
+
+@cart_router.post(
+    "/items",
+    response_model=CartLineOut,
+    description="Добавить товар в корзину (количество суммируется)",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": CartLineOut},
+        status.HTTP_400_BAD_REQUEST: {"model": BadRequest},
+        status.HTTP_401_UNAUTHORIZED: {"model": Unauthorized},
+    },
+)
+async def add_to_cart(
+    item: CartItemIn,
+    controller: CartController = Depends(get_cart_controller),
+    user_pk: int = Depends(get_current_user_id),
+) -> CartLineOut:
+    return await controller.add(user_pk=user_pk, in_model=item)
+
+
+@cart_router.put(
+    "/items/{variant_pk}",
+    response_model=CartLineOut,
+    description="Установить количество товара в корзине",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": CartLineOut},
+        status.HTTP_400_BAD_REQUEST: {"model": BadRequest},
+        status.HTTP_401_UNAUTHORIZED: {"model": Unauthorized},
+    },
+)
+async def update_cart_item(
+    variant_pk: int,
+    item: CartQuantityIn,
+    controller: CartController = Depends(get_cart_controller),
+    user_pk: int = Depends(get_current_user_id),
+) -> CartLineOut:
+    return await controller.update(
+        user_pk=user_pk,
+        variant_pk=variant_pk,
+        quantity=item.quantity,
+    )
+
+
+@cart_router.delete(
+    "/items/{variant_pk}",
+    description="Удалить товар из корзины",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={
+        status.HTTP_204_NO_CONTENT: {"description": "Товар удален из корзины"},
+        status.HTTP_401_UNAUTHORIZED: {"model": Unauthorized},
+    },
+)
+async def remove_from_cart(
+    variant_pk: int,
+    controller: CartController = Depends(get_cart_controller),
+    user_pk: int = Depends(get_current_user_id),
+):
+    await controller.remove(user_pk=user_pk, variant_pk=variant_pk)
+
+
+@cart_router.delete(
+    "",
+    description="Очистить корзину",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={
+        status.HTTP_204_NO_CONTENT: {"description": "Корзина очищена"},
+        status.HTTP_401_UNAUTHORIZED: {"model": Unauthorized},
+    },
+)
+async def clear_cart(
+    controller: CartController = Depends(get_cart_controller),
+    user_pk: int = Depends(get_current_user_id),
+):
+    await controller.clear(user_pk=user_pk)
+
+
+@cart_router.post(
+    "/checkout",
+    response_model=CartOut,
+    description="Проверить цены и остатки всех позиций перед оформлением заказа",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": CartOut},
+        status.HTTP_400_BAD_REQUEST: {"model": BadRequest},
+        status.HTTP_401_UNAUTHORIZED: {"model": Unauthorized},
+        status.HTTP_409_CONFLICT: {"model": Conflict},
+    },
+)
+async def cart_checkout(
+    controller: CartController = Depends(get_cart_controller),
+    user_pk: int = Depends(get_current_user_id),
+) -> CartOut:
+    return await controller.checkout(user_pk=user_pk)
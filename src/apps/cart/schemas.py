@@ -0,0 +1,38 @@
+from __future__ import annotations
+from decimal import Decimal
+
+from pydantic import BaseModel, Field
+
+from src.apps.cart.enums import CartItemStatus
+
+
+class CartItemIn(BaseModel):
+    variant_id: int = Field(..., title="Вариант товара")
+    quantity: int = Field(1, ge=1, title="Количество")
+
+
+class CartQuantityIn(BaseModel):
+    quantity: int = Field(..., ge=0, title="Количество", description="0 - удалить")
+
+
+class CartLineOut(BaseModel):
+    variant_id: int
+    quantity: int = Field(..., title="Количество в корзине")
+
+
+class CartItemOut(CartLineOut):
+    status: CartItemStatus = Field(..., title="Доступность")
+    product_id: int | None = None
+    name: str | None = Field(None, title="Название")
+    sku: str | None = Field(None, title="Артикул")
+    size: str | None = Field(None, title="Размер")
+    color: str | None = Field(None, title="Цвет")
+    price: Decimal | None = Field(None, title="Цена")
+    available: int | None = Field(None, title="Остаток")
+    line_total: Decimal | None = Field(None, title="Сумма позиции")
+
+
+class CartOut(BaseModel):
+    items: list[CartItemOut] = Field(..., title="Позиции")
+    total: Decimal = Field(..., title="Сумма доступных позиций")
+    is_valid: bool = Field(..., title="Корзину можно оформить")
@@ -0,0 +1,115 @@
+from __future__ import annotations
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+from fastapi import status
+
+from src.apps.cart.enums import CartItemStatus
+from src.apps.cart.exceptions import CartCheckoutError, CartLimitError
+from src.apps.cart.storage import CartLimitExceeded
+from src.core.config import get_settings
+
+if TYPE_CHECKING:
+    from src.apps.cart.schemas import CartItemIn
+    from src.apps.cart.storage import CartStorage
+    from src.apps.catalog.repository import ProductRepository
+
+settings = get_settings()
+
+
+class CartService:
+    def __init__(self, storage: CartStorage, product_repo: ProductRepository) -> None:
+        self._storage = storage
+        self._product_repo = product_repo
+
+    async def get(self, user_pk: int) -> dict:
+        """Корзина с актуальными ценами и остатками из каталога."""
+        return await self._price(await self._storage.get(user_pk))
+
+    async def add(self, user_pk: int, in_model: CartItemIn) -> dict:
+        quantity = await self._limited(
+            self._storage.add(user_pk, in_model.variant_id, in_model.quantity),
+        )
+        return {"variant_id": in_model.variant_id, "quantity": quantity}
+
+    async def update(self, user_pk: int, variant_pk: int, quantity: int) -> dict:
+        quantity = await self._limited(
+            self._storage.set(user_pk, variant_pk, quantity),
+        )
+        return {"variant_id": variant_pk, "quantity": quantity}
+
+    async def remove(self, user_pk: int, variant_pk: int) -> None:
+        await self._storage.remove(user_pk, variant_pk)
+
+    async def clear(self, user_pk: int) -> None:
+        await self._storage.clear(user_pk)
+
+    async def checkout(self, user_pk: int) -> dict:
+        """Проверить цены и остатки всех позиций перед оформлением заказа."""
+        cart = await self.get(user_pk)
+        if not cart["items"]:
+            raise CartCheckoutError(
+                detail="Корзина пуста",
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+        if not cart["is_valid"]:
+            problems = [
+                item for item in cart["items"] if item["status"] != CartItemStatus.OK
+            ]
+            raise CartCheckoutError(
+                detail="Товары недоступны или их не хватает: %s"
+                % ", ".join(
+                    str(item.get("sku") or item["variant_id"]) for item in problems
+                ),
+                status_code=status.HTTP_409_CONFLICT,
+            )
+        return cart
+
+    async def _price(self, lines: dict[int, int]) -> dict:
+        offers = {
+            offer.variant_id: offer
+            for offer in await self._product_repo.get_offers(variant_pks=list(lines))
+        }
+        items = []
+        total = Decimal(0)
+        for variant_pk, quantity in sorted(lines.items()):
+            offer = offers.get(variant_pk)
+            if offer is None or not offer.is_published:
+                items.append(
+                    {
+                        "variant_id": variant_pk,
+                        "quantity": quantity,
+                        "status": CartItemStatus.UNAVAILABLE,
+                    },
+                )
+                continue
+            line_total = offer.price * quantity
+            total += line_total
+            items.append(
+                {
+                    **offer._asdict(),
+                    "quantity": quantity,
+                    "line_total": line_total,
+                    "status": (
+                        CartItemStatus.OK
+                        if offer.available >= quantity
+                        else CartItemStatus.INSUFFICIENT_STOCK
+                    ),
+                },
+            )
+        return {
+            "items": items,
+            "total": total,
+            "is_valid": all(item["status"] == CartItemStatus.OK for item in items),
+        }
+
+    @staticmethod
+    async def _limited(change) -> int:
+        try:
+            return await change
+        except CartLimitExceeded:
+            raise CartLimitError(
+                detail="В корзине не может быть больше %s позиций"
+                % settings.cart.CART_MAX_ITEMS,
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
@@ -0,0 +1,112 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from src.core.config import get_settings
+
+if TYPE_CHECKING:
+    from aioredis import Redis
+
+settings = get_settings()
+
+# Корзина - хэш {variant_id: quantity}. Изменение позиции, проверка лимитов
+# и продление TTL выполняются одним скриптом, поэтому параллельные клики
+# из нескольких вкладок не теряют изменения.
+UPDATE_SCRIPT = """
+local current = tonumber(redis.call('HGET', KEYS[1], ARGV[1]) or '0')
+local quantity = tonumber(ARGV[2])
+if ARGV[3] == 'add' then
+    quantity = current + quantity
+end
+quantity = math.min(quantity, tonumber(ARGV[4]))
+if quantity <= 0 then
+    redis.call('HDEL', KEYS[1], ARGV[1])
+    quantity = 0
+else
+    if current == 0 and redis.call('HLEN', KEYS[1]) >= tonumber(ARGV[5]) then
+        return -1
+    end
+    redis.call('HSET', KEYS[1], ARGV[1], quantity)
+end
+redis.call('EXPIRE', KEYS[1], ARGV[6])
+return quantity
+"""
+
+
+class CartLimitExceeded(Exception):
+    """В корзине уже максимальное количество позиций."""
+
+
+class CartStorage:
+    """
+    Корзины пользователей в Redis, без обращений к PostgreSQL.
+    Корзина, которую не меняли и не открывали CART_TTL секунд, удаляется сама.
+    """
+
+    def __init__(self) -> None:
+        self._redis: Redis | None = None
+        self._prefix: str = ""
+        self._update = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._redis is not None
+
+    def init(self, redis: Redis, prefix: str = "ywstore-cart") -> None:
+        """!! Клиент должен декодировать ответы (decode_responses=True)."""
+        self._redis = redis
+        self._prefix = prefix
+        self._update = redis.register_script(UPDATE_SCRIPT)
+
+    def reset(self) -> None:
+        self._redis = None
+        self._update = None
+
+    def _key(self, user_pk: int) -> str:
+        return f"{self._prefix}:{user_pk}"
+
+    async def get(self, user_pk: int) -> dict[int, int]:
+        key = self._key(user_pk)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hgetall(key)
+            pipe.expire(key, settings.cart.CART_TTL)
+            items, _ = await pipe.execute()
+        return {int(variant): int(quantity) for variant, quantity in items.items()}
+
+    async def add(self, user_pk: int, variant_pk: int, quantity: int) -> int:
+        """Увеличить количество позиции, вернуть новое."""
+        return await self._change(user_pk, variant_pk, quantity, mode="add")
+
+    async def set(self, user_pk: int, variant_pk: int, quantity: int) -> int:
+        """Установить количество позиции; 0 удаляет позицию."""
+        return await self._change(user_pk, variant_pk, quantity, mode="set")
+
+    async def remove(self, user_pk: int, variant_pk: int) -> None:
+        await self._change(user_pk, variant_pk, 0, mode="set")
+
+    async def clear(self, user_pk: int) -> None:
+        await self._redis.delete(self._key(user_pk))
+
+    async def _change(
+        self,
+        user_pk: int,
+        variant_pk: int,
+        quantity: int,
+        mode: str,
+    ) -> int:
+        result = await self._update(
+            keys=[self._key(user_pk)],
+            args=[
+                variant_pk,
+                quantity,
+                mode,
+                settings.cart.CART_MAX_QUANTITY,
+                settings.cart.CART_MAX_ITEMS,
+                settings.cart.CART_TTL,
+            ],
+        )
+        if int(result) < 0:
+            raise CartLimitExceeded
+        return int(result)
+
+
+cart_storage = CartStorage()
@@ -0,0 +1,88 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Collection, Mapping, Sequence
+
+if TYPE_CHECKING:
+    from src.apps.catalog.models import Product, ProductListing, Stock
+    from src.apps.catalog.schemas import ProductIn, ProductOptional, VariantIn
+    from src.apps.catalog.service import ProductService
+    from src.apps.company.service import CompanyService
+
+
+class CatalogController:
+    def __init__(
+        self,
+        product_service: ProductService,
+        company_service: CompanyService,
+    ) -> None:
+        self._product_service = product_service
+        self._company_service = company_service
+
+    async def get(
+        self,
+        company_pk: int | None = None,
+        category: int | None = None,
+    ) -> Sequence[ProductListing]:
+        return await self._product_service.get(company_pk=company_pk, category=category)
+
+    async def search(
+        self,
+        filters: Mapping[str, Collection[int | str]],
+        in_stock: bool,
+        offset: int,
+        limit: int,
+    ) -> dict:
+        return await self._product_service.search(
+            filters=filters,
+            in_stock=in_stock,
+            offset=offset,
+            limit=limit,
+        )
+
+    async def get_product_or_404(self, product_pk: int) -> Product:
+        return await self._product_service.get_product_or_404(product_pk=product_pk)
+
+    async def create(self, company_pk: int, in_model: ProductIn) -> Product:
+        await self._company_service.get_company_or_404(company_pk=company_pk)
+        return await self._product_service.create(
+            company_pk=company_pk,
+            in_model=in_model,
+        )
+
+    async def add_variant(
+        self,
+        company_pk: int,
+        product_pk: int,
+        in_model: VariantIn,
+    ) -> Product:
+        return await self._product_service.add_variant(
+            company_pk=company_pk,
+            product_pk=product_pk,
+            in_model=in_model,
+        )
+
+    async def update(
+        self,
+        company_pk: int,
+        product_pk: int,
+        data: ProductIn | ProductOptional,
+        partial: bool,
+    ) -> Product:
+        return await self._product_service.update(
+            company_pk=company_pk,
+            product_pk=product_pk,
+            data=data,
+            partial=partial,
+        )
+
+    async def set_stock(self, company_pk: int, variant_pk: int, quantity: int) -> Stock:
+        return await self._product_service.set_stock(
+            company_pk=company_pk,
+            variant_pk=variant_pk,
+            quantity=quantity,
+        )
+
+    async def delete_by_pk(self, company_pk: int, product_pk: int) -> None:
+        await self._product_service.delete_by_pk(
+            company_pk=company_pk,
+            product_pk=product_pk,
+        )
@@ -0,0 +1,38 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from fastapi import Depends
+
+from src.apps.catalog.controller import CatalogController
+from src.apps.catalog.repository import ProductRepository
+from src.apps.catalog.service import ProductService
+from src.apps.company.depends import get_company_service
+from src.core.sql.database import get_session
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from src.apps.company.service import CompanyService
+
+
+async def _product_repository(
+    session: AsyncSession = Depends(get_session),
+) -> ProductRepository:
+    yield ProductRepository(session=session)
+
+
+async def get_product_service(
+    repository: ProductRepository = Depends(_product_repository),
+) -> ProductService:
+    yield ProductService(repo=repository)
+
+
+async def get_catalog_controller(
+    product_service: ProductService = Depends(get_product_service),
+    company_service: CompanyService = Depends(get_company_service),
+) -> CatalogController:
+    yield CatalogController(
+        product_service=product_service,
+        company_service=company_service,
+    )
+
+
+__all__ = ["get_catalog_controller", "get_product_service"]
@@ -0,0 +1,21 @@
+from enum import IntEnum
+
+
+class ProductCategory(IntEnum):
+    """
+    1. Футболки
+    2. Рубашки
+    3. Брюки
+    4. Платья
+    5. Верхняя одежда
+    6. Обувь
+    7. Аксессуары
+    """
+
+    TSHIRTS = 1
+    SHIRTS = 2
+    PANTS = 3
+    DRESSES = 4
+    OUTERWEAR = 5
+    SHOES = 6
+    ACCESSORIES = 7
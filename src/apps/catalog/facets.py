@@ -0,0 +1,364 @@
+"""
+Фасетный поиск по каталогу на битовых картах в памяти процесса.
+
+Каждый вариант товара (SKU) получает позицию в битовой строке (int Python).
+Позиции упорядочены по (компания, товар, вариант): варианты одного товара идут подряд,
+за ними - один служебный бит товара. Для каждого значения фасета хранится битовая
+карта вариантов с этим значением, для компании - непрерывный диапазон позиций.
+Фильтр - это AND/OR битовых карт, а переход от вариантов к товарам делается
+одним сложением: перенос из первого бита товара доходит до служебного бита
+только если ни один вариант товара не подошел.
+
+Снимок индекса неизменяемый и собирается целиком из PostgreSQL в фоне,
+при изменении версии пространства имен кэша "catalog" (ее увеличивает
+любая запись в каталог) и не реже SEARCH_MAX_AGE.
+"""
+from __future__ import annotations
+from bisect import bisect_right
+from decimal import Decimal
+from typing import Collection, Iterable, Mapping, NamedTuple, Sequence
+import asyncio
+import logging
+import time
+
+from src.apps.catalog.enums import ProductCategory
+from src.apps.catalog.repository import ProductRepository
+from src.core.cache import response_cache
+from src.core.config import get_settings
+from src.core.sql.database import async_session
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+FACETS = ("company", "category", "size", "color", "price")
+
+
+class FacetRow(NamedTuple):
+    product_id: int
+    company_id: int
+    company_name: str
+    category: int
+    size: str
+    color: str
+    price: Decimal
+    in_stock: bool
+
+
+class FacetCount(NamedTuple):
+    value: int | str
+    label: str
+    count: int
+
+
+class SearchResult(NamedTuple):
+    total: int
+    product_ids: list[int]
+    facets: dict[str, list[FacetCount]]
+
+
+def price_labels(bands: Sequence[int]) -> list[str]:
+    """Подписи ценовых диапазонов: 0-1000, 1000-3000, ..., 10000+."""
+    bounds = [0, *bands]
+    return [
+        *(f"{low}-{high}" for low, high in zip(bounds, bounds[1:])),
+        f"{bounds[-1]}+",
+    ]
+
+
+def _bitmap(positions: list[int], size: int) -> int:
+    bits = bytearray((size + 7) // 8)
+    for position in positions:
+        bits[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(bits, "little")
+
+
+def _range(start: int, end: int) -> int:
+    return ((1 << (end - start)) - 1) << start
+
+
+class FacetSnapshot:
+    """
+    Неизменяемый индекс фасетов.
+    Строки должны быть отсортированы по (company_id, product_id).
+    """
+
+    def __init__(self, rows: Iterable[FacetRow], price_bands: Sequence[int]) -> None:
+        self.price_bands = list(price_bands)
+        self.price_labels = price_labels(self.price_bands)
+        positions: dict[str, dict[int | str, list[int]]] = {
+            facet: {} for facet in FACETS[1:]
+        }
+        in_stock: list[int] = []
+        variants: list[int] = []
+        firsts: list[int] = []
+        guards: list[int] = []
+        self.products: dict[int, int] = {}
+        self.companies: dict[int, tuple[int, int]] = {}
+        self.company_names: dict[int, str] = {}
+
+        position = 0
+        product_id = company_id = None
+        for row in rows:
+            if row.product_id != product_id:
+                if product_id is not None:
+                    self.products[position] = product_id
+                    guards.append(position)
+                    position += 1
+                if row.company_id != company_id:
+                    if company_id is not None:
+                        self.companies[company_id] = (
+                            self.companies[company_id][0],
+                            position,
+                        )
+                    company_id = row.company_id
+                    self.companies[company_id] = (position, position)
+                    self.company_names[company_id] = row.company_name
+                product_id = row.product_id
+                firsts.append(position)
+            variants.append(position)
+            if row.in_stock:
+                in_stock.append(position)
+            band = self.price_labels[bisect_right(self.price_bands, row.price)]
+            for facet, value in (
+                ("category", row.category),
+                ("size", row.size),
+                ("color", row.color),
+                ("price", band),
+            ):
+                positions[facet].setdefault(value, []).append(position)
+            position += 1
+        if product_id is not None:
+            self.products[position] = product_id
+            guards.append(position)
+            position += 1
+            self.companies[company_id] = (self.companies[company_id][0], position)
+
+        self.size = position
+        self.company_order = sorted(self.companies, key=self.company_names.__getitem__)
+        self.skus = len(variants)
+        self.variants = _bitmap(variants, position)
+        self.firsts = _bitmap(firsts, position)
+        self.guards = _bitmap(guards, position)
+        self.in_stock = _bitmap(in_stock, position)
+        self.bitmaps: dict[str, dict[int | str, int]] = {
+            facet: {
+                value: _bitmap(values[value], position)
+                for value in self._ordered(facet, values)
+            }
+            for facet, values in positions.items()
+        }
+
+    def _ordered(self, facet: str, values: Collection[int | str]) -> list[int | str]:
+        if facet == "price":
+            return [label for label in self.price_labels if label in values]
+        return sorted(values)
+
+    def products_of(self, matched: int) -> int:
+        """
+        Служебные биты товаров, у которых подошел хотя бы один вариант.
+        Несовпавшие варианты товара - это непрерывная серия единиц от первого бита,
+        прибавление единицы в первый бит переносится в служебный бит
+        только если серия покрывает все варианты.
+        """
+        return self.guards ^ self._missed(matched)
+
+    def _missed(self, matched: int) -> int:
+        # matched - подмножество variants, поэтому XOR дает несовпавшие варианты
+        return ((self.variants ^ matched) + self.firsts) & self.guards
+
+    def _mask(self, facet: str, values: Collection[int | str]) -> int:
+        mask = 0
+        if facet == "company":
+            for value in values:
+                if value in self.companies:
+                    mask |= _range(*self.companies[value])
+            return mask
+        bitmaps = self.bitmaps[facet]
+        for value in values:
+            mask |= bitmaps.get(value, 0)
+        return mask
+
+    def _company_counts(self, bits: str, selected: Collection) -> list[FacetCount]:
+        """Товары компании занимают непрерывный диапазон, считаем единицы в срезе строки."""
+        counts = []
+        length = len(bits)
+        for company_id in self.company_order:
+            start, end = self.companies[company_id]
+            count = bits.count("1", max(length - end, 0), max(length - start, 0))
+            if count or company_id in selected:
+                name = self.company_names[company_id]
+                counts.append(FacetCount(company_id, name, count))
+        return counts
+
+    def _value_counts(
+        self,
+        facet: str,
+        base: int,
+        selected: Collection,
+    ) -> list[FacetCount]:
+        counts = []
+        total = len(self.products)
+        for value, bitmap in self.bitmaps[facet].items():
+            matched = base & bitmap
+            count = total - self._missed(matched).bit_count() if matched else 0
+            if count or value in selected:
+                counts.append(FacetCount(value, self._label(facet, value), count))
+        return counts
+
+    @staticmethod
+    def _label(facet: str, value: int | str) -> str:
+        if facet == "category":
+            return ProductCategory(value).name.lower()
+        return str(value)
+
+    def _page(self, bits: str, offset: int, limit: int) -> list[int]:
+        # Младшие биты - в конце строки, идем с конца, чтобы сохранить порядок позиций
+        product_ids = []
+        length = end = len(bits)
+        for index in range(offset + limit):
+            end = bits.rfind("1", 0, end)
+            if end < 0:
+                break
+            if index >= offset:
+                product_ids.append(self.products[length - 1 - end])
+        return product_ids
+
+    def search(
+        self,
+        filters: Mapping[str, Collection[int | str]],
+        in_stock: bool = False,
+        offset: int = 0,
+        limit: int = 24,
+    ) -> SearchResult:
+        """
+        Значения внутри фасета объединяются через ИЛИ, фасеты между собой - через И.
+        Счетчики фасета считаются с фильтрами всех остальных фасетов, чтобы было видно,
+        сколько товаров добавит выбор еще одного значения.
+        """
+        base = self.in_stock if in_stock else self.variants
+        masks = {
+            facet: self._mask(facet, values)
+            for facet, values in filters.items()
+            if facet in FACETS and values
+        }
+        matched = base
+        for mask in masks.values():
+            matched &= mask
+        products = self.products_of(matched)
+        bits = format(products, "b")
+        facets = {}
+        for facet in FACETS:
+            selected = filters.get(facet) or ()
+            if facet not in masks:
+                others = matched
+            else:
+                others = base
+                for name, mask in masks.items():
+                    if name != facet:
+                        others &= mask
+            if facet != "company":
+                facets[facet] = self._value_counts(facet, others, selected)
+            elif others is matched:
+                facets[facet] = self._company_counts(bits, selected)
+            else:
+                company_bits = format(self.products_of(others), "b")
+                facets[facet] = self._company_counts(company_bits, selected)
+        return SearchResult(
+            total=products.bit_count(),
+            product_ids=self._page(bits, offset, limit),
+            facets=facets,
+        )
+
+
+class FacetIndex:
+    """
+    Держит текущий снимок индекса и пересобирает его в фоне.
+    Пока фоновая задача не запущена (тесты, скрипты), снимок собирается при первом поиске.
+    """
+
+    def __init__(self) -> None:
+        self._snapshot: FacetSnapshot | None = None
+        self._version: str | None = None
+        self._built_at = 0.0
+        self._lock = asyncio.Lock()
+        self._stopping: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def snapshot(self) -> FacetSnapshot | None:
+        return self._snapshot
+
+    async def rebuild(self) -> FacetSnapshot:
+        async with self._lock:
+            # Версию читаем до выборки: изменения во время сборки вызовут еще одну
+            version = (
+                await response_cache.version("catalog")
+                if response_cache.enabled
+                else None
+            )
+            start = time.perf_counter()
+            async with async_session() as session:
+                rows = await ProductRepository(session=session).get_facet_rows()
+            snapshot = await asyncio.to_thread(
+                FacetSnapshot,
+                rows,
+                settings.search.price_bands,
+            )
+            self._snapshot, self._version = snapshot, version
+            self._built_at = time.monotonic()
+            logger.info(
+                "Индекс фасетов собран за %.1f мс: товаров %d, вариантов %d",
+                (time.perf_counter() - start) * 1000,
+                len(snapshot.products),
+                snapshot.skus,
+            )
+            return snapshot
+
+    async def search(
+        self,
+        filters: Mapping[str, Collection[int | str]],
+        in_stock: bool = False,
+        offset: int = 0,
+        limit: int = 24,
+    ) -> SearchResult:
+        snapshot = self._snapshot or await self.rebuild()
+        return snapshot.search(filters, in_stock=in_stock, offset=offset, limit=limit)
+
+    async def start(self) -> None:
+        self._stopping = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stopping.set()
+        await self._task
+        self._task = None
+        self._snapshot = None
+
+    async def _is_stale(self) -> bool:
+        if self._snapshot is None:
+            return True
+        if time.monotonic() - self._built_at > settings.search.SEARCH_MAX_AGE:
+            return True
+        if not response_cache.enabled:
+            return False
+        return await response_cache.version("catalog") != self._version
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                if await self._is_stale():
+                    await self.rebuild()
+            except Exception:
+                logger.exception("Не удалось пересобрать индекс фасетов")
+            try:
+                await asyncio.wait_for(
+                    self._stopping.wait(),
+                    timeout=settings.search.SEARCH_REFRESH_INTERVAL,
+                )
+            except asyncio.TimeoutError:
+                pass
+
+
+facet_index = FacetIndex()
@@ -0,0 +1,176 @@
+from __future__ import annotations
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import (
+    Boolean,
+    CheckConstraint,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    SmallInteger,
+    String,
+    UniqueConstraint,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from src.core.mixins import JSONRepresentationMixin
+from src.core.sql.database import Base
+
+
+# Колонки, которые список каталога читает прямо из индекса (index-only scan)
+LISTING_COLUMNS = (
+    "company_name",
+    "name",
+    "min_price",
+    "max_price",
+    "sizes",
+    "colors",
+    "in_stock",
+)
+
+
+class Product(JSONRepresentationMixin, Base):
+    __tablename__ = "products"
+    __table_args__ = (Index("ix_products_company_category", "company_id", "category"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    company_id: Mapped[int] = mapped_column(
+        ForeignKey("companies.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    name: Mapped[str] = mapped_column(String(length=256), nullable=False)
+    description: Mapped[str] = mapped_column(String, nullable=True)
+    category: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    is_published: Mapped[bool] = mapped_column(Boolean, default=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    variants: Mapped[list[ProductVariant]] = relationship(
+        "ProductVariant",
+        back_populates="product",
+        lazy="selectin",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by="ProductVariant.id",
+    )
+
+    def __repr__(self) -> str:
+        return self.name
+
+
+class ProductVariant(JSONRepresentationMixin, Base):
+    __tablename__ = "product_variants"
+    __table_args__ = (UniqueConstraint("product_id", "size", "color"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    product_id: Mapped[int] = mapped_column(
+        ForeignKey("products.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    sku: Mapped[str] = mapped_column(String(length=64), unique=True)
+    size: Mapped[str] = mapped_column(String(length=16), nullable=False)
+    color: Mapped[str] = mapped_column(String(length=32), nullable=False)
+    price: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
+    product: Mapped[Product] = relationship("Product", back_populates="variants")
+    stock: Mapped[Stock] = relationship(
+        "Stock",
+        lazy="joined",
+        uselist=False,
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+    @property
+    def quantity(self) -> int:
+        return self.stock.quantity if self.stock else 0
+
+    def __repr__(self) -> str:
+        return self.sku
+
+
+class Stock(JSONRepresentationMixin, Base):
+    """
+    Остаток варианта товара.
+    Вынесен в отдельную узкую строку: частые изменения остатков не переписывают
+    строки товаров и вариантов и не раздувают их индексы.
+    """
+
+    __tablename__ = "stock"
+    __table_args__ = (CheckConstraint("quantity >= 0", name="ck_stock_quantity"),)
+
+    variant_id: Mapped[int] = mapped_column(
+        ForeignKey("product_variants.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    quantity: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+    def __repr__(self) -> str:
+        return f"Stock(variant={self.variant_id}, quantity={self.quantity})"
+
+
+class ProductListing(JSONRepresentationMixin, Base):
+    """
+    Денормализованная карточка товара для списков каталога.
+    Список читается одной таблицей без соединений и агрегатов, а покрывающий индекс
+    по компании и категории позволяет отдавать его index-only сканированием.
+    Строка пересобирается репозиторием при изменении товара или его вариантов.
+    """
+
+    __tablename__ = "product_listings"
+    __table_args__ = (
+        Index(
+            "ix_product_listings_company_category",
+            "company_id",
+            "category",
+            "product_id",
+            postgresql_include=LISTING_COLUMNS,
+            postgresql_where=text("is_published"),
+        ),
+        Index(
+            "ix_product_listings_category",
+            "category",
+            "product_id",
+            postgresql_include=("company_id", *LISTING_COLUMNS),
+            postgresql_where=text("is_published"),
+        ),
+    )
+
+    product_id: Mapped[int] = mapped_column(
+        ForeignKey("products.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    company_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    company_name: Mapped[str] = mapped_column(String(length=256), nullable=False)
+    category: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    name: Mapped[str] = mapped_column(String(length=256), nullable=False)
+    min_price: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=True)
+    max_price: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=True)
+    sizes: Mapped[list[str]] = mapped_column(ARRAY(String(length=16)), nullable=False)
+    colors: Mapped[list[str]] = mapped_column(ARRAY(String(length=32)), nullable=False)
+    in_stock: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    is_published: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+    def __repr__(self) -> str:
+        return f"ProductListing(product={self.product_id})"
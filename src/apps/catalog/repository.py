@@ -0,0 +1,371 @@
+from __future__ import annotations
+from datetime import datetime
+from typing import TYPE_CHECKING, Mapping, Sequence
+
+from sqlalchemy import and_, distinct, false, func, true
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import load_only
+from sqlalchemy.sql import delete, select, update
+
+from src.apps.catalog.models import (
+    LISTING_COLUMNS,
+    Product,
+    ProductListing,
+    ProductVariant,
+    Stock,
+)
+from src.apps.company.models import Company
+from src.core.interfaces import IRepository
+from src.core.outbox import DomainEvent, add_event
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from src.apps.catalog.schemas import ProductIn, ProductOptional, VariantIn
+
+
+LISTING_FIELDS = [
+    getattr(ProductListing, column)
+    for column in ("company_id", "category", *LISTING_COLUMNS)
+]
+
+
+def _is_visible():
+    """Товар виден в каталоге, если он опубликован, а компания подтверждена и не скрыта."""
+    return and_(
+        Product.is_published == true(),
+        Company.is_verified == true(),
+        func.coalesce(Company.is_hidden, false()) == false(),
+    )
+
+
+async def sync_company_listings(session: AsyncSession, company_pk: int) -> None:
+    """Обновить в карточках товаров данные компании после ее изменения."""
+    await session.execute(
+        update(ProductListing)
+        .where(
+            ProductListing.product_id == Product.id,
+            Product.company_id == Company.id,
+            Company.id == company_pk,
+        )
+        .values(company_name=Company.name, is_published=_is_visible())
+        .execution_options(synchronize_session=False),
+    )
+
+
+class ProductRepository(IRepository):
+    model: Product = Product
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get(
+        self,
+        company_pk: int | None = None,
+        category: int | None = None,
+    ) -> Sequence[ProductListing]:
+        """Список каталога читается только из денормализованной таблицы."""
+        query = (
+            select(ProductListing)
+            .options(load_only(*LISTING_FIELDS))
+            .where(ProductListing.is_published)
+        )
+        if company_pk is not None:
+            query = query.where(ProductListing.company_id == company_pk)
+        if category is not None:
+            query = query.where(ProductListing.category == category)
+        listings = await self._session.execute(
+            query.order_by(ProductListing.product_id),
+        )
+        return listings.scalars().all()
+
+    async def get_listings(
+        self,
+        product_pks: Sequence[int],
+    ) -> Sequence[ProductListing]:
+        """Карточки товаров в порядке переданных идентификаторов."""
+        if not product_pks:
+            return []
+        listings = await self._session.execute(
+            select(ProductListing)
+            .options(load_only(*LISTING_FIELDS))
+            .where(
+                ProductListing.is_published,
+                ProductListing.product_id.in_(product_pks),
+            ),
+        )
+        by_pk = {listing.product_id: listing for listing in listings.scalars()}
+        return [by_pk[pk] for pk in product_pks if pk in by_pk]
+
+    async def get_offers(self, variant_pks: Sequence[int]) -> Sequence[tuple]:
+        """Цена, остаток и доступность вариантов одним запросом (корзина, оформление)."""
+        if not variant_pks:
+            return []
+        offers = await self._session.execute(
+            select(
+                ProductVariant.id.label("variant_id"),
+                ProductVariant.product_id,
+                Product.name,
+                ProductVariant.sku,
+                ProductVariant.size,
+                ProductVariant.color,
+                ProductVariant.price,
+                func.coalesce(Stock.quantity, 0).label("available"),
+                func.coalesce(ProductListing.is_published, false()).label(
+                    "is_published",
+                ),
+            )
+            .join(Product, Product.id == ProductVariant.product_id)
+            .outerjoin(Stock, Stock.variant_id == ProductVariant.id)
+            .outerjoin(
+                ProductListing,
+                ProductListing.product_id == ProductVariant.product_id,
+            )
+            .where(ProductVariant.id.in_(variant_pks)),
+        )
+        return offers.all()
+
+    async def get_facet_rows(self) -> Sequence[tuple]:
+        """Варианты опубликованных товаров для индекса фасетов, по компаниям и товарам."""
+        rows = await self._session.execute(
+            select(
+                ProductVariant.product_id,
+                ProductListing.company_id,
+                ProductListing.company_name,
+                ProductListing.category,
+                ProductVariant.size,
+                ProductVariant.color,
+                ProductVariant.price,
+                (func.coalesce(Stock.quantity, 0) > 0).label("in_stock"),
+            )
+            .join(
+                ProductListing,
+                ProductListing.product_id == ProductVariant.product_id,
+            )
+            .outerjoin(Stock, Stock.variant_id == ProductVariant.id)
+            .where(ProductListing.is_published)
+            .order_by(
+                ProductListing.company_id,
+                ProductVariant.product_id,
+                ProductVariant.id,
+            ),
+        )
+        return rows.all()
+
+    async def get_by_pk(self, product_pk: int) -> Product | None:
+        product = await self._session.execute(
+            select(self.model).where(self.model.id == product_pk),
+        )
+        return product.unique().scalar_one_or_none()
+
+    async def get_variant(
+        self,
+        variant_pk: int,
+        company_pk: int,
+    ) -> ProductVariant | None:
+        variant = await self._session.execute(
+            select(ProductVariant)
+            .join(Product, Product.id == ProductVariant.product_id)
+            .where(ProductVariant.id == variant_pk, Product.company_id == company_pk),
+        )
+        return variant.unique().scalar_one_or_none()
+
+    async def get_existing_skus(self, skus: Sequence[str]) -> Sequence[str]:
+        existing = await self._session.execute(
+            select(ProductVariant.sku).where(ProductVariant.sku.in_(skus)),
+        )
+        return existing.scalars().all()
+
+    async def create(self, company_pk: int, in_model: ProductIn) -> Product:
+        product = self.model(
+            **in_model.model_dump(exclude={"variants"}),
+            company_id=company_pk,
+            variants=[self._new_variant(variant) for variant in in_model.variants],
+        )
+        self._session.add(product)
+        await self._session.flush()
+        await self.refresh_listing(product.id)
+        add_event(self._session, DomainEvent.PRODUCT_CREATED, product.id)
+        await self._session.refresh(product)
+        return product
+
+    async def add_variant(self, product: Product, in_model: VariantIn) -> Product:
+        product.variants.append(self._new_variant(in_model))
+        product.updated_at = datetime.now()
+        await self._session.flush()
+        await self.refresh_listing(product.id)
+        add_event(self._session, DomainEvent.PRODUCT_UPDATED, product.id)
+        await self._session.refresh(product)
+        return product
+
+    async def update(
+        self,
+        product_pk: int,
+        data: ProductIn | ProductOptional,
+        partial: bool = False,
+    ) -> Product:
+        await self._session.execute(
+            update(self.model)
+            .where(self.model.id == product_pk)
+            .values(
+                **data.model_dump(exclude={"variants"}, exclude_none=partial),
+                updated_at=datetime.now(),
+            ),
+        )
+        await self.refresh_listing(product_pk)
+        add_event(self._session, DomainEvent.PRODUCT_UPDATED, product_pk)
+        return await self._reload(product_pk)
+
+    async def set_stock(self, variant: ProductVariant, quantity: int) -> Stock:
+        """
+        Меняет только узкую строку остатка. Карточку в списке трогаем лишь тогда,
+        когда у товара меняется признак наличия.
+        """
+        stock = await self._session.execute(
+            update(Stock)
+            .returning(Stock)
+            .where(Stock.variant_id == variant.id)
+            .values(quantity=quantity),
+        )
+        await self.sync_in_stock([variant.product_id])
+        add_event(
+            self._session,
+            DomainEvent.STOCK_CHANGED,
+            variant.id,
+            product_id=variant.product_id,
+            quantity=quantity,
+        )
+        return stock.scalar_one()
+
+    async def take_stock(self, lines: Mapping[int, int]) -> tuple[int | None, bool]:
+        """
+        Списать остатки {variant_id: quantity} условным UPDATE ... WHERE quantity >= :quantity.
+        Строки блокируются по возрастанию variant_id, поэтому параллельные заказы
+        с пересекающимися позициями не блокируют друг друга взаимно. После ожидания
+        блокировки условие перепроверяется на свежей версии строки - перепродажи нет.
+        Вернуть вариант, которого не хватило (транзакцию нужно откатить), или None,
+        и признак, что какой-то вариант закончился.
+        """
+        sold_out = False
+        for variant_pk in sorted(lines):
+            taken = await self._session.execute(
+                update(Stock)
+                .where(
+                    Stock.variant_id == variant_pk,
+                    Stock.quantity >= lines[variant_pk],
+                )
+                .values(quantity=Stock.quantity - lines[variant_pk])
+                .returning(Stock.quantity)
+                .execution_options(synchronize_session=False),
+            )
+            quantity = taken.scalar_one_or_none()
+            if quantity is None:
+                return variant_pk, sold_out
+            sold_out = sold_out or quantity == 0
+        return None, sold_out
+
+    async def return_stock(self, lines: Mapping[int, int]) -> bool:
+        """
+        Вернуть остатки (отмена или истечение резерва), в том же порядке блокировок.
+        Вернуть True, если какой-то вариант снова появился в наличии.
+        """
+        restocked = False
+        for variant_pk in sorted(lines):
+            returned = await self._session.execute(
+                update(Stock)
+                .where(Stock.variant_id == variant_pk)
+                .values(quantity=Stock.quantity + lines[variant_pk])
+                .returning(Stock.quantity)
+                .execution_options(synchronize_session=False),
+            )
+            restocked = restocked or returned.scalar_one_or_none() == lines[variant_pk]
+        return restocked
+
+    async def delete(self) -> None:
+        await self._session.execute(delete(self.model))
+        add_event(self._session, DomainEvent.PRODUCT_DELETED)
+
+    async def delete_by_pk(self, product_pk: int) -> None:
+        await self._session.execute(
+            delete(self.model).where(self.model.id == product_pk),
+        )
+        add_event(self._session, DomainEvent.PRODUCT_DELETED, product_pk)
+
+    async def refresh_listing(self, product_pk: int) -> None:
+        """Пересобрать карточку товара для списков из товара, вариантов и остатков."""
+        aggregate = (
+            select(
+                Product.id,
+                Product.company_id,
+                Company.name,
+                Product.category,
+                Product.name,
+                func.min(ProductVariant.price),
+                func.max(ProductVariant.price),
+                func.array_remove(func.array_agg(distinct(ProductVariant.size)), None),
+                func.array_remove(func.array_agg(distinct(ProductVariant.color)), None),
+                func.coalesce(func.bool_or(Stock.quantity > 0), false()),
+                _is_visible(),
+            )
+            .join(Company, Company.id == Product.company_id)
+            .outerjoin(ProductVariant, ProductVariant.product_id == Product.id)
+            .outerjoin(Stock, Stock.variant_id == ProductVariant.id)
+            .where(Product.id == product_pk)
+            .group_by(Product.id, Company.id)
+        )
+        columns = [
+            "product_id",
+            "company_id",
+            "company_name",
+            "category",
+            "name",
+            "min_price",
+            "max_price",
+            "sizes",
+            "colors",
+            "in_stock",
+            "is_published",
+        ]
+        statement = insert(ProductListing).from_select(columns, aggregate)
+        await self._session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[ProductListing.product_id],
+                set_={
+                    **{column: statement.excluded[column] for column in columns[1:]},
+                    "updated_at": func.now(),
+                },
+            ),
+        )
+
+    async def sync_in_stock(self, product_pks: Sequence[int]) -> bool:
+        """Обновить признак наличия у карточек, вернуть True, если он у кого-то изменился."""
+        in_stock = (
+            select(func.coalesce(func.bool_or(Stock.quantity > 0), false()))
+            .join(ProductVariant, ProductVariant.id == Stock.variant_id)
+            .where(ProductVariant.product_id == ProductListing.product_id)
+            .scalar_subquery()
+        )
+        changed = await self._session.execute(
+            update(ProductListing)
+            .where(
+                ProductListing.product_id.in_(product_pks),
+                ProductListing.in_stock.is_distinct_from(in_stock),
+            )
+            .values(in_stock=in_stock)
+            .execution_options(synchronize_session=False),
+        )
+        return changed.rowcount > 0
+
+    async def _reload(self, product_pk: int) -> Product:
+        product = await self._session.execute(
+            select(self.model)
+            .where(self.model.id == product_pk)
+            .execution_options(populate_existing=True),
+        )
+        return product.unique().scalar_one()
+
+    @staticmethod
+    def _new_variant(in_model: VariantIn) -> ProductVariant:
+        return ProductVariant(
+            **in_model.model_dump(exclude={"quantity"}),
+            stock=Stock(quantity=in_model.quantity),
+        )
@@ -0,0 +1,240 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Sequence
+from fastapi import APIRouter, Depends, Query, status
+from src.apps.catalog.depends import get_catalog_controller
+from src.apps.catalog.enums import ProductCategory
+from src.apps.catalog.schemas import (
+    ProductIn,
+    ProductListingOut,
+    ProductOptional,
+    ProductOut,
+    ProductSearchOut,
+    StockIn,
+    StockOut,
+    VariantIn,
+)
+from src.core.auth.access import get_company_admin
+from src.core.cache import cache, invalidate
+from src.core.sql.uow import UnitOfWorkRoute
+from src.core.http_response_schemas import (
+    NotAllowed,
+    NotFound,
+    TooManyRequests,
+    Unauthorized,
+    UniqueConstraint,
+)
+from src.core.ratelimit import catalog_limit
+from src.core.auth.tokens import Principal
+
+if TYPE_CHECKING:
+    from src.apps.catalog.controller import CatalogController
+
+catalog_router = APIRouter(route_class=UnitOfWorkRoute)
+
+
+@catalog_router.get(
+    "",
+    response_model=Sequence[ProductListingOut],
+    description="Каталог товаров с фильтром по компании и категории",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": Sequence[ProductListingOut]},
+        status.HTTP_429_TOO_MANY_REQUESTS: {"model": TooManyRequests},
+    },
+    dependencies=[Depends(catalog_limit)],
+)
+@cache(expire=60 * 10, model=Sequence[ProductListingOut], namespace="catalog")
+async def products_list(
+    company_pk: int | None = None,
+    category: ProductCategory | None = None,
+    controller: CatalogController = Depends(get_catalog_controller),
+) -> Sequence[ProductListingOut]:
+    return await controller.get(company_pk=company_pk, category=category)
+
+
+@catalog_router.get(
+    "/search",
+    response_model=ProductSearchOut,
+    description="Фасетный поиск: компания, категория, размер, цвет и цена "
+    "со счетчиками товаров по каждому значению",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": ProductSearchOut},
+        status.HTTP_429_TOO_MANY_REQUESTS: {"model": TooManyRequests},
+    },
+    dependencies=[Depends(catalog_limit)],
+)
+async def products_search(
+    company: list[int] = Query([]),
+    category: list[ProductCategory] = Query([]),
+    size: list[str] = Query([]),
+    color: list[str] = Query([]),
+    price: list[str] = Query([], description="Ценовой диапазон, например 1000-3000"),
+    in_stock: bool = False,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(24, ge=1, le=100),
+    controller: CatalogController = Depends(get_catalog_controller),
+) -> ProductSearchOut:
+    return await controller.search(
+        filters={
+            "company": company,
+            "category": category,
+            "size": size,
+            "color": color,
+            "price": price,
+        },
+        in_stock=in_stock,
+        offset=offset,
+        limit=limit,
+    )
+
+
+@catalog_router.get(
+    "/{product_pk}",
+    response_model=ProductOut,
+    description="Карточка товара с вариантами и остатками",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": ProductOut},
+        status.HTTP_404_NOT_FOUND: {"model": NotFound},
+        status.HTTP_429_TOO_MANY_REQUESTS: {"model": TooManyRequests},
+    },
+    dependencies=[Depends(catalog_limit)],
+)
+@cache(
+    expire=60 * 10,
+    model=ProductOut,
+    namespace=("catalog", "catalog:{product_pk}"),
+)
+async def product_detail(
+    product_pk: int,
+    controller: CatalogController = Depends(get_catalog_controller),
+) -> ProductOut:
+    return await controller.get_product_or_404(product_pk=product_pk)
+
+
+@catalog_router.post(
+    "/company/{company_pk}",
+    response_model=ProductOut,
+    description="Добавить товар в ассортимент компании",
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        status.HTTP_201_CREATED: {"model": ProductOut},
+        status.HTTP_400_BAD_REQUEST: {"model": UniqueConstraint},
+        status.HTTP_401_UNAUTHORIZED: {"model": Unauthorized},
+        status.HTTP_403_FORBIDDEN: {"model": NotAllowed},
+        status.HTTP_404_NOT_FOUND: {"model": NotFound},
+    },
+)
+@invalidate("catalog")
+async def create_product(
+    company_pk: int,
+    product: ProductIn,
+    controller: CatalogController = Depends(get_catalog_controller),
+    _: Principal = Depends(get_company_admin),
+) -> ProductOut:
+    return await controller.create(company_pk=company_pk, in_model=product)
+
+
+@catalog_router.patch(
+    "/company/{company_pk}/{product_pk}",
+    response_model=ProductOut,
+    description="Частично обновить товар",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": ProductOut},
+        status.HTTP_401_UNAUTHORIZED: {"model": Unauthorized},
+        status.HTTP_403_FORBIDDEN: {"model": NotAllowed},
+        status.HTTP_404_NOT_FOUND: {"model": NotFound},
+    },
+)
+@invalidate("catalog")
+async def partial_update_product(
+    company_pk: int,
+    product_pk: int,
+    product: ProductOptional,
+    controller: CatalogController = Depends(get_catalog_controller),
+    _: Principal = Depends(get_company_admin),
+) -> ProductOut:
+    return await controller.update(
+        company_pk=company_pk,
+        product_pk=product_pk,
+        data=product,
+        partial=True,
+    )
+
+
+@catalog_router.post(
+    "/company/{company_pk}/{product_pk}/variants",
+    response_model=ProductOut,
+    description="Добавить вариант товара (размер и цвет)",
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        status.HTTP_201_CREATED: {"model": ProductOut},
+        status.HTTP_400_BAD_REQUEST: {"model": UniqueConstraint},
+        status.HTTP_401_UNAUTHORIZED: {"model": Unauthorized},
+        status.HTTP_403_FORBIDDEN: {"model": NotAllowed},
+        status.HTTP_404_NOT_FOUND: {"model": NotFound},
+    },
+)
+@invalidate("catalog")
+async def add_variant(
+    company_pk: int,
+    product_pk: int,
+    variant: VariantIn,
+    controller: CatalogController = Depends(get_catalog_controller),
+    _: Principal = Depends(get_company_admin),
+) -> ProductOut:
+    return await controller.add_variant(
+        company_pk=company_pk,
+        product_pk=product_pk,
+        in_model=variant,
+    )
+
+
+@catalog_router.put(
+    "/company/{company_pk}/variants/{variant_pk}/stock",
+    response_model=StockOut,
+    description="Установить остаток варианта товара",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": StockOut},
+        status.HTTP_401_UNAUTHORIZED: {"model": Unauthorized},
+        status.HTTP_403_FORBIDDEN: {"model": NotAllowed},
+        status.HTTP_404_NOT_FOUND: {"model": NotFound},
+    },
+)
+@invalidate("catalog")
+async def set_stock(
+    company_pk: int,
+    variant_pk: int,
+    stock: StockIn,
+    controller: CatalogController = Depends(get_catalog_controller),
+    _: Principal = Depends(get_company_admin),
+) -> StockOut:
+    return await controller.set_stock(
+        company_pk=company_pk,
+        variant_pk=variant_pk,
+        quantity=stock.quantity,
+    )
+
+
+@catalog_router.delete(
+    "/company/{company_pk}/{product_pk}",
+    description="Удалить товар",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={
+        status.HTTP_204_NO_CONTENT: {"description": "Товар успешно удален"},
+        status.HTTP_401_UNAUTHORIZED: {"model": Unauthorized},
+        status.HTTP_403_FORBIDDEN: {"model": NotAllowed},
+        status.HTTP_404_NOT_FOUND: {"model": NotFound},
+    },
+)
+@invalidate("catalog")
+async def delete_product(
+    company_pk: int,
+    product_pk: int,
+    controller: CatalogController = Depends(get_catalog_controller),
+    _: Principal = Depends(get_company_admin),
+):
+    await controller.delete_by_pk(company_pk=company_pk, product_pk=product_pk)
@@ -0,0 +1,102 @@
+from __future__ import annotations
+from datetime import datetime
+from decimal import Decimal
+
+from pydantic import BaseModel, Field
+
+from src.apps.catalog.enums import ProductCategory
+from src.core.utils import optional
+
+
+class BaseVariant(BaseModel):
+    sku: str = Field(..., max_length=64, min_length=1, title="Артикул")
+    size: str = Field(..., max_length=16, title="Размер")
+    color: str = Field(..., max_length=32, title="Цвет")
+    price: Decimal = Field(..., gt=0, max_digits=10, decimal_places=2, title="Цена")
+
+
+class VariantIn(BaseVariant):
+    quantity: int = Field(0, ge=0, title="Остаток")
+
+
+class VariantOut(BaseVariant):
+    id: int
+    quantity: int = Field(..., title="Остаток")
+
+    class ConfigDict:
+        from_attributes = True
+
+
+class BaseProduct(BaseModel):
+    name: str = Field(..., max_length=256, min_length=2, title="Название")
+    description: str | None = Field(None, title="Описание")
+    category: ProductCategory = Field(
+        ...,
+        title="Категория",
+        description="1 - Футболки, 2 - Рубашки, 3 - Брюки, 4 - Платья, "
+        "5 - Верхняя одежда, 6 - Обувь, 7 - Аксессуары",
+    )
+    is_published: bool = Field(True, title="Опубликован")
+
+
+class ProductIn(BaseProduct):
+    variants: list[VariantIn] = Field(default_factory=list, title="Варианты")
+
+
+class ProductOut(BaseProduct):
+    id: int
+    company_id: int
+    created_at: datetime = Field(..., title="Дата создания")
+    updated_at: datetime | None = Field(None, title="Дата обновления")
+    variants: list[VariantOut] = Field(..., title="Варианты")
+
+    class ConfigDict:
+        from_attributes = True
+
+
+@optional
+class ProductOptional(BaseProduct):
+    ...
+
+
+class ProductListingOut(BaseModel):
+    product_id: int
+    company_id: int
+    company_name: str = Field(..., title="Компания")
+    category: ProductCategory = Field(..., title="Категория")
+    name: str = Field(..., title="Название")
+    min_price: Decimal | None = Field(..., title="Минимальная цена")
+    max_price: Decimal | None = Field(..., title="Максимальная цена")
+    sizes: list[str] = Field(..., title="Размеры")
+    colors: list[str] = Field(..., title="Цвета")
+    in_stock: bool = Field(..., title="В наличии")
+
+    class ConfigDict:
+        from_attributes = True
+
+
+class FacetValueOut(BaseModel):
+    value: int | str = Field(..., title="Значение")
+    label: str = Field(..., title="Подпись")
+    count: int = Field(..., title="Количество товаров")
+
+
+class ProductSearchOut(BaseModel):
+    total: int = Field(..., title="Найдено товаров")
+    facets: dict[str, list[FacetValueOut]] = Field(
+        ...,
+        title="Фасеты",
+        description="company, category, size, color, price",
+    )
+    items: list[ProductListingOut] = Field(..., title="Товары")
+
+
+class StockIn(BaseModel):
+    quantity: int = Field(..., ge=0, title="Остаток")
+
+
+class StockOut(StockIn):
+    variant_id: int
+
+    class ConfigDict:
+        from_attributes = True
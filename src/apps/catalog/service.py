@@ -0,0 +1,141 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Collection, Mapping, Sequence
+
+from fastapi import status
+
+from src.apps.catalog.facets import facet_index
+from src.core.exceptions import NotFoundError, UniqueConstraintError
+from src.core.interfaces import IService
+
+if TYPE_CHECKING:
+    from src.apps.catalog.models import Product, ProductListing, ProductVariant, Stock
+    from src.apps.catalog.repository import ProductRepository
+    from src.apps.catalog.schemas import ProductIn, ProductOptional, VariantIn
+
+
+class ProductService(IService):
+    def __init__(self, repo: ProductRepository) -> None:
+        self._repo = repo
+
+    async def get(
+        self,
+        company_pk: int | None = None,
+        category: int | None = None,
+    ) -> Sequence[ProductListing]:
+        return await self._repo.get(company_pk=company_pk, category=category)
+
+    async def search(
+        self,
+        filters: Mapping[str, Collection[int | str]],
+        in_stock: bool,
+        offset: int,
+        limit: int,
+    ) -> dict:
+        result = await facet_index.search(
+            filters,
+            in_stock=in_stock,
+            offset=offset,
+            limit=limit,
+        )
+        return {
+            "total": result.total,
+            "facets": {
+                facet: [count._asdict() for count in counts]
+                for facet, counts in result.facets.items()
+            },
+            "items": await self._repo.get_listings(product_pks=result.product_ids),
+        }
+
+    async def get_product_or_404(
+        self,
+        product_pk: int,
+        company_pk: int | None = None,
+    ) -> Product:
+        product = await self._repo.get_by_pk(product_pk=product_pk)
+        if product and company_pk in (None, product.company_id):
+            return product
+        raise NotFoundError(
+            detail="Товар с идентификатором %s не был найден" % product_pk,
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
+
+    async def get_variant_or_404(
+        self,
+        variant_pk: int,
+        company_pk: int,
+    ) -> ProductVariant:
+        if variant := await self._repo.get_variant(
+            variant_pk=variant_pk,
+            company_pk=company_pk,
+        ):
+            return variant
+        raise NotFoundError(
+            detail="Вариант товара с идентификатором %s не был найден" % variant_pk,
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
+
+    async def create(self, company_pk: int, in_model: ProductIn) -> Product:
+        await self._check_skus_are_unique(skus=[v.sku for v in in_model.variants])
+        return await self._repo.create(company_pk=company_pk, in_model=in_model)
+
+    async def add_variant(
+        self,
+        company_pk: int,
+        product_pk: int,
+        in_model: VariantIn,
+    ) -> Product:
+        product = await self.get_product_or_404(
+            product_pk=product_pk,
+            company_pk=company_pk,
+        )
+        await self._check_skus_are_unique(skus=[in_model.sku])
+        if any(
+            (variant.size, variant.color) == (in_model.size, in_model.color)
+            for variant in product.variants
+        ):
+            raise UniqueConstraintError(
+                detail="Вариант с размером <%s> и цветом <%s> уже существует"
+                % (in_model.size, in_model.color),
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+        return await self._repo.add_variant(product=product, in_model=in_model)
+
+    async def update(
+        self,
+        company_pk: int,
+        product_pk: int,
+        data: ProductIn | ProductOptional,
+        partial: bool = False,
+    ) -> Product:
+        await self.get_product_or_404(product_pk=product_pk, company_pk=company_pk)
+        return await self._repo.update(
+            product_pk=product_pk,
+            data=data,
+            partial=partial,
+        )
+
+    async def set_stock(self, company_pk: int, variant_pk: int, quantity: int) -> Stock:
+        variant = await self.get_variant_or_404(
+            variant_pk=variant_pk,
+            company_pk=company_pk,
+        )
+        return await self._repo.set_stock(variant=variant, quantity=quantity)
+
+    async def delete(self) -> None:
+        await self._repo.delete()
+
+    async def delete_by_pk(self, company_pk: int, product_pk: int) -> None:
+        await self.get_product_or_404(product_pk=product_pk, company_pk=company_pk)
+        await self._repo.delete_by_pk(product_pk=product_pk)
+
+    async def _check_skus_are_unique(self, skus: list[str]) -> None:
+        if len(set(skus)) != len(skus):
+            raise UniqueConstraintError(
+                detail="Артикулы вариантов не должны повторяться",
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+        if skus and (existing := await self._repo.get_existing_skus(skus=skus)):
+            raise UniqueConstraintError(
+                detail="Артикулы уже используются: %s" % ", ".join(existing),
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
@@ -2,6 +2,7 @@ from typing import Sequence
 from src.apps.company.service import CompanyService
 from src.apps.company.models import Company
 from src.apps.company.schemas import CompanyIn, CompanyOptional
+from src.core.serializers import PrerenderedJSON
 
 
 class CompanyController:
@@ -29,6 +30,12 @@ class CompanyController:
     async def get_company_or_404(self, company_pk: int) -> Company:
         return await self._service.get_company_or_404(company_pk=company_pk)
 
+    async def get_profiles(self) -> PrerenderedJSON:
+        return await self._service.get_profiles()
+
+    async def get_profile_or_404(self, company_pk: int) -> PrerenderedJSON:
+        return await self._service.get_profile_or_404(company_pk=company_pk)
+
     async def delete(self) -> None:
         await self._service.delete()
 
@@ -9,6 +9,9 @@ from sqlalchemy import (
     Boolean,
     func,
     SmallInteger,
+    ForeignKey,
+    Index,
+    text,
 )
 from datetime import datetime
 from src.core.mixins import JSONRepresentationMixin
@@ -59,3 +62,40 @@ class Company(JSONRepresentationMixin, Base):
 
     def __repr__(self):
         return self.name
+
+
+class CompanyProfile(JSONRepresentationMixin, Base):
+    """
+    Денормализованный профиль компании для детального представления и списка.
+    document - готовый JSON ответа, поэтому чтение - одна строка по первичному ключу
+    (или частичный индекс видимых компаний для списка) без соединений с сотрудниками,
+    пользователями и ролями. Строка пересобирается репозиториями в той же транзакции,
+    что и изменение компании или ее сотрудников.
+    """
+
+    __tablename__ = "company_profiles"
+    __table_args__ = (
+        Index(
+            "ix_company_profiles_visible",
+            "company_id",
+            postgresql_where=text("is_verified AND NOT is_hidden"),
+        ),
+    )
+
+    company_id: Mapped[int] = mapped_column(
+        ForeignKey("companies.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    employee_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    rating: Mapped[float] = mapped_column(Float, nullable=True)
+    is_verified: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    is_hidden: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    document: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+    def __repr__(self) -> str:
+        return f"CompanyProfile(company={self.company_id})"
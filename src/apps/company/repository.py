@@ -1,7 +1,15 @@
 from __future__ import annotations
 from typing import Sequence, TYPE_CHECKING
 from src.core.interfaces import IRepository
-from src.apps.company.models import Company
+from src.core.outbox import DomainEvent, add_event
+from src.apps.company.models import Company, CompanyProfile
+from src.apps.company.schemas import CompanyProfileOut
+from src.apps.catalog.repository import sync_company_listings
+from src.apps.employee.models import Employee
+from src.core.serializers import TrustedSerializer
+from pydantic_core import to_jsonable_python
+from sqlalchemy import Text, and_, func, literal
+from sqlalchemy.dialects.postgresql import JSONB, aggregate_order_by, insert
 from sqlalchemy.sql import select, delete, update
 from datetime import datetime
 from sqlalchemy.sql.expression import false, true
@@ -12,6 +20,78 @@ if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
 
 
+# Поля CompanyProfileOut, которые не совпадают с одноименным атрибутом компании
+PROFILE_EXPRESSIONS = {
+    "is_hidden": func.coalesce(Company.is_hidden, false()),
+    "employee_count": func.count(Employee.user_id),
+}
+PROFILE_COLUMNS = [
+    (
+        PROFILE_EXPRESSIONS[field]
+        if field in PROFILE_EXPRESSIONS
+        else getattr(Company, field)
+    ).label(field)
+    for field in CompanyProfileOut.model_fields
+]
+profile_serializer = TrustedSerializer(CompanyProfileOut)
+
+
+async def refresh_company_profiles(
+    session: AsyncSession,
+    company_pks: Sequence[int] | None = None,
+) -> None:
+    """
+    Пересобрать профили компаний (всех, если идентификаторы не переданы).
+    Документ сериализуется схемой CompanyProfileOut, как ответы PUT, PATCH и POST,
+    поэтому даты и числа в GET и в ответах на запись имеют один формат.
+    """
+    aggregate = (
+        select(*PROFILE_COLUMNS)
+        .outerjoin(
+            Employee,
+            and_(Employee.company_id == Company.id, Employee.is_active == true()),
+        )
+        .group_by(Company.id)
+    )
+    if company_pks is not None:
+        aggregate = aggregate.where(Company.id.in_(company_pks))
+    profiles = [
+        {
+            "company_id": row.id,
+            "employee_count": row.employee_count,
+            "rating": row.rating,
+            "is_verified": row.is_verified,
+            "is_hidden": row.is_hidden,
+            "document": to_jsonable_python(profile_serializer.to_python(row)),
+        }
+        for row in await session.execute(aggregate)
+    ]
+    if not profiles:
+        return
+    statement = insert(CompanyProfile)
+    await session.execute(
+        statement.on_conflict_do_update(
+            index_elements=[CompanyProfile.company_id],
+            set_={
+                **{
+                    column: statement.excluded[column]
+                    for column in profiles[0]
+                    if column != "company_id"
+                },
+                "updated_at": func.now(),
+            },
+        ),
+        profiles,
+    )
+
+
+def _is_profile_visible():
+    return and_(
+        CompanyProfile.is_verified == true(),
+        CompanyProfile.is_hidden == false(),
+    )
+
+
 class CompanyRepository(IRepository):
     model: Company = Company
 
@@ -27,6 +107,43 @@ class CompanyRepository(IRepository):
         )
         return results.unique().scalars().all()
 
+    async def get_profiles(self) -> str:
+        """Готовый JSON-массив профилей видимых компаний, собранный в БД."""
+        profiles = await self._session.execute(
+            select(
+                func.coalesce(
+                    func.jsonb_agg(
+                        aggregate_order_by(
+                            CompanyProfile.document,
+                            CompanyProfile.company_id,
+                        ),
+                    ),
+                    literal("[]").cast(JSONB),
+                ).cast(Text),
+            ).where(_is_profile_visible()),
+        )
+        return profiles.scalar_one()
+
+    async def get_profile(self, company_pk: int) -> str | None:
+        """Готовый JSON профиля видимой компании."""
+        profile = await self._session.execute(
+            select(CompanyProfile.document.cast(Text)).where(
+                CompanyProfile.company_id == company_pk,
+                _is_profile_visible(),
+            ),
+        )
+        return profile.scalar_one_or_none()
+
+    async def exists(self, company_pk: int) -> bool:
+        """Видимая компания существует (проверка по профилю, без загрузки сотрудников)."""
+        profile = await self._session.execute(
+            select(CompanyProfile.company_id).where(
+                CompanyProfile.company_id == company_pk,
+                _is_profile_visible(),
+            ),
+        )
+        return profile.scalar_one_or_none() is not None
+
     async def create(self, in_model: CompanyIn) -> Company:
         company = self.model(
             **in_model.model_dump(),
@@ -34,7 +151,9 @@ class CompanyRepository(IRepository):
             updated_at=datetime.now(),
         )
         self._session.add(company)
-        await self._session.commit()
+        await self._session.flush()
+        add_event(self._session, DomainEvent.COMPANY_CREATED, company.id)
+        await refresh_company_profiles(self._session, [company.id])
         return company
 
     async def get_by_pk(self, company_pk: int) -> Company | None:
@@ -55,13 +174,13 @@ class CompanyRepository(IRepository):
 
     async def delete(self) -> None:
         await self._session.execute(delete(self.model))
-        await self._session.commit()
+        add_event(self._session, DomainEvent.COMPANY_DELETED)
 
     async def delete_by_pk(self, company_pk: int) -> bool:
         result = await self._session.execute(
             delete(self.model).where(self.model.id == company_pk),
         )
-        await self._session.commit()
+        add_event(self._session, DomainEvent.COMPANY_DELETED, company_pk)
         return bool(result.rowcount)
 
     async def update(
@@ -79,7 +198,9 @@ class CompanyRepository(IRepository):
                 updated_at=datetime.now(),
             ),
         )
-        await self._session.commit()
+        add_event(self._session, DomainEvent.COMPANY_UPDATED, company_pk)
+        await sync_company_listings(self._session, company_pk)
+        await refresh_company_profiles(self._session, [company_pk])
         return updated_company.unique().scalar_one()
 
     async def update_is_verified(self, pk: int, is_verified: bool) -> Company:
@@ -89,7 +210,14 @@ class CompanyRepository(IRepository):
             .where(self.model.id == pk)
             .values(is_verified=is_verified),
         )
-        await self._session.commit()
+        add_event(
+            self._session,
+            DomainEvent.COMPANY_VERIFIED,
+            pk,
+            is_verified=is_verified,
+        )
+        await sync_company_listings(self._session, pk)
+        await refresh_company_profiles(self._session, [pk])
         return verified_company.unique().scalar_one()
 
     async def update_is_hidden(
@@ -103,5 +231,12 @@ class CompanyRepository(IRepository):
             .where(self.model.id == company_pk)
             .values(is_hidden=is_hidden),
         )
-        await self._session.commit()
+        add_event(
+            self._session,
+            DomainEvent.COMPANY_HIDDEN,
+            company_pk,
+            is_hidden=is_hidden,
+        )
+        await sync_company_listings(self._session, company_pk)
+        await refresh_company_profiles(self._session, [company_pk])
         return hidden_company.unique().scalar_one()
@@ -1,8 +1,14 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Sequence
 from fastapi import APIRouter, Depends, Body, status
-from fastapi_cache.decorator import cache
-from src.apps.company.schemas import CompanyIn, CompanyOut, CompanyOptional
+from src.core.cache import cache, invalidate
+from src.core.idempotency import IdempotentRoute, idempotent
+from src.apps.company.schemas import (
+    CompanyIn,
+    CompanyOut,
+    CompanyOptional,
+    CompanyProfileOut,
+)
 from src.core.auth.strategy import get_superuser
 from src.apps.company.depends import get_company_controller
 from src.core.auth.access import get_company_admin
@@ -11,13 +17,15 @@ from src.core.http_response_schemas import (
     UniqueConstraint,
     NotFound,
     NotAllowed,
+    TooManyRequests,
 )
-from src.apps.users.models import User
+from src.core.ratelimit import catalog_limit
+from src.core.auth.tokens import Principal
 
 if TYPE_CHECKING:
     from src.apps.company.controller import CompanyController
 
-company_router = APIRouter()
+company_router = APIRouter(route_class=IdempotentRoute)
 
 
 @company_router.post(
@@ -32,26 +40,32 @@ company_router = APIRouter()
     status_code=status.HTTP_201_CREATED,
     description="Зарегистрировать новую компанию",
 )
+@invalidate("company")
+@idempotent
 async def register_company(
     company: CompanyIn,
     controller: CompanyController = Depends(get_company_controller),
-    _: User = Depends(get_superuser),
+    _: Principal = Depends(get_superuser),
 ) -> CompanyOut:
     return await controller.create(in_model=company)
 
 
 @company_router.get(
     "",
-    response_model=Sequence[CompanyOut],
+    response_model=Sequence[CompanyProfileOut],
     description="Получить все компании",
     status_code=status.HTTP_200_OK,
-    responses={status.HTTP_200_OK: {"model": Sequence[CompanyOut]}},
+    responses={
+        status.HTTP_200_OK: {"model": Sequence[CompanyProfileOut]},
+        status.HTTP_429_TOO_MANY_REQUESTS: {"model": TooManyRequests},
+    },
+    dependencies=[Depends(catalog_limit)],
 )
-@cache(expire=60 * 60)
+@cache(expire=60 * 60, model=Sequence[CompanyProfileOut], namespace="company")
 async def companies_list(
     controller: CompanyController = Depends(get_company_controller),
-) -> Sequence[CompanyOut]:
-    return await controller.get()
+) -> Sequence[CompanyProfileOut]:
+    return await controller.get_profiles()
 
 
 @company_router.delete(
@@ -64,9 +78,10 @@ async def companies_list(
         status.HTTP_403_FORBIDDEN: {"model": NotAllowed},
     },
 )
+@invalidate("company", "catalog", "employees")
 async def delete_companies(
     controller: CompanyController = Depends(get_company_controller),
-    _: User = Depends(get_superuser),
+    _: Principal = Depends(get_superuser),
 ):
     await controller.delete()
 
@@ -75,18 +90,18 @@ async def delete_companies(
     "/{company_pk}",
     status_code=status.HTTP_200_OK,
     description="Детальное представление компании",
-    response_model=CompanyOut,
+    response_model=CompanyProfileOut,
     responses={
-        status.HTTP_200_OK: {"model": CompanyOut},
+        status.HTTP_200_OK: {"model": CompanyProfileOut},
         status.HTTP_404_NOT_FOUND: {"model": NotFound},
     },
 )
-@cache(expire=60 * 60)
+@cache(expire=60 * 60, model=CompanyProfileOut, namespace="company")
 async def company_detail(
     company_pk: int,
     controller: CompanyController = Depends(get_company_controller),
-) -> CompanyOut:
-    return await controller.get_company_or_404(company_pk=company_pk)
+) -> CompanyProfileOut:
+    return await controller.get_profile_or_404(company_pk=company_pk)
 
 
 @company_router.delete(
@@ -98,10 +113,11 @@ async def company_detail(
         status.HTTP_404_NOT_FOUND: {"model": NotFound},
     },
 )
+@invalidate("company", "catalog", "employees:{company_pk}")
 async def delete_company(
     company_pk: int,
     controller: CompanyController = Depends(get_company_controller),
-    _: User = Depends(get_superuser),
+    _: Principal = Depends(get_superuser),
 ):
     await controller.delete_by_pk(company_pk=company_pk)
 
@@ -116,11 +132,12 @@ async def delete_company(
         status.HTTP_404_NOT_FOUND: {"model": NotFound},
     },
 )
+@invalidate("company", "catalog")
 async def update_company(
     company_pk: int,
     company: CompanyIn,
     controller: CompanyController = Depends(get_company_controller),
-    _: User = Depends(get_company_admin),
+    _: Principal = Depends(get_company_admin),
 ) -> CompanyOut:
     return await controller.update(company_pk=company_pk, data=company, partial=False)
 
@@ -134,11 +151,12 @@ async def update_company(
         status.HTTP_404_NOT_FOUND: {"model": NotFound},
     },
 )
+@invalidate("company", "catalog")
 async def update_company_partially(
     company_pk: int,
     company: CompanyOptional,
     controller: CompanyController = Depends(get_company_controller),
-    _: User = Depends(get_company_admin),
+    _: Principal = Depends(get_company_admin),
 ) -> CompanyOut:
     return await controller.update(company_pk=company_pk, data=company, partial=True)
 
@@ -152,10 +170,11 @@ async def update_company_partially(
         status.HTTP_403_FORBIDDEN: {"model": NotAllowed},
     },
 )
+@invalidate("company", "catalog", "employees:{company_pk}")
 async def verify_company(
     company_pk: int,
     is_verified: bool = Body(default=True, embed=True),
-    _: User = Depends(get_superuser),
+    _: Principal = Depends(get_superuser),
     controller: CompanyController = Depends(get_company_controller),
 ) -> CompanyOut:
     return await controller.update_is_verified(
@@ -173,10 +192,11 @@ async def verify_company(
         status.HTTP_403_FORBIDDEN: {"model": NotAllowed},
     },
 )
+@invalidate("company", "catalog", "employees:{company_pk}")
 async def hide_company(
     company_pk: int,
     is_hidden: bool = Body(default=True, embed=True),
-    _: User = Depends(get_superuser),
+    _: Principal = Depends(get_superuser),
     controller: CompanyController = Depends(get_company_controller),
 ) -> CompanyOut:
     return await controller.update_is_hidden(company_pk=company_pk, is_hidden=is_hidden)
@@ -39,6 +39,10 @@ class CompanyOut(BaseCompany):
         from_attributes = True
 
 
+class CompanyProfileOut(CompanyOut):
+    employee_count: int = Field(..., title="Количество активных сотрудников")
+
+
 @optional
 class CompanyOptional(BaseCompany):
     ...
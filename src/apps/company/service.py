@@ -2,6 +2,7 @@ from __future__ import annotations
 from fastapi import status
 from src.core.exceptions import UniqueConstraintError, NotFoundError
 from src.core.interfaces import IService
+from src.core.serializers import PrerenderedJSON
 from typing import TYPE_CHECKING, Sequence
 
 if TYPE_CHECKING:
@@ -17,6 +18,17 @@ class CompanyService(IService):
     async def get(self) -> Sequence[Company]:
         return await self._repo.get()
 
+    async def get_profiles(self) -> PrerenderedJSON:
+        return PrerenderedJSON(await self._repo.get_profiles(), "utf-8")
+
+    async def get_profile_or_404(self, company_pk: int) -> PrerenderedJSON:
+        if profile := await self._repo.get_profile(company_pk=company_pk):
+            return PrerenderedJSON(profile, "utf-8")
+        raise NotFoundError(
+            detail="Компания с идентификатором %s не была найдена" % company_pk,
+            status_code=404,
+        )
+
     async def delete(self) -> None:
         await self._repo.delete()
 
@@ -32,6 +44,13 @@ class CompanyService(IService):
             status_code=404,
         )
 
+    async def check_company_exists(self, company_pk: int) -> None:
+        if not await self._repo.exists(company_pk=company_pk):
+            raise NotFoundError(
+                detail="Компания с идентификатором %s не была найдена" % company_pk,
+                status_code=404,
+            )
+
     async def create(self, in_model: CompanyIn) -> Company:
         await self._check_name_is_unique(name=in_model.name)
         return await self._repo.create(in_model=in_model)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+from datetime import datetime, timedelta, timezone
+import asyncio
+import logging
+
+from src.apps.employee.repository import EmployeeRepository
+from src.core.config import get_settings
+from src.core.sql.database import async_session
+from src.core.sql.uow import unit_of_work
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+class EmployeeArchiver:
+    """
+    Переносит в employees_archive сотрудников, деактивированных дольше
+    EMPLOYEE_ARCHIVE_RETENTION: в employees и ее индексах остаются живые строки.
+    """
+
+    def __init__(self) -> None:
+        self._stopping: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+
+    async def archive_inactive(self) -> int:
+        """Перенести очередную пачку, вернуть количество перенесенных сотрудников."""
+        before = datetime.now(timezone.utc) - timedelta(
+            seconds=settings.employees.EMPLOYEE_ARCHIVE_RETENTION,
+        )
+        async with async_session() as session, unit_of_work():
+            return await EmployeeRepository(session=session).archive_inactive(
+                before=before,
+                limit=settings.employees.EMPLOYEE_ARCHIVE_BATCH,
+            )
+
+    async def start(self) -> None:
+        self._stopping = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stopping.set()
+        await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                archived = await self.archive_inactive()
+            except Exception:
+                logger.exception("Не удалось перенести сотрудников в архив")
+                archived = 0
+            if archived:
+                logger.info("Перенесено в архив сотрудников: %d", archived)
+            if archived < settings.employees.EMPLOYEE_ARCHIVE_BATCH:
+                try:
+                    await asyncio.wait_for(
+                        self._stopping.wait(),
+                        timeout=settings.employees.EMPLOYEE_ARCHIVE_INTERVAL,
+                    )
+                except asyncio.TimeoutError:
+                    pass
+
+
+employee_archiver = EmployeeArchiver()
@@ -6,7 +6,7 @@ if TYPE_CHECKING:
     from src.apps.company.service import CompanyService
     from src.apps.users.service import UserService
     from src.apps.employee.schemas import EmployeeIn, EmployeeOptional
-    from src.apps.employee.models import Employee
+    from src.apps.employee.models import Employee, EmployeeArchive
 
 
 class EmployeeController:
@@ -25,9 +25,22 @@ class EmployeeController:
         await self._user_service.get_user_or_404(user_pk=in_model.user_id)
         return await self._employee_service.create(in_model=in_model)
 
-    async def get(self, company_pk: int) -> Sequence[Employee]:
-        await self._company_service.get_company_or_404(company_pk=company_pk)
-        return await self._employee_service.get(company_pk=company_pk)
+    async def get(
+        self,
+        company_pk: int,
+        after: int | None = None,
+        limit: int | None = None,
+        search: str | None = None,
+        roles: Sequence[str] = (),
+    ) -> Sequence[Employee]:
+        await self._company_service.check_company_exists(company_pk=company_pk)
+        return await self._employee_service.get(
+            company_pk=company_pk,
+            after=after,
+            limit=limit,
+            search=search,
+            roles=roles,
+        )
 
     async def delete_from_company_by_pk(self, company_pk: int, user_pk: int) -> None:
         await self._company_service.get_company_or_404(company_pk=company_pk)
@@ -52,3 +65,14 @@ class EmployeeController:
             data=data,
             partial=partial,
         )
+
+    async def get_archived(self, company_pk: int) -> Sequence[EmployeeArchive]:
+        await self._company_service.check_company_exists(company_pk=company_pk)
+        return await self._employee_service.get_archived(company_pk=company_pk)
+
+    async def restore(self, company_pk: int, user_pk: int) -> Employee:
+        await self._company_service.get_company_or_404(company_pk=company_pk)
+        return await self._employee_service.restore(
+            company_pk=company_pk,
+            user_pk=user_pk,
+        )
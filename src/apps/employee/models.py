@@ -1,18 +1,59 @@
 from __future__ import annotations
+from datetime import datetime
 from src.core.mixins import JSONRepresentationMixin
 from src.core.sql.database import Base
 from sqlalchemy.orm import mapped_column, Mapped, relationship
-from sqlalchemy import ForeignKey, String, Boolean
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    String,
+    func,
+    text,
+)
 from src.apps.users.models import User
 
 
+# Колонки справочника сотрудников, которые читаются прямо из индекса.
+# Строка btree-индекса ограничена ~2.7 КБ: ограниченные по длине колонки занимают
+# не больше (256 + 256 + 32) * 4 байт, а свободный текст extra_data в индекс
+# не входит и читается из таблицы.
+DIRECTORY_COLUMNS = (
+    "Ссылка на телеграм",
+    "Ссылка на ВК",
+    "Номер телефона",
+    "Профиль активен",
+)
+
+
 class Employee(JSONRepresentationMixin, Base):
+    """
+    Поиск по company_id обслуживает первичный ключ (company_id, user_id),
+    справочник активных сотрудников - частичный покрывающий индекс:
+    мягко удаленные строки в него не попадают.
+    """
+
     __tablename__ = "employees"
+    __table_args__ = (
+        Index(
+            "ix_employees_company_active",
+            "company_id",
+            "user_id",
+            postgresql_include=DIRECTORY_COLUMNS,
+            postgresql_where=text('"Профиль активен"'),
+        ),
+        # Архиватор ищет давно деактивированных, активные строки в индекс не попадают
+        Index(
+            "ix_employees_deactivated_at",
+            "Дата деактивации",
+            postgresql_where=text('NOT "Профиль активен"'),
+        ),
+    )
 
     company_id: Mapped[int] = mapped_column(
         ForeignKey("companies.id"),
         primary_key=True,
-        index=True,
     )
     user_id: Mapped[int] = mapped_column(
         ForeignKey("users.id"),
@@ -47,6 +88,58 @@ class Employee(JSONRepresentationMixin, Base):
         lazy="joined",
     )
     is_active: Mapped[bool] = mapped_column("Профиль активен", Boolean, default=True)
+    deactivated_at: Mapped[datetime] = mapped_column(
+        "Дата деактивации",
+        DateTime(timezone=True),
+        nullable=True,
+    )
 
     def __repr__(self) -> str:
         return f"Employee(user={self.user_id}, company={self.company_id})"
+
+
+class EmployeeArchive(JSONRepresentationMixin, Base):
+    """
+    Сотрудники, деактивированные дольше EMPLOYEE_ARCHIVE_RETENTION.
+    Их переносит из employees src.apps.employee.archiver, вернуть можно через API.
+    """
+
+    __tablename__ = "employees_archive"
+
+    company_id: Mapped[int] = mapped_column(
+        ForeignKey("companies.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    telegram: Mapped[str] = mapped_column(
+        "Ссылка на телеграм",
+        String(length=256),
+        nullable=True,
+    )
+    vk: Mapped[str] = mapped_column("Ссылка на ВК", String(length=256), nullable=True)
+    phone_number: Mapped[str] = mapped_column(
+        "Номер телефона",
+        String(length=32),
+        nullable=True,
+    )
+    extra_data: Mapped[str] = mapped_column(
+        "Дополнительная информация о сотруднике",
+        String,
+        nullable=True,
+    )
+    deactivated_at: Mapped[datetime] = mapped_column(
+        "Дата деактивации",
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    archived_at: Mapped[datetime] = mapped_column(
+        "Дата архивации",
+        DateTime(timezone=True),
+        server_default=func.now(),
+    )
+
+    def __repr__(self) -> str:
+        return f"EmployeeArchive(user={self.user_id}, company={self.company_id})"
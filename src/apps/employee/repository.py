@@ -1,15 +1,57 @@
 from __future__ import annotations
 from typing import Sequence, TYPE_CHECKING
 
-from sqlalchemy import update, true
-from sqlalchemy.orm import selectinload
+from datetime import datetime
+
+from sqlalchemy import delete, false, func, or_, tuple_, update, true
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import contains_eager, load_only, noload, selectinload
 from src.core.interfaces import IRepository
-from src.apps.employee.models import Employee
+from src.core.outbox import DomainEvent, add_event
+from src.apps.employee.models import Employee, EmployeeArchive
+from src.apps.company.repository import refresh_company_profiles
+from src.apps.users.models import Role, User, UserRoleAssociation
 from sqlalchemy.sql import select
 
 if TYPE_CHECKING:
     from src.apps.employee.schemas import EmployeeIn, EmployeeOptional
     from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.sql import Select
+
+EMPLOYEE_OUT_COLUMNS = (
+    Employee.telegram,
+    Employee.vk,
+    Employee.phone_number,
+    Employee.extra_data,
+    Employee.is_active,
+)
+USER_OUT_COLUMNS = (
+    User.email,
+    User.joined_at,
+    User.is_active,
+    User.is_superuser,
+    User.is_verified,
+    User.first_name,
+    User.last_name,
+    User.middle_name,
+    User.last_login,
+)
+USER_SEARCH_COLUMNS = (User.first_name, User.last_name, User.middle_name, User.email)
+# Колонки, которые переносятся между employees и employees_archive
+ARCHIVE_FIELDS = (
+    "company_id",
+    "user_id",
+    "telegram",
+    "vk",
+    "phone_number",
+    "extra_data",
+    "deactivated_at",
+)
+
+
+def _deactivated_at():
+    """Дата деактивации не сдвигается, если сотрудник уже неактивен."""
+    return func.coalesce(Employee.deactivated_at, func.now())
 
 
 class EmployeeRepository(IRepository):
@@ -18,25 +60,98 @@ class EmployeeRepository(IRepository):
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
-    async def get(self, company_pk: int) -> Sequence[Employee]:
-        employees = await self._session.execute(
+    def directory_query(
+        self,
+        company_pk: int,
+        after: int | None = None,
+        limit: int | None = None,
+        search: str | None = None,
+        roles: Sequence[str] = (),
+    ) -> Select:
+        """
+        Запрос страницы справочника. Строки employees ищутся по частичному индексу
+        ix_employees_company_active, extra_data дочитывается из таблицы, см. src.benchmarks.plans.
+        """
+        query = (
             select(self.model)
+            .join(self.model.user)
             .where(self.model.company_id == company_pk, self.model.is_active == true())
-            .options(selectinload(self.model.user)),
+            .options(
+                load_only(*EMPLOYEE_OUT_COLUMNS),
+                noload(self.model.company),
+                contains_eager(self.model.user).options(
+                    load_only(*USER_OUT_COLUMNS),
+                    noload(User.employee),
+                    selectinload(User.roles_associations)
+                    .joinedload(UserRoleAssociation.role)
+                    .options(load_only(Role.id, Role.name), noload(Role.users)),
+                ),
+            )
+            .order_by(self.model.user_id)
         )
+        if after is not None:
+            query = query.where(self.model.user_id > after)
+        for term in (search or "").split():
+            # Каждое слово должно встретиться в ФИО или email
+            query = query.where(
+                or_(
+                    *(
+                        column.icontains(term, autoescape=True)
+                        for column in USER_SEARCH_COLUMNS
+                    ),
+                ),
+            )
+        if roles:
+            query = query.where(
+                User.roles_associations.any(
+                    UserRoleAssociation.role.has(Role.name.in_(roles)),
+                ),
+            )
+        if limit is not None:
+            query = query.limit(limit)
+        return query
+
+    async def get(
+        self,
+        company_pk: int,
+        after: int | None = None,
+        limit: int | None = None,
+        search: str | None = None,
+        roles: Sequence[str] = (),
+    ) -> Sequence[Employee]:
+        """
+        Страница активных сотрудников по возрастанию user_id (keyset по первичному ключу).
+        Загружаются только колонки, которые выводит EmployeeOut: обратные связи
+        пользователя, компании и ролей, которые иначе грузятся жадно, отключены.
+        """
+        query = self.directory_query(company_pk, after, limit, search, roles)
+        employees = await self._session.execute(query)
         return employees.unique().scalars().all()
 
     async def delete(self):
-        await self._session.execute(update(self.model).values(is_active=False))
-        await self._session.commit()
+        await self._session.execute(
+            update(self.model).values(
+                is_active=False,
+                deactivated_at=_deactivated_at(),
+            ),
+        )
+        add_event(self._session, DomainEvent.EMPLOYEE_DEACTIVATED)
+        await refresh_company_profiles(self._session)
 
     async def delete_from_company_by_pk(self, user_pk: int, company_pk: int):
         await self._session.execute(
             update(self.model)
             .where(self.model.company_id == company_pk, self.model.user_id == user_pk)
-            .values(is_active=False),
+            .values(is_active=False, deactivated_at=_deactivated_at()),
+        )
+        add_event(
+            self._session,
+            DomainEvent.EMPLOYEE_DEACTIVATED,
+            f"{company_pk}:{user_pk}",
+            company_id=company_pk,
+            user_id=user_pk,
         )
-        await self._session.commit()
+        await refresh_company_profiles(self._session, [company_pk])
 
     async def check_user_already_in_company(
         self,
@@ -58,19 +173,126 @@ class EmployeeRepository(IRepository):
         data: EmployeeIn | EmployeeOptional,
         partial: bool = False,
     ) -> Employee:
+        values = data.model_dump(exclude_none=partial)
+        if "is_active" in values:
+            values["deactivated_at"] = (
+                None if values["is_active"] else _deactivated_at()
+            )
         updated_employee = await self._session.execute(
             update(self.model)
             .returning(self.model)
             .where(self.model.user_id == user_pk, self.model.company_id == company_pk)
-            .values(**data.model_dump(exclude_none=partial))
+            .values(**values)
             .options(selectinload(Employee.user)),
         )
-        await self._session.commit()
+        add_event(
+            self._session,
+            DomainEvent.EMPLOYEE_UPDATED,
+            f"{company_pk}:{user_pk}",
+            company_id=company_pk,
+            user_id=user_pk,
+        )
+        await refresh_company_profiles(self._session, [company_pk])
         return updated_employee.unique().scalar_one_or_none()
 
     async def create(self, in_model: EmployeeIn) -> Employee:
         new_employee = self.model(**in_model.model_dump())  # type: ignore[call-arg]
+        if not new_employee.is_active:
+            new_employee.deactivated_at = func.now()
         self._session.add(new_employee)
-        await self._session.commit()
+        add_event(
+            self._session,
+            DomainEvent.EMPLOYEE_CREATED,
+            f"{in_model.company_id}:{in_model.user_id}",
+            company_id=in_model.company_id,
+            user_id=in_model.user_id,
+        )
+        await self._session.flush()
+        await refresh_company_profiles(self._session, [in_model.company_id])
         await self._session.refresh(new_employee)
         return new_employee
+
+    async def archive_inactive(self, before: datetime, limit: int) -> int:
+        """
+        Перенести в employees_archive пачку сотрудников, деактивированных до before.
+        Удаление и вставка - один запрос; строки, занятые другой транзакцией, пропускаются.
+        """
+        expired = (
+            select(self.model.company_id, self.model.user_id)
+            .where(
+                self.model.is_active == false(),
+                self.model.deactivated_at < before,
+            )
+            .order_by(self.model.deactivated_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        moved = (
+            delete(self.model)
+            .where(tuple_(self.model.company_id, self.model.user_id).in_(expired))
+            .returning(*(getattr(self.model, field) for field in ARCHIVE_FIELDS))
+            .cte("moved")
+        )
+        # Пользователя могли вернуть в компанию и снова удалить - храним последнюю запись
+        columns = [getattr(EmployeeArchive, field) for field in ARCHIVE_FIELDS]
+        statement = insert(EmployeeArchive).from_select(columns, select(moved))
+        archived = await self._session.execute(
+            statement.on_conflict_do_update(
+                index_elements=columns[:2],
+                set_={
+                    **{
+                        column.name: statement.excluded[column.name]
+                        for column in columns[2:]
+                    },
+                    EmployeeArchive.archived_at.name: func.now(),
+                },
+            ).returning(EmployeeArchive.user_id),
+        )
+        return len(archived.all())
+
+    async def get_archived(self, company_pk: int) -> Sequence[EmployeeArchive]:
+        archived = await self._session.execute(
+            select(EmployeeArchive)
+            .where(EmployeeArchive.company_id == company_pk)
+            .order_by(EmployeeArchive.user_id),
+        )
+        return archived.scalars().all()
+
+    async def restore(self, company_pk: int, user_pk: int) -> Employee | None:
+        """Вернуть сотрудника из архива активным; None, если в архиве его нет."""
+        moved = (
+            delete(EmployeeArchive)
+            .where(
+                EmployeeArchive.company_id == company_pk,
+                EmployeeArchive.user_id == user_pk,
+            )
+            .returning(
+                *(getattr(EmployeeArchive, field) for field in ARCHIVE_FIELDS[:-1]),
+            )
+            .cte("moved")
+        )
+        restored = await self._session.execute(
+            insert(self.model)
+            .from_select(
+                [
+                    *(getattr(self.model, field) for field in ARCHIVE_FIELDS[:-1]),
+                    self.model.is_active,
+                ],
+                select(moved, true()),
+            )
+            .returning(self.model.user_id),
+        )
+        if restored.scalar_one_or_none() is None:
+            return None
+        add_event(
+            self._session,
+            DomainEvent.EMPLOYEE_RESTORED,
+            f"{company_pk}:{user_pk}",
+            company_id=company_pk,
+            user_id=user_pk,
+        )
+        await refresh_company_profiles(self._session, [company_pk])
+        return await self.check_user_already_in_company(
+            company_pk=company_pk,
+            user_pk=user_pk,
+        )
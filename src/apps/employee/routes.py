@@ -1,8 +1,12 @@
 from __future__ import annotations
 from typing import Sequence, TYPE_CHECKING
-from fastapi import APIRouter, status, Depends
+from fastapi import APIRouter, Query, status, Depends
+from src.apps.roles.enums import CompanyRoles
 from src.apps.employee.depends import get_employee_controller
+from src.core.cache import cache, invalidate
+from src.core.idempotency import IdempotentRoute, idempotent
 from src.apps.employee.schemas import (
+    EmployeeArchiveOut,
     EmployeeIn,
     EmployeeOut,
     EmployeeOptional,
@@ -18,13 +22,13 @@ from src.core.http_response_schemas import (
     Unauthorized,
     UniqueConstraint,
 )
-from src.apps.users.models import User
+from src.core.auth.tokens import Principal
 
 if TYPE_CHECKING:
     from src.apps.employee.controller import EmployeeController
 
 
-employee_router = APIRouter()
+employee_router = APIRouter(route_class=IdempotentRoute)
 
 
 @employee_router.post(
@@ -39,10 +43,12 @@ employee_router = APIRouter()
     status_code=status.HTTP_201_CREATED,
     response_model=EmployeeIn,
 )
+@invalidate("employees:{employee.company_id}")
+@idempotent
 async def add_employee(
     employee: EmployeeIn,
     controller: EmployeeController = Depends(get_employee_controller),
-    _: User = Depends(get_company_admin_post_query),
+    _: Principal = Depends(get_company_admin_post_query),
 ) -> EmployeeOut:
     return await controller.create(in_model=employee)
 
@@ -57,13 +63,34 @@ async def add_employee(
     },
     status_code=status.HTTP_200_OK,
     response_model=Sequence[EmployeeOut],
+    description="Активные сотрудники компании по возрастанию user.id. "
+    "Следующая страница - after=user.id последнего сотрудника текущей",
+)
+@cache(
+    expire=60 * 60,
+    model=Sequence[EmployeeOut],
+    namespace=("employees", "employees:{company_pk}"),
 )
 async def get_employees(
     company_pk: int,
+    after: int
+    | None = Query(
+        None,
+        description="user.id последнего сотрудника предыдущей страницы",
+    ),
+    limit: int = Query(50, ge=1, le=200),
+    search: str | None = Query(None, max_length=128, description="ФИО или email"),
+    role: list[CompanyRoles] = Query([]),
     controller: EmployeeController = Depends(get_employee_controller),
-    _: User = Depends(get_company_admin),
+    _: Principal = Depends(get_company_admin),
 ) -> Sequence[EmployeeOut]:
-    return await controller.get(company_pk=company_pk)
+    return await controller.get(
+        company_pk=company_pk,
+        after=after,
+        limit=limit,
+        search=search,
+        roles=[item.value for item in role],
+    )
 
 
 @employee_router.delete(
@@ -75,11 +102,12 @@ async def get_employees(
         status.HTTP_404_NOT_FOUND: {"model": NotFound},
     },
 )
+@invalidate("employees:{company_pk}")
 async def delete_employee(
     user_pk: int,
     company_pk: int,
     controller: EmployeeController = Depends(get_employee_controller),
-    _: User = Depends(get_company_admin),
+    _: Principal = Depends(get_company_admin),
 ):
     await controller.delete_from_company_by_pk(company_pk=company_pk, user_pk=user_pk)
 
@@ -96,12 +124,13 @@ async def delete_employee(
     },
     response_model=EmployeeOut,
 )
+@invalidate("employees:{company_pk}")
 async def update_employee_partially(
     user_pk: int,
     company_pk: int,
     employee: EmployeeOptional,
     controller: EmployeeController = Depends(get_employee_controller),
-    _: User = Depends(get_current_employee),
+    _: Principal = Depends(get_current_employee),
 ) -> EmployeeOut:
     return await controller.update(
         user_pk=user_pk,
@@ -109,3 +138,46 @@ async def update_employee_partially(
         data=employee,
         partial=True,
     )
+
+
+@employee_router.get(
+    "/{company_pk}/archive",
+    responses={
+        status.HTTP_200_OK: {"model": Sequence[EmployeeArchiveOut]},
+        status.HTTP_401_UNAUTHORIZED: {"model": Unauthorized},
+        status.HTTP_403_FORBIDDEN: {"model": NotAllowed},
+        status.HTTP_404_NOT_FOUND: {"model": NotFound},
+    },
+    status_code=status.HTTP_200_OK,
+    response_model=Sequence[EmployeeArchiveOut],
+    description="Сотрудники, перенесенные в архив после долгой деактивации.",
+)
+async def get_archived_employees(
+    company_pk: int,
+    controller: EmployeeController = Depends(get_employee_controller),
+    _: Principal = Depends(get_company_admin),
+) -> Sequence[EmployeeArchiveOut]:
+    return await controller.get_archived(company_pk=company_pk)
+
+
+@employee_router.post(
+    "/{company_pk}/archive/{user_pk}/restore",
+    description="Вернуть сотрудника из архива в компанию активным.",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": EmployeeOut},
+        status.HTTP_400_BAD_REQUEST: {"model": UniqueConstraint},
+        status.HTTP_401_UNAUTHORIZED: {"model": Unauthorized},
+        status.HTTP_403_FORBIDDEN: {"model": NotAllowed},
+        status.HTTP_404_NOT_FOUND: {"model": NotFound},
+    },
+    response_model=EmployeeOut,
+)
+@invalidate("company", "employees:{company_pk}")
+async def restore_employee(
+    user_pk: int,
+    company_pk: int,
+    controller: EmployeeController = Depends(get_employee_controller),
+    _: Principal = Depends(get_company_admin),
+) -> EmployeeOut:
+    return await controller.restore(company_pk=company_pk, user_pk=user_pk)
@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from pydantic import BaseModel, Field
 from src.core.utils import optional
 from src.apps.users.schemas import UserOut
@@ -23,6 +25,20 @@ class EmployeeOut(BaseEmployee):
     user: UserOut = Field(...)
 
 
+class EmployeeArchiveOut(BaseModel):
+    company_id: int
+    user_id: int
+    telegram: str | None = Field(None, title="Ник в телеграм")
+    vk: str | None = Field(None, title="Ссылка на ВК")
+    phone_number: str | None = Field(None, title="Контактный номер телефона")
+    extra_data: str | None = Field(None, title="Дополнительная информация о сотруднике")
+    deactivated_at: datetime | None = Field(None, title="Дата деактивации")
+    archived_at: datetime = Field(..., title="Дата архивации")
+
+    class ConfigDict:
+        from_attributes = True
+
+
 @optional
 class EmployeeOptional(BaseEmployee):
     ...
@@ -1,22 +1,35 @@
 from __future__ import annotations
 
 from fastapi import status
-from src.core.exceptions import UniqueConstraintError, IsOwnerError
+from src.core.exceptions import NotFoundError, UniqueConstraintError, IsOwnerError
 from src.core.interfaces import IService
 from typing import TYPE_CHECKING, Sequence
 
 if TYPE_CHECKING:
     from src.apps.employee.schemas import EmployeeIn, EmployeeOptional
     from src.apps.employee.repository import EmployeeRepository
-    from src.apps.employee.models import Employee
+    from src.apps.employee.models import Employee, EmployeeArchive
 
 
 class EmployeeService(IService):
     def __init__(self, repo: EmployeeRepository):
         self._repo = repo
 
-    async def get(self, company_pk: int) -> Sequence[Employee]:
-        return await self._repo.get(company_pk=company_pk)
+    async def get(
+        self,
+        company_pk: int,
+        after: int | None = None,
+        limit: int | None = None,
+        search: str | None = None,
+        roles: Sequence[str] = (),
+    ) -> Sequence[Employee]:
+        return await self._repo.get(
+            company_pk=company_pk,
+            after=after,
+            limit=limit,
+            search=search,
+            roles=roles,
+        )
 
     async def create(self, in_model: EmployeeIn) -> Employee:
         await self._check_user_already_in_company(
@@ -50,6 +63,24 @@ class EmployeeService(IService):
             company_pk=company_pk,
         )
 
+    async def get_archived(self, company_pk: int) -> Sequence[EmployeeArchive]:
+        return await self._repo.get_archived(company_pk=company_pk)
+
+    async def restore(self, company_pk: int, user_pk: int) -> Employee:
+        await self._check_user_already_in_company(
+            company_pk=company_pk,
+            user_pk=user_pk,
+        )
+        if employee := await self._repo.restore(
+            company_pk=company_pk,
+            user_pk=user_pk,
+        ):
+            return employee
+        raise NotFoundError(
+            detail="Сотрудник %s не найден в архиве компании" % user_pk,
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
+
     async def _check_user_already_in_company(
         self,
         company_pk: int,
@@ -0,0 +1,39 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Sequence
+
+if TYPE_CHECKING:
+    from src.apps.orders.models import Order
+    from src.apps.orders.schemas import OrderIn
+    from src.apps.orders.service import OrderService
+
+
+class OrderController:
+    def __init__(self, order_service: OrderService) -> None:
+        self._order_service = order_service
+
+    async def get(self, user_pk: int) -> Sequence[Order]:
+        return await self._order_service.get(user_pk=user_pk)
+
+    async def get_order_or_404(self, order_pk: int, user_pk: int) -> Order:
+        return await self._order_service.get_order_or_404(
+            order_pk=order_pk,
+            user_pk=user_pk,
+        )
+
+    async def place(
+        self,
+        user_pk: int,
+        in_model: OrderIn,
+        idempotency_key: str | None,
+    ) -> tuple[Order, bool]:
+        return await self._order_service.place(
+            user_pk=user_pk,
+            in_model=in_model,
+            idempotency_key=idempotency_key,
+        )
+
+    async def confirm(self, order_pk: int, user_pk: int) -> Order:
+        return await self._order_service.confirm(order_pk=order_pk, user_pk=user_pk)
+
+    async def cancel(self, order_pk: int, user_pk: int) -> Order:
+        return await self._order_service.cancel(order_pk=order_pk, user_pk=user_pk)
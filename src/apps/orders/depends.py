@@ -0,0 +1,30 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from fastapi import Depends
+
+from src.apps.catalog.repository import ProductRepository
+from src.apps.orders.controller import OrderController
+from src.apps.orders.repository import OrderRepository
+from src.apps.orders.service import OrderService
+from src.core.sql.database import get_session
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def get_order_service(
+    session: AsyncSession = Depends(get_session),
+) -> OrderService:
+    yield OrderService(
+        repo=OrderRepository(session=session),
+        product_repo=ProductRepository(session=session),
+    )
+
+
+async def get_order_controller(
+    order_service: OrderService = Depends(get_order_service),
+) -> OrderController:
+    yield OrderController(order_service=order_service)
+
+
+__all__ = ["get_order_controller", "get_order_service"]
@@ -0,0 +1,15 @@
+from enum import IntEnum
+
+
+class OrderStatus(IntEnum):
+    """
+    1. Товар зарезервирован, ожидается оплата
+    2. Оплачен
+    3. Отменен покупателем
+    4. Резерв истек
+    """
+
+    RESERVED = 1
+    CONFIRMED = 2
+    CANCELLED = 3
+    EXPIRED = 4
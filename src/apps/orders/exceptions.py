@@ -0,0 +1,5 @@
+from fastapi.exceptions import HTTPException
+
+
+class OrderConflictError(HTTPException):
+    """Заказ нельзя оформить или изменить в текущем состоянии."""
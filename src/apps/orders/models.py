@@ -0,0 +1,103 @@
+from __future__ import annotations
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import (
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    SmallInteger,
+    String,
+    UniqueConstraint,
+    func,
+    text,
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from src.apps.orders.enums import OrderStatus
+from src.core.mixins import JSONRepresentationMixin
+from src.core.sql.database import Base
+
+
+class Order(JSONRepresentationMixin, Base):
+    """
+    Заказ резервирует товар сразу: остатки списываются при оформлении
+    и возвращаются, если заказ отменен или не оплачен до expires_at.
+    """
+
+    __tablename__ = "orders"
+    __table_args__ = (
+        UniqueConstraint("user_id", "idempotency_key"),
+        Index("ix_orders_user", "user_id", "id"),
+        # Сборщик просроченных резервов читает только живые резервы
+        Index(
+            "ix_orders_reserved_expires_at",
+            "expires_at",
+            postgresql_where=text(f"status = {OrderStatus.RESERVED.value}"),
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    status: Mapped[int] = mapped_column(
+        SmallInteger,
+        nullable=False,
+        default=OrderStatus.RESERVED,
+    )
+    total: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False, default=0)
+    idempotency_key: Mapped[str] = mapped_column(String(length=128), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        onupdate=func.now(),
+    )
+    items: Mapped[list[OrderItem]] = relationship(
+        "OrderItem",
+        lazy="selectin",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by="OrderItem.id",
+    )
+
+    def __repr__(self) -> str:
+        return f"Order({self.id})"
+
+
+class OrderItem(JSONRepresentationMixin, Base):
+    """Позиция заказа хранит снимок товара и цены на момент оформления."""
+
+    __tablename__ = "order_items"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    order_id: Mapped[int] = mapped_column(
+        ForeignKey("orders.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    variant_id: Mapped[int] = mapped_column(
+        ForeignKey("product_variants.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+    product_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    name: Mapped[str] = mapped_column(String(length=256), nullable=False)
+    sku: Mapped[str] = mapped_column(String(length=64), nullable=False)
+    size: Mapped[str] = mapped_column(String(length=16), nullable=False)
+    color: Mapped[str] = mapped_column(String(length=32), nullable=False)
+    price: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
+    quantity: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"{self.sku} x {self.quantity}"
@@ -0,0 +1,131 @@
+from __future__ import annotations
+from datetime import datetime
+from decimal import Decimal
+from typing import TYPE_CHECKING, Sequence
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.sql import select
+
+from src.apps.orders.enums import OrderStatus
+from src.apps.orders.models import Order, OrderItem
+from src.core.outbox import DomainEvent, add_event
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class OrderRepository:
+    model: Order = Order
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get(self, user_pk: int) -> Sequence[Order]:
+        orders = await self._session.execute(
+            select(self.model)
+            .where(self.model.user_id == user_pk)
+            .order_by(self.model.id.desc()),
+        )
+        return orders.scalars().all()
+
+    async def get_by_pk(self, order_pk: int, user_pk: int) -> Order | None:
+        order = await self._session.execute(
+            select(self.model).where(
+                self.model.id == order_pk,
+                self.model.user_id == user_pk,
+            ),
+        )
+        return order.scalar_one_or_none()
+
+    async def get_by_key(self, user_pk: int, idempotency_key: str) -> Order | None:
+        order = await self._session.execute(
+            select(self.model).where(
+                self.model.user_id == user_pk,
+                self.model.idempotency_key == idempotency_key,
+            ),
+        )
+        return order.scalar_one_or_none()
+
+    async def create(
+        self,
+        user_pk: int,
+        expires_at: datetime,
+        idempotency_key: str | None = None,
+    ) -> int | None:
+        """
+        Создать пустой заказ. Вернуть None, если заказ с этим ключом идемпотентности
+        уже есть: повтор того же запроса ждет на уникальном индексе, пока первый
+        не завершится, и затем получает конфликт, а не второй резерв.
+        """
+        order = await self._session.execute(
+            insert(self.model)
+            .values(
+                user_id=user_pk,
+                status=OrderStatus.RESERVED,
+                total=0,
+                idempotency_key=idempotency_key,
+                expires_at=expires_at,
+            )
+            .on_conflict_do_nothing(index_elements=["user_id", "idempotency_key"])
+            .returning(self.model.id),
+        )
+        return order.scalar_one_or_none()
+
+    async def add_items(
+        self,
+        order_pk: int,
+        items: Sequence[dict],
+        total: Decimal,
+    ) -> Order:
+        self._session.add_all(OrderItem(order_id=order_pk, **item) for item in items)
+        await self._session.flush()
+        order = await self._session.get(self.model, order_pk)
+        order.total = total
+        await self._session.flush()
+        add_event(
+            self._session,
+            DomainEvent.ORDER_PLACED,
+            order_pk,
+            user_id=order.user_id,
+            total=str(total),
+        )
+        return order
+
+    async def lock(self, order_pk: int, user_pk: int) -> Order | None:
+        """Заблокировать заказ до конца транзакции (подтверждение, отмена)."""
+        order = await self._session.execute(
+            select(self.model)
+            .where(self.model.id == order_pk, self.model.user_id == user_pk)
+            .with_for_update(of=self.model)
+            .execution_options(populate_existing=True),
+        )
+        return order.scalar_one_or_none()
+
+    async def lock_expired(self, limit: int) -> Sequence[Order]:
+        """
+        Просроченные резервы. SKIP LOCKED: несколько воркеров разбирают разные заказы
+        и не ждут заказов, которые прямо сейчас подтверждаются или отменяются.
+        """
+        orders = await self._session.execute(
+            select(self.model)
+            .where(
+                self.model.status == OrderStatus.RESERVED,
+                self.model.expires_at <= func.now(),
+            )
+            .order_by(self.model.expires_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True, of=self.model),
+        )
+        return orders.scalars().all()
+
+    async def set_status(self, order: Order, status: OrderStatus) -> Order:
+        order.status = status
+        await self._session.flush()
+        event = {
+            OrderStatus.CONFIRMED: DomainEvent.ORDER_CONFIRMED,
+            OrderStatus.CANCELLED: DomainEvent.ORDER_CANCELLED,
+            OrderStatus.EXPIRED: DomainEvent.ORDER_EXPIRED,
+        }[status]
+        add_event(self._session, event, order.id, user_id=order.user_id)
+        return order
@@ -0,0 +1,124 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Sequence
+
+from fastapi import APIRouter, Depends, Header, Response, status
+
+from src.apps.orders.depends import get_order_controller
+from src.apps.orders.schemas import OrderIn, OrderOut
+from src.apps.users.models import User
+from src.core.auth.strategy import get_current_user
+from src.core.http_response_schemas import Conflict, NotFound, Unauthorized
+from src.core.idempotency import IdempotentRoute, idempotent
+
+if TYPE_CHECKING:
+    from src.apps.orders.controller import OrderController
+
+orders_router = APIRouter(route_class=IdempotentRoute)
+
+
+@orders_router.post(
+    "",
+    response_model=OrderOut,
+    description="Оформить заказ и зарезервировать товар. Повтор запроса с тем же "
+    "Idempotency-Key возвращает сохраненный ответ, а после его истечения - "
+    "уже созданный заказ (200) вместо нового",
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        status.HTTP_200_OK: {"model": OrderOut},
+        status.HTTP_201_CREATED: {"model": OrderOut},
+        status.HTTP_401_UNAUTHORIZED: {"model": Unauthorized},
+        status.HTTP_409_CONFLICT: {"model": Conflict},
+    },
+)
+@idempotent
+async def place_order(
+    order: OrderIn,
+    response: Response,
+    idempotency_key: str | None = Header(None, alias="Idempotency-Key", max_length=128),
+    controller: OrderController = Depends(get_order_controller),
+    user: User = Depends(get_current_user),
+) -> OrderOut:
+    placed, created = await controller.place(
+        user_pk=user.id,
+        in_model=order,
+        idempotency_key=idempotency_key,
+    )
+    if not created:
+        response.status_code = status.HTTP_200_OK
+    return placed
+
+
+@orders_router.get(
+    "",
+    response_model=Sequence[OrderOut],
+    description="Заказы текущего пользователя",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": Sequence[OrderOut]},
+        status.HTTP_401_UNAUTHORIZED: {"model": Unauthorized},
+    },
+)
+async def orders_list(
+    controller: OrderController = Depends(get_order_controller),
+    user: User = Depends(get_current_user),
+) -> Sequence[OrderOut]:
+    return await controller.get(user_pk=user.id)
+
+
+@orders_router.get(
+    "/{order_pk}",
+    response_model=OrderOut,
+    description="Заказ текущего пользователя",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": OrderOut},
+        status.HTTP_401_UNAUTHORIZED: {"model": Unauthorized},
+        status.HTTP_404_NOT_FOUND: {"model": NotFound},
+    },
+)
+async def order_detail(
+    order_pk: int,
+    controller: OrderController = Depends(get_order_controller),
+    user: User = Depends(get_current_user),
+) -> OrderOut:
+    return await controller.get_order_or_404(order_pk=order_pk, user_pk=user.id)
+
+
+@orders_router.post(
+    "/{order_pk}/confirm",
+    response_model=OrderOut,
+    description="Подтвердить оплату заказа, пока действует резерв",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": OrderOut},
+        status.HTTP_401_UNAUTHORIZED: {"model": Unauthorized},
+        status.HTTP_404_NOT_FOUND: {"model": NotFound},
+        status.HTTP_409_CONFLICT: {"model": Conflict},
+    },
+)
+async def confirm_order(
+    order_pk: int,
+    controller: OrderController = Depends(get_order_controller),
+    user: User = Depends(get_current_user),
+) -> OrderOut:
+    return await controller.confirm(order_pk=order_pk, user_pk=user.id)
+
+
+@orders_router.post(
+    "/{order_pk}/cancel",
+    response_model=OrderOut,
+    description="Отменить заказ и вернуть товар на склад",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": OrderOut},
+        status.HTTP_401_UNAUTHORIZED: {"model": Unauthorized},
+        status.HTTP_404_NOT_FOUND: {"model": NotFound},
+        status.HTTP_409_CONFLICT: {"model": Conflict},
+    },
+)
+async def cancel_order(
+    order_pk: int,
+    controller: OrderController = Depends(get_order_controller),
+    user: User = Depends(get_current_user),
+) -> OrderOut:
+    return await controller.cancel(order_pk=order_pk, user_pk=user.id)
@@ -0,0 +1,59 @@
+from __future__ import annotations
+from datetime import datetime
+from decimal import Decimal
+
+from pydantic import BaseModel, Field
+
+from src.apps.orders.enums import OrderStatus
+from src.core.config import get_settings
+
+settings = get_settings()
+
+
+class OrderItemIn(BaseModel):
+    variant_id: int = Field(..., title="Вариант товара")
+    quantity: int = Field(
+        1,
+        ge=1,
+        le=settings.cart.CART_MAX_QUANTITY,
+        title="Количество",
+    )
+
+
+class OrderIn(BaseModel):
+    items: list[OrderItemIn] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.cart.CART_MAX_ITEMS,
+        title="Позиции",
+    )
+
+
+class OrderItemOut(BaseModel):
+    variant_id: int | None
+    product_id: int
+    name: str = Field(..., title="Название")
+    sku: str = Field(..., title="Артикул")
+    size: str = Field(..., title="Размер")
+    color: str = Field(..., title="Цвет")
+    price: Decimal = Field(..., title="Цена")
+    quantity: int = Field(..., title="Количество")
+
+    class ConfigDict:
+        from_attributes = True
+
+
+class OrderOut(BaseModel):
+    id: int
+    status: OrderStatus = Field(
+        ...,
+        title="Статус",
+        description="1 - Зарезервирован, 2 - Оплачен, 3 - Отменен, 4 - Резерв истек",
+    )
+    total: Decimal = Field(..., title="Сумма")
+    created_at: datetime = Field(..., title="Дата оформления")
+    expires_at: datetime = Field(..., title="Резерв действует до")
+    items: list[OrderItemOut] = Field(..., title="Позиции")
+
+    class ConfigDict:
+        from_attributes = True
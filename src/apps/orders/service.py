@@ -0,0 +1,165 @@
+from __future__ import annotations
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import TYPE_CHECKING, Sequence
+
+from fastapi import status
+
+from src.apps.orders.enums import OrderStatus
+from src.apps.orders.exceptions import OrderConflictError
+from src.core.cache import invalidate_after_commit
+from src.core.config import get_settings
+from src.core.exceptions import NotFoundError
+
+if TYPE_CHECKING:
+    from src.apps.catalog.repository import ProductRepository
+    from src.apps.orders.models import Order
+    from src.apps.orders.repository import OrderRepository
+    from src.apps.orders.schemas import OrderIn
+
+settings = get_settings()
+
+
+class OrderService:
+    def __init__(
+        self,
+        repo: OrderRepository,
+        product_repo: ProductRepository,
+    ) -> None:
+        self._repo = repo
+        self._product_repo = product_repo
+
+    async def get(self, user_pk: int) -> Sequence[Order]:
+        return await self._repo.get(user_pk=user_pk)
+
+    async def get_order_or_404(self, order_pk: int, user_pk: int) -> Order:
+        if order := await self._repo.get_by_pk(order_pk=order_pk, user_pk=user_pk):
+            return order
+        raise self._not_found(order_pk)
+
+    async def place(
+        self,
+        user_pk: int,
+        in_model: OrderIn,
+        idempotency_key: str | None = None,
+    ) -> tuple[Order, bool]:
+        """
+        Оформить заказ и зарезервировать товар. Вернуть заказ и признак,
+        что он создан этим запросом (а не найден по ключу идемпотентности).
+        Остатки списываются последним шагом, чтобы строки stock были
+        заблокированы как можно меньше времени.
+        """
+        order_pk = await self._repo.create(
+            user_pk=user_pk,
+            expires_at=datetime.now(timezone.utc)
+            + timedelta(seconds=settings.orders.ORDER_RESERVATION_TTL),
+            idempotency_key=idempotency_key,
+        )
+        if order_pk is None:
+            return await self._repo.get_by_key(user_pk, idempotency_key), False
+
+        lines = Counter()
+        for item in in_model.items:
+            lines[item.variant_id] += item.quantity
+        offers = {
+            offer.variant_id: offer
+            for offer in await self._product_repo.get_offers(variant_pks=list(lines))
+            if offer.is_published
+        }
+        if missing := [pk for pk in lines if pk not in offers]:
+            raise OrderConflictError(
+                detail="Товары недоступны для заказа: %s"
+                % ", ".join(map(str, missing)),
+                status_code=status.HTTP_409_CONFLICT,
+            )
+        items = [
+            {
+                "variant_id": variant_pk,
+                "product_id": offers[variant_pk].product_id,
+                "name": offers[variant_pk].name,
+                "sku": offers[variant_pk].sku,
+                "size": offers[variant_pk].size,
+                "color": offers[variant_pk].color,
+                "price": offers[variant_pk].price,
+                "quantity": quantity,
+            }
+            for variant_pk, quantity in sorted(lines.items())
+        ]
+        order = await self._repo.add_items(
+            order_pk=order_pk,
+            items=items,
+            total=sum((item["price"] * item["quantity"] for item in items), Decimal(0)),
+        )
+        short, sold_out = await self._product_repo.take_stock(lines)
+        if short is not None:
+            raise OrderConflictError(
+                detail="Недостаточно товара %s на складе" % offers[short].sku,
+                status_code=status.HTTP_409_CONFLICT,
+            )
+        await self._sync_listings({item["product_id"] for item in items}, sold_out)
+        return order, True
+
+    async def confirm(self, order_pk: int, user_pk: int) -> Order:
+        order = await self._lock_or_404(order_pk=order_pk, user_pk=user_pk)
+        if order.status == OrderStatus.CONFIRMED:
+            return order
+        if order.status != OrderStatus.RESERVED or order.expires_at <= datetime.now(
+            timezone.utc,
+        ):
+            raise OrderConflictError(
+                detail="Резерв по заказу %s отменен или истек" % order_pk,
+                status_code=status.HTTP_409_CONFLICT,
+            )
+        return await self._repo.set_status(order, OrderStatus.CONFIRMED)
+
+    async def cancel(self, order_pk: int, user_pk: int) -> Order:
+        order = await self._lock_or_404(order_pk=order_pk, user_pk=user_pk)
+        if order.status in (OrderStatus.CANCELLED, OrderStatus.EXPIRED):
+            return order
+        if order.status == OrderStatus.CONFIRMED:
+            raise OrderConflictError(
+                detail="Оплаченный заказ %s нельзя отменить" % order_pk,
+                status_code=status.HTTP_409_CONFLICT,
+            )
+        await self.release([order], OrderStatus.CANCELLED)
+        return order
+
+    async def release(self, orders: Sequence[Order], new_status: OrderStatus) -> None:
+        """Вернуть на склад товар заблокированных заказов и закрыть резервы."""
+        lines = Counter()
+        for order in orders:
+            for item in order.items:
+                if item.variant_id is not None:
+                    lines[item.variant_id] += item.quantity
+        restocked = await self._product_repo.return_stock(lines)
+        for order in orders:
+            await self._repo.set_status(order, new_status)
+        await self._sync_listings(
+            {item.product_id for order in orders for item in order.items},
+            restocked,
+        )
+
+    async def _sync_listings(self, product_pks: set[int], crossed_zero: bool) -> None:
+        # Списки каталога и индекс фасетов (наличие по вариантам) сбрасываются,
+        # только когда вариант закончился или появился. Карточка товара показывает
+        # точные остатки, поэтому ее кэш сбрасывается на каждое списание.
+        in_stock_changed = await self._product_repo.sync_in_stock(sorted(product_pks))
+        if crossed_zero or in_stock_changed:
+            await invalidate_after_commit("catalog")
+        else:
+            await invalidate_after_commit(
+                *(f"catalog:{product_pk}" for product_pk in sorted(product_pks)),
+            )
+
+    async def _lock_or_404(self, order_pk: int, user_pk: int) -> Order:
+        if order := await self._repo.lock(order_pk=order_pk, user_pk=user_pk):
+            return order
+        raise self._not_found(order_pk)
+
+    @staticmethod
+    def _not_found(order_pk: int) -> NotFoundError:
+        return NotFoundError(
+            detail="Заказ с идентификатором %s не был найден" % order_pk,
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
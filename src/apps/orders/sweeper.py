@@ -0,0 +1,67 @@
+from __future__ import annotations
+import asyncio
+import logging
+
+from src.apps.catalog.repository import ProductRepository
+from src.apps.orders.enums import OrderStatus
+from src.apps.orders.repository import OrderRepository
+from src.apps.orders.service import OrderService
+from src.core.config import get_settings
+from src.core.sql.database import async_session
+from src.core.sql.uow import unit_of_work
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+class ReservationSweeper:
+    """Возвращает на склад товар из неоплаченных заказов, у которых истек резерв."""
+
+    def __init__(self) -> None:
+        self._stopping: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+
+    async def release_expired(self) -> int:
+        """Закрыть очередную пачку просроченных резервов, вернуть их количество."""
+        async with async_session() as session, unit_of_work():
+            repo = OrderRepository(session=session)
+            orders = await repo.lock_expired(limit=settings.orders.ORDER_SWEEP_BATCH)
+            if orders:
+                service = OrderService(
+                    repo=repo,
+                    product_repo=ProductRepository(session=session),
+                )
+                await service.release(orders, OrderStatus.EXPIRED)
+            return len(orders)
+
+    async def start(self) -> None:
+        self._stopping = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stopping.set()
+        await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                released = await self.release_expired()
+            except Exception:
+                logger.exception("Не удалось освободить просроченные резервы")
+                released = 0
+            if released:
+                logger.info("Освобождено просроченных резервов: %d", released)
+            if released < settings.orders.ORDER_SWEEP_BATCH:
+                try:
+                    await asyncio.wait_for(
+                        self._stopping.wait(),
+                        timeout=settings.orders.ORDER_SWEEP_INTERVAL,
+                    )
+                except asyncio.TimeoutError:
+                    pass
+
+
+reservation_sweeper = ReservationSweeper()
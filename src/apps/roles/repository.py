@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Sequence
 from src.core.interfaces import IRepository
+from src.core.outbox import DomainEvent, add_event
 from src.apps.users.models import Role
 from sqlalchemy.sql import delete, select, update
 
@@ -34,13 +35,13 @@ class RoleRepository(IRepository):
 
     async def delete(self) -> None:
         await self._session.execute(delete(self.model))
-        await self._session.commit()
+        add_event(self._session, DomainEvent.ROLE_DELETED)
 
     async def delete_role(self, role_pk: int) -> None:
         await self._session.execute(
             delete(self.model).where(self.model.id == role_pk),
         )
-        await self._session.commit()
+        add_event(self._session, DomainEvent.ROLE_DELETED, role_pk)
 
     async def update(
         self,
@@ -54,13 +55,14 @@ class RoleRepository(IRepository):
             .where(self.model.id == role_pk)
             .values(name=new_name),
         )
-        await self._session.commit()
+        add_event(self._session, DomainEvent.ROLE_UPDATED, role_pk, name=new_name)
         return updated_role.unique().scalar_one_or_none()
 
     async def create(self, in_model: RoleIn) -> Role:
         instance = self.model(**in_model.model_dump())  # type: ignore[call-arg]
         self._session.add(instance)
-        await self._session.commit()
+        await self._session.flush()
+        add_event(self._session, DomainEvent.ROLE_CREATED, instance.id)
         await self._session.refresh(instance)
         return instance
 
@@ -72,6 +74,12 @@ class RoleRepository(IRepository):
         )
         user.roles.extend(roles_stmt.unique().scalars().all())
         self._session.add(user)
-        await self._session.commit()
+        add_event(
+            self._session,
+            DomainEvent.USER_ROLES_CHANGED,
+            user.id,
+            roles=sorted(user.roles_set),
+        )
+        await self._session.flush()
         await self._session.refresh(user)
         return user
@@ -8,13 +8,15 @@ from src.apps.roles.depends import get_role_controller
 from src.core.http_response_schemas import NotFound, Unauthorized, NotAllowed
 from src.core.auth.strategy import get_superuser, get_current_user
 from src.apps.users.schemas import UserOut
-from fastapi_cache.decorator import cache
+from src.core.cache import cache, invalidate
+from src.core.idempotency import IdempotentRoute, idempotent
 
 if TYPE_CHECKING:
     from src.apps.users.models import Role, User
+    from src.core.auth.tokens import Principal
 
 
-roles_router = APIRouter()
+roles_router = APIRouter(route_class=IdempotentRoute)
 
 
 @roles_router.post(
@@ -28,10 +30,11 @@ roles_router = APIRouter()
     response_model=RoleOut,
     status_code=status.HTTP_201_CREATED,
 )
+@invalidate("roles")
 async def create_new_role(
     role: RoleIn,
     controller: RoleController = Depends(get_role_controller),
-    _: User = Depends(get_superuser),
+    _: Principal = Depends(get_superuser),
 ) -> Role:
     return await controller.create(in_model=role)
 
@@ -46,10 +49,11 @@ async def create_new_role(
         status.HTTP_404_NOT_FOUND: {"model": NotFound},
     },
 )
+@invalidate("roles", "users", "employees")
 async def delete_role(
     role_pk: int,
     controller: RoleController = Depends(get_role_controller),
-    _: User = Depends(get_superuser),
+    _: Principal = Depends(get_superuser),
 ):
     await controller.delete_role(role_pk=role_pk)
 
@@ -63,9 +67,10 @@ async def delete_role(
         status.HTTP_403_FORBIDDEN: {"model": NotAllowed},
     },
 )
+@invalidate("roles", "users", "employees")
 async def delete_roles(
     controller: RoleController = Depends(get_role_controller),
-    _: User = Depends(get_superuser),
+    _: Principal = Depends(get_superuser),
 ):
     await controller.delete()
 
@@ -79,7 +84,7 @@ async def delete_roles(
         status.HTTP_401_UNAUTHORIZED: {"model": Unauthorized},
     },
 )
-@cache(expire=60 * 60)
+@cache(expire=60 * 60, model=Sequence[RoleOut], namespace="roles")
 async def get_roles(
     controller: RoleController = Depends(get_role_controller),
     _: User = Depends(get_current_user),
@@ -98,11 +103,12 @@ async def get_roles(
         status.HTTP_404_NOT_FOUND: {"model": NotFound},
     },
 )
+@invalidate("roles", "users", "employees")
 async def update_role(
     role_pk: int,
     new_name: str = Body(embed=True),
     controller: RoleController = Depends(get_role_controller),
-    _: User = Depends(get_superuser),
+    _: Principal = Depends(get_superuser),
 ) -> Role:
     return await controller.update(role_pk=role_pk, new_name=new_name, partial=False)
 
@@ -121,10 +127,12 @@ async def update_role(
         },
     },
 )
+@invalidate("users:{user_pk}", "employees")
+@idempotent
 async def add_role_to_user(
     user_pk: int,
     roles_list: Sequence[CompanyRoles] = Body(embed=True),
     controller: RoleController = Depends(get_role_controller),
-    _: User = Depends(get_superuser),
+    _: Principal = Depends(get_superuser),
 ) -> User:
     return await controller.add_roles_to_user(user_pk=user_pk, roles_list=roles_list)
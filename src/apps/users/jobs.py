@@ -0,0 +1,22 @@
+from __future__ import annotations
+from datetime import datetime
+
+from sqlalchemy.sql import update
+
+from src.apps.users.models import User
+from src.core.cache import response_cache
+from src.core.jobs import job_runner
+from src.core.sql.database import async_session
+
+
+@job_runner.job(name="users.update_last_login", queue="users")
+async def update_last_login(user_pk: int, login_at: str) -> None:
+    """Обновить дату последнего входа пользователя."""
+    async with async_session() as session:
+        await session.execute(
+            update(User)
+            .where(User.id == user_pk)
+            .values(last_login=datetime.fromisoformat(login_at)),
+        )
+        await session.commit()
+    await response_cache.invalidate(f"users:{user_pk}")
@@ -0,0 +1,31 @@
+from typing import Tuple
+import time
+
+from fastapi_users.password import PasswordHelper
+
+from src.core.metrics.collectors import password_hash_seconds, password_verify_seconds
+
+
+class MeteredPasswordHelper(PasswordHelper):
+    """PasswordHelper, замеряющий время хэширования и проверки паролей."""
+
+    def verify_and_update(
+        self,
+        plain_password: str,
+        hashed_password: str,
+    ) -> Tuple[bool, str]:
+        start = time.perf_counter()
+        try:
+            return super().verify_and_update(plain_password, hashed_password)
+        finally:
+            password_verify_seconds.observe(time.perf_counter() - start)
+
+    def hash(self, password: str) -> str:
+        start = time.perf_counter()
+        try:
+            return super().hash(password)
+        finally:
+            password_hash_seconds.observe(time.perf_counter() - start)
+
+
+password_helper = MeteredPasswordHelper()
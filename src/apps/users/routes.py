@@ -1,13 +1,19 @@
 from fastapi import APIRouter, status, Depends
 from src.apps.users.controller import UserController
-from src.core.http_response_schemas import UniqueConstraint, Unauthorized
+from src.core.http_response_schemas import (
+    TooManyRequests,
+    UniqueConstraint,
+    Unauthorized,
+)
 from src.core.auth.strategy import get_current_user
 from src.apps.users.depends import get_user_controller
 from src.apps.users.models import User
 from src.apps.users.schemas import UserIn, UserOut, UserUpdate
-from fastapi_cache.decorator import cache
+from src.core.cache import cache, invalidate
+from src.core.sql.uow import UnitOfWorkRoute
+from src.core.ratelimit import expensive_operations, register_limit
 
-users_router = APIRouter()
+users_router = APIRouter(route_class=UnitOfWorkRoute)
 
 
 @users_router.post(
@@ -16,9 +22,11 @@ users_router = APIRouter()
     responses={
         status.HTTP_201_CREATED: {"model": UserOut},
         status.HTTP_400_BAD_REQUEST: {"model": UniqueConstraint},
+        status.HTTP_429_TOO_MANY_REQUESTS: {"model": TooManyRequests},
     },
     description="Зарегистрировать нового пользователя",
     status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(register_limit), Depends(expensive_operations)],
 )
 async def register_user(
     user: UserIn,
@@ -36,6 +44,7 @@ async def register_user(
     },
     status_code=status.HTTP_204_NO_CONTENT,
 )
+@invalidate("users:{user.id}", "employees")
 async def user_delete(
     controller: UserController = Depends(get_user_controller),
     user: User = Depends(get_current_user),
@@ -54,6 +63,7 @@ async def user_delete(
     },
     response_model=UserOut,
 )
+@invalidate("users:{user.id}", "employees")
 async def user_edit(
     user_to_update: UserUpdate,
     controller: UserController = Depends(get_user_controller),
@@ -72,7 +82,12 @@ async def user_edit(
     },
     response_model=UserOut,
 )
-@cache(expire=60 * 60)
+@cache(
+    expire=60 * 60,
+    model=UserOut,
+    namespace=("users", "users:{user.id}"),
+    private=True,
+)
 async def get_user(
     controller: UserController = Depends(get_user_controller),
     user: User = Depends(get_current_user),
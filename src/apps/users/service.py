@@ -9,13 +9,17 @@ from fastapi import status
 
 from src.core.config import get_settings
 from src.core.exceptions import NotFoundError
+from src.apps.users.jobs import update_last_login
 from src.apps.users.models import User
-from src.apps.users.schemas import UserUpdate
+from src.apps.users.password import password_helper
+from src.core.jobs import job_runner
 
 if TYPE_CHECKING:
     from fastapi import Request
     from starlette.responses import Response
     from fastapi_users.models import UP
+    from fastapi_users.db import BaseUserDatabase
+    from fastapi_users.password import PasswordHelperProtocol
 
 
 settings = get_settings()
@@ -25,16 +29,24 @@ class UserService(IntegerIDMixin, BaseUserManager[User, int]):
     reset_password_token_secret = settings.SECRET_KEY
     verification_token_secret = settings.SECRET_KEY
 
+    def __init__(
+        self,
+        user_db: BaseUserDatabase[User, int],
+        helper: PasswordHelperProtocol | None = None,
+    ) -> None:
+        super().__init__(user_db, password_helper=helper or password_helper)
+
     async def on_after_login(
         self,
         user: UP,
         request: Request | None = None,
         response: Response | None = None,
     ) -> None:
-        update_json = user.to_json()
-        update_json["last_login"] = datetime.now()
-
-        await self.update(UserUpdate(**update_json), user, safe=True, request=request)
+        await job_runner.enqueue(
+            update_last_login,
+            user_pk=user.id,
+            login_at=datetime.now().isoformat(),
+        )
 
     async def get_user_or_404(self, user_pk: int):
         try:
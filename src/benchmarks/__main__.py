@@ -0,0 +1,168 @@
+"""
+Нагрузочные замеры основных маршрутов API.
+Запуск (нужны PostgreSQL и Redis из настроек проекта):
+    python -m src.benchmarks --companies 50 --employees 20 --concurrency 16 --requests 1000 --output baseline.json
+С --explain в отчет добавляются планы запроса справочника сотрудников (src.benchmarks.plans).
+"""
+from __future__ import annotations
+from datetime import datetime
+import argparse
+import asyncio
+import json
+import platform
+import sys
+
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from src.benchmarks.plans import explain_directory
+from src.benchmarks.runner import run_scenario
+from src.benchmarks.scenarios import build_scenarios
+from src.benchmarks.seed import create_database, drop_database, seed
+from src.core.cache import response_cache
+from src.core.ratelimit import rate_limiter
+from src.core.config import get_settings
+from src.core.sql.database import async_session, get_session
+from src.core.sql.stats import instrument_engine
+from src.main import app
+
+settings = get_settings()
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.benchmarks",
+        description=__doc__,
+    )
+    parser.add_argument("--companies", type=int, default=50, help="Количество компаний")
+    parser.add_argument(
+        "--employees",
+        type=int,
+        default=20,
+        help="Сотрудников в компании",
+    )
+    parser.add_argument(
+        "--requests",
+        type=int,
+        default=1000,
+        help="Запросов на сценарий",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=16,
+        help="Одновременных запросов",
+    )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=20,
+        help="Прогревочных запросов на сценарий",
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        help="Запустить только указанные сценарии",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Отключить кэш ответов")
+    parser.add_argument(
+        "--rate-limit",
+        action="store_true",
+        help="Не отключать ограничение частоты запросов (все запросы идут с одного IP)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Зерно генератора данных")
+    parser.add_argument(
+        "--database",
+        default=f"{settings.postgres.POSTGRES_DB}_bench",
+        help="Имя базы для замеров (пересоздается)",
+    )
+    parser.add_argument(
+        "--keep-database",
+        action="store_true",
+        help="Не удалять базу после замеров",
+    )
+    parser.add_argument(
+        "--explain",
+        action="store_true",
+        help="Добавить в отчет планы запроса справочника сотрудников",
+    )
+    parser.add_argument("--output", help="Файл для JSON-отчета (по умолчанию stdout)")
+    return parser.parse_args(argv)
+
+
+async def main(args: argparse.Namespace) -> dict:
+    engine = await create_database(args.database)
+    instrument_engine(engine)
+    bench_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def get_bench_session():
+        async with bench_session() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = get_bench_session
+    async_session.configure(bind=engine)
+    try:
+        async with bench_session() as session:
+            seeded = await seed(session, args.companies, args.employees, args.seed)
+        plans = None
+        if args.explain:
+            async with bench_session() as session:
+                plans = await explain_directory(engine, session, seeded)
+        async with app.router.lifespan_context(app):
+            if args.no_cache:
+                response_cache.reset()
+            # Все запросы замера приходят с одного адреса и логина:
+            # с лимитами в отчет попали бы ответы 429, а не работа маршрутов
+            if not args.rate_limit:
+                rate_limiter.reset()
+            async with AsyncClient(app=app, base_url="http://bench") as client:
+                response = await client.post(
+                    app.url_path_for("auth:jwt.login"),
+                    data={"username": seeded.admin_email, "password": seeded.password},
+                )
+                response.raise_for_status()
+                scenarios = build_scenarios(seeded, response.json()["access_token"])
+                results = {
+                    scenario.name: await run_scenario(
+                        client,
+                        scenario,
+                        requests=args.requests,
+                        concurrency=args.concurrency,
+                        warmup=args.warmup,
+                        seed_value=args.seed,
+                    )
+                    for scenario in scenarios
+                    if not args.scenario or scenario.name in args.scenario
+                }
+    finally:
+        app.dependency_overrides.pop(get_session, None)
+        await engine.dispose()
+        if not args.keep_database:
+            await drop_database(args.database)
+    report = {
+        "meta": {
+            "created_at": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "companies": args.companies,
+            "employees": args.employees,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "cache": not args.no_cache,
+            "rate_limit": args.rate_limit,
+        },
+        "scenarios": results,
+    }
+    if plans is not None:
+        report["plans"] = plans
+    return report
+
+
+if __name__ == "__main__":
+    arguments = parse_args()
+    report = json.dumps(asyncio.run(main(arguments)), ensure_ascii=False, indent=2)
+    if arguments.output:
+        with open(arguments.output, "w") as file:
+            file.write(report + "\n")
+    else:
+        sys.stdout.write(report + "\n")
@@ -0,0 +1,107 @@
+"""
+Планы запросов справочника сотрудников.
+Запрос страницы выполняется через EXPLAIN (ANALYZE, BUFFERS): в отчет попадают узлы
+сканирования, использованные индексы и число обращений к таблице (Heap Fetches).
+Страница читается по частичному индексу ix_employees_company_active: неактивные строки
+в него не входят, а из таблицы дочитывается только свободный текст extra_data,
+который не помещается в строку индекса.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Iterator
+import json
+
+from sqlalchemy.dialects.postgresql import asyncpg
+
+from src.apps.employee.repository import EmployeeRepository
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Dialect
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+    from sqlalchemy.sql import Select
+
+    from src.benchmarks.seed import SeedResult
+
+SCAN_NODES = ("Seq Scan", "Index Scan", "Index Only Scan", "Bitmap Heap Scan")
+
+
+def plan_nodes(plan: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """Узлы плана в порядке обхода в глубину."""
+    yield plan
+    for child in plan.get("Plans", ()):
+        yield from plan_nodes(child)
+
+
+def summarize_plan(explained: list[dict[str, Any]], relation: str) -> dict[str, Any]:
+    """Сводка плана EXPLAIN (FORMAT JSON): как читалась таблица relation."""
+    root = explained[0]
+    scans = [
+        {
+            "node": node["Node Type"],
+            "index": node.get("Index Name"),
+            "heap_fetches": node.get("Heap Fetches"),
+            "rows": node.get("Actual Rows"),
+        }
+        for node in plan_nodes(root["Plan"])
+        if node["Node Type"] in SCAN_NODES and node.get("Relation Name") == relation
+    ]
+    return {
+        "execution_ms": root.get("Execution Time"),
+        "scans": scans,
+        "index_only_scan": bool(scans)
+        and all(scan["node"] == "Index Only Scan" for scan in scans),
+    }
+
+
+def render(statement: Select, dialect: Dialect | None = None) -> str:
+    """SQL запроса с подставленными параметрами."""
+    return str(
+        statement.compile(
+            dialect=dialect or asyncpg.dialect(),
+            compile_kwargs={"literal_binds": True},
+        ),
+    )
+
+
+async def explain(session: AsyncSession, statement: Select) -> list[dict[str, Any]]:
+    connection = await session.connection()
+    # Без text(): в отрендеренном SQL могут быть двоеточия
+    result = await connection.exec_driver_sql(
+        f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {render(statement, connection.dialect)}",
+    )
+    explained = result.scalar_one()
+    # asyncpg возвращает json строкой
+    return json.loads(explained) if isinstance(explained, str) else explained
+
+
+async def vacuum(engine: AsyncEngine, *tables: str) -> None:
+    """VACUUM ANALYZE обновляет карту видимости и статистику; вне транзакции."""
+    async with engine.connect() as connection:
+        connection = await connection.execution_options(isolation_level="AUTOCOMMIT")
+        for table in tables:
+            await connection.exec_driver_sql(f"VACUUM ANALYZE {table}")
+
+
+async def explain_directory(
+    engine: AsyncEngine,
+    session: AsyncSession,
+    seeded: SeedResult,
+    page_size: int = 50,
+) -> dict[str, dict[str, Any]]:
+    """Планы первой страницы, следующей страницы и поиска по справочнику."""
+    await vacuum(engine, "employees", "users")
+    repository = EmployeeRepository(session=session)
+    company_pk = seeded.admin_company_id
+    queries = {
+        "first_page": repository.directory_query(company_pk, limit=page_size),
+        "next_page": repository.directory_query(company_pk, after=0, limit=page_size),
+        "search": repository.directory_query(
+            company_pk,
+            limit=page_size,
+            search="bench",
+        ),
+    }
+    plans = {}
+    for name, statement in queries.items():
+        plans[name] = summarize_plan(await explain(session, statement), "employees")
+    await session.rollback()
+    return plans
@@ -0,0 +1,89 @@
+from __future__ import annotations
+from random import Random
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, NamedTuple
+import asyncio
+import math
+import time
+
+from src.core.sql.stats import collect_queries
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient, Response
+
+
+class Scenario(NamedTuple):
+    name: str
+    request: Callable[[AsyncClient, Random], Awaitable[Response]]
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Перцентиль по методу ближайшего ранга; values должен быть отсортирован."""
+    if not values:
+        return 0.0
+    rank = max(math.ceil(q / 100 * len(values)) - 1, 0)
+    return values[min(rank, len(values) - 1)]
+
+
+def summarize(
+    latencies: list[float],
+    queries: list[int],
+    errors: int,
+    elapsed: float,
+) -> dict[str, Any]:
+    latencies = sorted(latencies)
+    total = len(latencies)
+    return {
+        "requests": total,
+        "errors": errors,
+        "throughput_rps": round(total / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {
+            "mean": round(sum(latencies) / total * 1000, 3) if total else 0.0,
+            "p50": round(percentile(latencies, 50) * 1000, 3),
+            "p95": round(percentile(latencies, 95) * 1000, 3),
+            "p99": round(percentile(latencies, 99) * 1000, 3),
+            "max": round(latencies[-1] * 1000, 3) if total else 0.0,
+        },
+        "queries_per_request": {
+            "mean": round(sum(queries) / total, 2) if total else 0.0,
+            "max": max(queries, default=0),
+        },
+    }
+
+
+async def run_scenario(
+    client: AsyncClient,
+    scenario: Scenario,
+    requests: int,
+    concurrency: int,
+    warmup: int = 0,
+    seed_value: int = 0,
+) -> dict[str, Any]:
+    """Выполнить requests запросов сценария, держа concurrency запросов в работе одновременно."""
+    random = Random(seed_value)
+    for _ in range(warmup):
+        await scenario.request(client, random)
+
+    latencies: list[float] = []
+    queries: list[int] = []
+    errors = 0
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            with collect_queries() as stats:
+                start = time.perf_counter()
+                try:
+                    response = await scenario.request(client, random)
+                except Exception:
+                    response = None
+                latency = time.perf_counter() - start
+            if response is None or response.is_error:
+                errors += 1
+            latencies.append(latency)
+            queries.append(stats.count)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, queries, errors, time.perf_counter() - start)
@@ -0,0 +1,43 @@
+from __future__ import annotations
+from random import Random
+from typing import TYPE_CHECKING
+
+from src.benchmarks.runner import Scenario
+from src.main import app
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient, Response
+    from src.benchmarks.seed import SeedResult
+
+
+def build_scenarios(seed: SeedResult, token: str) -> list[Scenario]:
+    """Основные маршруты API; авторизованные запросы выполняются от администратора компании."""
+    headers = {"Authorization": f"Bearer {token}"}
+    credentials = {"username": seed.admin_email, "password": seed.password}
+
+    async def companies_list(client: AsyncClient, random: Random) -> Response:
+        return await client.get(app.url_path_for("companies_list"))
+
+    async def company_detail(client: AsyncClient, random: Random) -> Response:
+        company_pk = random.choice(seed.company_ids)
+        return await client.get(
+            app.url_path_for("company_detail", company_pk=company_pk),
+        )
+
+    async def employees_list(client: AsyncClient, random: Random) -> Response:
+        url = app.url_path_for("get_employees", company_pk=seed.admin_company_id)
+        return await client.get(url, headers=headers)
+
+    async def users_me(client: AsyncClient, random: Random) -> Response:
+        return await client.get(app.url_path_for("get_user"), headers=headers)
+
+    async def login(client: AsyncClient, random: Random) -> Response:
+        return await client.post(app.url_path_for("auth:jwt.login"), data=credentials)
+
+    return [
+        Scenario("companies_list", companies_list),
+        Scenario("company_detail", company_detail),
+        Scenario("employees_list", employees_list),
+        Scenario("users_me", users_me),
+        Scenario("login", login),
+    ]
@@ -0,0 +1,168 @@
+from __future__ import annotations
+from random import Random
+from typing import NamedTuple
+
+from sqlalchemy import URL, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.apps.company.enums import CompanyType
+from src.apps.company.models import Company
+from src.apps.company.repository import refresh_company_profiles
+from src.apps.employee.models import Employee
+from src.apps.roles.enums import CompanyRoles
+from src.apps.users.models import Role, User
+from src.apps.users.password import password_helper
+from src.core.config import get_settings
+from src.core.sql.database import Base
+
+settings = get_settings()
+
+BENCH_PASSWORD: str = "bench_password"
+
+CITIES: tuple[str, ...] = (
+    "Москва",
+    "Санкт-Петербург",
+    "Новосибирск",
+    "Екатеринбург",
+    "Казань",
+    "Нижний Новгород",
+    "Самара",
+    "Краснодар",
+)
+STREETS: tuple[str, ...] = (
+    "Ленина",
+    "Мира",
+    "Советская",
+    "Садовая",
+    "Гагарина",
+    "Пушкина",
+    "Лесная",
+)
+
+
+class SeedResult(NamedTuple):
+    company_ids: list[int]
+    admin_email: str
+    admin_company_id: int
+    password: str
+
+
+def database_url(name: str) -> URL:
+    return URL.create(
+        drivername=settings.postgres.POSTGRES_DRIVER,
+        host=settings.postgres.POSTGRES_HOST,
+        username=settings.postgres.POSTGRES_USER,
+        password=settings.postgres.POSTGRES_PASSWORD,
+        port=settings.postgres.POSTGRES_PORT,
+        database=name,
+    )
+
+
+async def create_database(name: str) -> AsyncEngine:
+    """Пересоздать базу для замеров и создать в ней таблицы."""
+    main_engine = create_async_engine(
+        settings.postgres.sqlalchemy_db_uri,
+        poolclass=NullPool,
+    )
+    async with main_engine.connect() as connection:
+        await connection.execute(text("COMMIT;"))
+        await connection.execute(text(f"DROP DATABASE IF EXISTS {name};"))
+        await connection.execute(text(f"CREATE DATABASE {name};"))
+    await main_engine.dispose()
+    engine = create_async_engine(database_url(name))
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    return engine
+
+
+async def drop_database(name: str) -> None:
+    main_engine = create_async_engine(
+        settings.postgres.sqlalchemy_db_uri,
+        poolclass=NullPool,
+    )
+    async with main_engine.connect() as connection:
+        await connection.execute(text("COMMIT;"))
+        await connection.execute(text(f"DROP DATABASE IF EXISTS {name};"))
+    await main_engine.dispose()
+
+
+def _address(random: Random) -> dict:
+    return {
+        "Country": "Russian Federation",
+        "City": random.choice(CITIES),
+        "Street": random.choice(STREETS),
+        "House": str(random.randint(1, 200)),
+        "Office": str(random.randint(1, 500)),
+        "Postcode": f"{random.randint(100000, 199999)}",
+    }
+
+
+async def seed(
+    session: AsyncSession,
+    companies: int,
+    employees: int,
+    seed_value: int = 0,
+) -> SeedResult:
+    """
+    Наполнить базу: companies компаний по employees сотрудников в каждой.
+    Первый сотрудник каждой компании - администратор, остальные получают случайную роль.
+    Пароль у всех пользователей один, чтобы хэш считался один раз.
+    """
+    random = Random(seed_value)
+    hashed_password = password_helper.hash(BENCH_PASSWORD)
+    roles = {name: Role(name=name) for name in CompanyRoles.list()}  # type: ignore[call-arg]
+    session.add_all(roles.values())
+
+    company_ids = []
+    for company_number in range(companies):
+        company = Company(  # type: ignore[call-arg]
+            name=f"Бренд {company_number}",
+            director_fullname=f"Директор {company_number}",
+            type=random.choice(list(CompanyType)),
+            jur_address=_address(random),
+            fact_address=_address(random),
+            rating=round(random.uniform(1, 5), 2),
+            is_verified=True,
+            is_hidden=False,
+        )
+        session.add(company)
+        await session.flush()
+        company_ids.append(company.id)
+        for employee_number in range(employees):
+            user = User(  # type: ignore[call-arg]
+                email=f"bench{company_number}_{employee_number}@ywstore.dev",
+                first_name=f"Имя{employee_number}",
+                last_name=f"Фамилия{employee_number}",
+                middle_name=f"Отчество{employee_number}",
+                hashed_password=hashed_password,
+                is_active=True,
+            )
+            role_name = (
+                CompanyRoles.ADMIN
+                if employee_number == 0
+                else random.choice(CompanyRoles.list())
+            )
+            user.roles.append(roles[role_name])
+            session.add(user)
+            await session.flush()
+            session.add(
+                Employee(  # type: ignore[call-arg]
+                    company_id=company.id,
+                    user_id=user.id,
+                    telegram=f"@bench{company_number}_{employee_number}",
+                    vk=f"https://vk.com/bench{company_number}_{employee_number}",
+                    phone_number=f"+7900{random.randint(1000000, 9999999)}",
+                    extra_data="Сотрудник для нагрузочного тестирования",
+                    is_active=True,
+                ),
+            )
+        await session.commit()
+    await refresh_company_profiles(session)
+    await session.commit()
+    return SeedResult(
+        company_ids=company_ids,
+        admin_email="bench0_0@ywstore.dev",
+        admin_company_id=company_ids[0],
+        password=BENCH_PASSWORD,
+    )
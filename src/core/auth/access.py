@@ -7,8 +7,8 @@ from fastapi import status
 
 from src.apps.employee.schemas import EmployeeIn
 from src.apps.roles.exceptions import AdminRequiredError
-from src.apps.users.models import User
-from src.core.auth.strategy import get_current_user
+from src.core.auth.strategy import get_principal
+from src.core.auth.tokens import Principal
 from src.apps.roles.enums import CompanyRoles
 from src.core.exceptions import IsOwnerError
 
@@ -17,7 +17,7 @@ def allow_superuser(func):
     @functools.wraps(func)
     async def wrapped(*args, **kwargs):
         for k, v in kwargs.items():
-            if isinstance(v, User) and v.is_superuser:
+            if isinstance(v, Principal) and v.is_superuser:
                 return v
         return await func(*args, **kwargs)
 
@@ -27,14 +27,14 @@ def allow_superuser(func):
 @allow_superuser
 async def get_company_admin(
     company_pk: int,
-    current_user: User = Depends(get_current_user),
-) -> User:
-    if not current_user.employee or current_user.employee.company_id != company_pk:
+    current_user: Principal = Depends(get_principal),
+) -> Principal:
+    if current_user.company_id != company_pk:
         raise IsOwnerError(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Вы не имеете доступа к данной компании.",
         )
-    if CompanyRoles.ADMIN in current_user.roles_set:
+    if current_user.is_member(CompanyRoles.ADMIN):
         return current_user
     raise AdminRequiredError(
         status_code=status.HTTP_403_FORBIDDEN,
@@ -45,17 +45,14 @@ async def get_company_admin(
 @allow_superuser
 async def get_company_admin_post_query(
     employee: EmployeeIn,
-    current_user: User = Depends(get_current_user),
-) -> User:
-    if (
-        not current_user.employee
-        or current_user.employee.company_id != employee.company_id
-    ):
+    current_user: Principal = Depends(get_principal),
+) -> Principal:
+    if current_user.company_id != employee.company_id:
         raise IsOwnerError(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Вы не имеете доступа к данной компании.",
         )
-    if CompanyRoles.ADMIN in current_user.roles_set:
+    if current_user.is_member(CompanyRoles.ADMIN):
         return current_user
     raise AdminRequiredError(
         status_code=status.HTTP_403_FORBIDDEN,
@@ -67,14 +64,14 @@ async def get_company_admin_post_query(
 async def get_current_employee(
     user_pk: int,
     company_pk: int,
-    current_user: User = Depends(get_current_user),
-) -> User:
-    if current_user.id != user_pk:
+    current_user: Principal = Depends(get_principal),
+) -> Principal:
+    if current_user.user_id != user_pk:
         raise IsOwnerError(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Недостаточно прав",
         )
-    if current_user.employee.company_id != company_pk:
+    if current_user.company_id != company_pk:
         raise IsOwnerError(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Вы не имеете доступа к данной компании.",
@@ -0,0 +1,50 @@
+from __future__ import annotations
+from typing import Iterable
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    Фильтр Блума на bytearray: ложных отрицательных ответов нет,
+    ложные положительные - с вероятностью около error_rate при capacity элементах.
+    Позиции бит - двойное хэширование по одному blake2b (Kirsch-Mitzenmacher).
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        capacity = max(capacity, 1)
+        self.size = max(
+            math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2),
+            8,
+        )
+        self.hashes = max(round(self.size / capacity * math.log(2)), 1)
+        self._bits = bytearray((self.size + 7) // 8)
+
+    @classmethod
+    def from_items(
+        cls,
+        items: Iterable[str],
+        capacity: int,
+        error_rate: float = 0.001,
+    ) -> BloomFilter:
+        bloom = cls(capacity, error_rate)
+        for item in items:
+            bloom.add(item)
+        return bloom
+
+    def _positions(self, item: str) -> Iterable[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for index in range(self.hashes):
+            yield (first + index * second) % self.size
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
@@ -0,0 +1,134 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, NamedTuple
+from uuid import uuid4
+import hashlib
+import secrets
+
+if TYPE_CHECKING:
+    from aioredis import Redis
+
+# KEYS[1] - новый токен, KEYS[2] - множество токенов семейства
+ISSUE_SCRIPT = """
+redis.call('HSET', KEYS[1], 'user_id', ARGV[1])
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+redis.call('SADD', KEYS[2], KEYS[1])
+redis.call('EXPIRE', KEYS[2], ARGV[2])
+"""
+
+# KEYS[1] - предъявленный токен, KEYS[2] - семейство, KEYS[3] - новый токен.
+# Повторное предъявление уже использованного токена отзывает все семейство:
+# значит, токен утек и им пользуется кто-то еще.
+ROTATE_SCRIPT = """
+local data = redis.call('HMGET', KEYS[1], 'user_id', 'used')
+if not data[1] then
+    return false
+end
+if data[2] then
+    for _, key in ipairs(redis.call('SMEMBERS', KEYS[2])) do
+        redis.call('DEL', key)
+    end
+    redis.call('DEL', KEYS[2])
+    return false
+end
+redis.call('HSET', KEYS[1], 'used', 1)
+redis.call('HSET', KEYS[3], 'user_id', data[1])
+redis.call('EXPIRE', KEYS[3], ARGV[1])
+redis.call('SADD', KEYS[2], KEYS[3])
+redis.call('EXPIRE', KEYS[2], ARGV[1])
+return data[1]
+"""
+
+REVOKE_SCRIPT = """
+for _, key in ipairs(redis.call('SMEMBERS', KEYS[1])) do
+    redis.call('DEL', key)
+end
+return redis.call('DEL', KEYS[1])
+"""
+
+
+class RotatedToken(NamedTuple):
+    user_id: int
+    family: str
+    token: str
+
+
+class RefreshTokenStore:
+    """
+    Ротируемые refresh-токены в Redis.
+    Токен имеет вид "<семейство>.<секрет>", в Redis хранится только его хэш.
+    Семейство - все токены одного входа: каждый обмен выдает следующий токен
+    того же семейства, а выход или повторное использование отзывает его целиком.
+    """
+
+    def __init__(self) -> None:
+        self._redis: Redis | None = None
+        self._prefix: str = ""
+        self._issue = None
+        self._rotate = None
+        self._revoke = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._redis is not None
+
+    def init(self, redis: Redis, prefix: str = "ywstore-auth") -> None:
+        self._redis = redis
+        self._prefix = f"{prefix}:refresh"
+        self._issue = redis.register_script(ISSUE_SCRIPT)
+        self._rotate = redis.register_script(ROTATE_SCRIPT)
+        self._revoke = redis.register_script(REVOKE_SCRIPT)
+
+    def reset(self) -> None:
+        self._redis = None
+        self._issue = self._rotate = self._revoke = None
+
+    def _token_key(self, token: str) -> str:
+        return f"{self._prefix}:{hashlib.sha256(token.encode()).hexdigest()}"
+
+    def _family_key(self, family: str) -> str:
+        return f"{self._prefix}:family:{family}"
+
+    @staticmethod
+    def family_of(token: str) -> str | None:
+        family, _, secret = token.partition(".")
+        return family if len(family) == 32 and secret else None
+
+    async def issue(self, user_id: int, ttl: int) -> str:
+        """Выдать первый токен нового семейства."""
+        family = uuid4().hex
+        token = f"{family}.{secrets.token_urlsafe(32)}"
+        await self._issue(
+            keys=[self._token_key(token), self._family_key(family)],
+            args=[user_id, ttl],
+        )
+        return token
+
+    async def rotate(self, token: str, ttl: int) -> RotatedToken | None:
+        """Обменять токен на следующий; None - токен неизвестен, истек или уже использован."""
+        family = self.family_of(token)
+        if family is None:
+            return None
+        new_token = f"{family}.{secrets.token_urlsafe(32)}"
+        user_id = await self._rotate(
+            keys=[
+                self._token_key(token),
+                self._family_key(family),
+                self._token_key(new_token),
+            ],
+            args=[ttl],
+        )
+        if user_id is None:
+            return None
+        return RotatedToken(user_id=int(user_id), family=family, token=new_token)
+
+    async def revoke_family(self, family: str) -> None:
+        await self._revoke(keys=[self._family_key(family)])
+
+    async def clear(self) -> None:
+        """Удалить все токены (используется в тестах)."""
+        keys = [key async for key in self._redis.scan_iter(match=f"{self._prefix}:*")]
+        if keys:
+            await self._redis.delete(*keys)
+
+
+refresh_tokens = RefreshTokenStore()
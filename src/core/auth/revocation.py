@@ -0,0 +1,149 @@
+"""
+Отзыв access-токенов по jti.
+
+Источник истины - Redis: ключ отозванного jti живет, пока токен не истек бы сам.
+Чтобы не ходить в Redis на каждый запрос, каждый воркер держит фильтр Блума
+по всем действующим отзывам и пересобирает его в фоне, когда в Redis меняется
+версия списка. Токен, которого нет в фильтре, точно не отозван - ответ без сети.
+Совпадение в фильтре подтверждается в Redis (ложные срабатывания).
+
+Отзыв в другом воркере становится виден здесь не позже AUTH_REVOCATION_SYNC_INTERVAL.
+Если фильтр давно не обновлялся (Redis недоступен, фоновая задача не запущена),
+каждая проверка идет в Redis.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import asyncio
+import logging
+import math
+import time
+
+from src.core.auth.bloom import BloomFilter
+from src.core.config import get_settings
+
+if TYPE_CHECKING:
+    from aioredis import Redis
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+class TokenRevocationList:
+    def __init__(self) -> None:
+        self._redis: Redis | None = None
+        self._prefix: str = ""
+        self._bloom: BloomFilter | None = None
+        self._version: str | None = None
+        self._synced_at = 0.0
+        self._stopping: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._redis is not None
+
+    @property
+    def is_fresh(self) -> bool:
+        """Фильтру можно верить: он обновлялся не позже AUTH_REVOCATION_MAX_STALENESS назад."""
+        return (
+            self._bloom is not None
+            and time.monotonic() - self._synced_at
+            <= settings.auth.AUTH_REVOCATION_MAX_STALENESS
+        )
+
+    def init(self, redis: Redis, prefix: str = "ywstore-auth") -> None:
+        self._redis = redis
+        self._prefix = f"{prefix}:revoked"
+        self._bloom = None
+        self._version = None
+
+    def reset(self) -> None:
+        self._redis = None
+        self._bloom = None
+        self._version = None
+
+    @property
+    def _log_key(self) -> str:
+        # jti действующих отзывов, score - время истечения токена
+        return f"{self._prefix}:log"
+
+    @property
+    def _version_key(self) -> str:
+        return f"{self._prefix}:version"
+
+    async def revoke(self, jti: str, expires_at: float) -> None:
+        ttl = math.ceil(expires_at - time.time())
+        if ttl <= 0:
+            return
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.set(f"{self._prefix}:{jti}", 1, ex=ttl)
+            pipe.zadd(self._log_key, {jti: expires_at})
+            pipe.incr(self._version_key)
+            await pipe.execute()
+        # В своем воркере отзыв действует сразу
+        if self._bloom is not None:
+            self._bloom.add(jti)
+
+    async def is_revoked(self, jti: str) -> bool:
+        if self.is_fresh and jti not in self._bloom:
+            return False
+        return bool(await self._redis.exists(f"{self._prefix}:{jti}"))
+
+    async def sync(self) -> None:
+        """Пересобрать фильтр, если список отзывов в Redis изменился."""
+        version = await self._redis.get(self._version_key)
+        if self._bloom is None or version != self._version:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.zremrangebyscore(self._log_key, "-inf", time.time())
+                pipe.zrange(self._log_key, 0, -1)
+                pipe.get(self._version_key)
+                _, revoked, version = await pipe.execute()
+            revoked = [
+                jti.decode() if isinstance(jti, bytes) else jti for jti in revoked
+            ]
+            self._bloom = BloomFilter.from_items(
+                revoked,
+                capacity=max(
+                    settings.auth.AUTH_REVOCATION_BLOOM_CAPACITY,
+                    len(revoked) * 2,
+                ),
+                error_rate=settings.auth.AUTH_REVOCATION_BLOOM_ERROR_RATE,
+            )
+            self._version = version
+        self._synced_at = time.monotonic()
+
+    async def clear(self) -> None:
+        """Удалить все отзывы (используется в тестах)."""
+        keys = [key async for key in self._redis.scan_iter(match=f"{self._prefix}:*")]
+        if keys:
+            await self._redis.delete(*keys)
+        self._bloom = None
+        self._version = None
+
+    async def start(self) -> None:
+        self._stopping = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stopping.set()
+        await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await self.sync()
+            except Exception:
+                logger.exception("Не удалось обновить фильтр отозванных токенов")
+            try:
+                await asyncio.wait_for(
+                    self._stopping.wait(),
+                    timeout=settings.auth.AUTH_REVOCATION_SYNC_INTERVAL,
+                )
+            except asyncio.TimeoutError:
+                pass
+
+
+token_revocations = TokenRevocationList()
@@ -0,0 +1,15 @@
+from pydantic import BaseModel, Field
+
+
+class TokenPair(BaseModel):
+    access_token: str
+    refresh_token: str | None = Field(
+        None,
+        title="Одноразовый токен для получения новой пары",
+    )
+    token_type: str = "bearer"
+    expires_in: int = Field(..., title="Access-токен действителен, сек")
+
+
+class RefreshIn(BaseModel):
+    refresh_token: str = Field(..., max_length=256)
@@ -1,30 +1,40 @@
+from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi_users import FastAPIUsers
-from fastapi_users.authentication import (
-    BearerTransport,
-    JWTStrategy,
-    AuthenticationBackend,
-)
+from fastapi_users.exceptions import UserNotExists
 
+from src.core.auth.refresh import refresh_tokens
+from src.core.auth.schemas import RefreshIn, TokenPair
+from src.core.auth.tokens import (
+    ClaimsJWTStrategy,
+    Principal,
+    TokenPairBackend,
+    TokenPairTransport,
+)
 from src.core.config import get_settings
+from src.core.http_response_schemas import Unauthorized
 from src.apps.users.depends import get_user_service
 from src.apps.users.models import User
 from src.apps.users.schemas import UserOut, UserIn
+from src.apps.users.service import UserService
 
 settings = get_settings()
 
+# Стратегия не хранит состояния запроса, один экземпляр на процесс
+jwt_strategy = ClaimsJWTStrategy(
+    secret=settings.SECRET_KEY,
+    lifetime_seconds=settings.ACCESS_TOKEN_EXPIRE_SECONDS,
+)
 
-def get_jwt_strategy() -> JWTStrategy:
-    return JWTStrategy(
-        secret=settings.SECRET_KEY,
-        lifetime_seconds=settings.ACCESS_TOKEN_EXPIRE_SECONDS,
-    )
+
+def get_jwt_strategy() -> ClaimsJWTStrategy:
+    return jwt_strategy
 
 
-bearer_transport = BearerTransport(
+bearer_transport = TokenPairTransport(
     tokenUrl=settings.BASE_API_PREFIX + "/auth/jwt/login",
 )
 
-jwt_backend = AuthenticationBackend(
+jwt_backend = TokenPairBackend(
     name="jwt",
     transport=bearer_transport,
     get_strategy=get_jwt_strategy,
@@ -36,7 +46,83 @@ fastapi_users = FastAPIUsers[User, int](
 )
 
 auth_router = fastapi_users.get_auth_router(backend=jwt_backend)
+# Вход и выход подключаются отдельно: лимиты подбора пароля нужны только входу
+login_router = APIRouter(
+    routes=[route for route in auth_router.routes if route.name == "auth:jwt.login"],
+)
+logout_router = APIRouter(
+    routes=[route for route in auth_router.routes if route.name != "auth:jwt.login"],
+)
 register_router = fastapi_users.get_register_router(UserOut, UserIn)
+refresh_router = APIRouter()
 
 get_current_user = fastapi_users.current_user(active=True)
-get_superuser = fastapi_users.current_user(superuser=True)
+
+
+async def get_principal(
+    token: str | None = Depends(bearer_transport.scheme),
+) -> Principal:
+    """
+    Права из подписанного access-токена, без загрузки пользователя из БД.
+    Блокировка пользователя или смена ролей начинают действовать здесь
+    после истечения токена или его отзыва.
+    """
+    principal = await jwt_strategy.read_principal(token)
+    if principal is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Unauthorized",
+        )
+    return principal
+
+
+async def get_current_user_id(principal: Principal = Depends(get_principal)) -> int:
+    return principal.user_id
+
+
+async def get_superuser(principal: Principal = Depends(get_principal)) -> Principal:
+    if not principal.is_superuser:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+    return principal
+
+
+@refresh_router.post(
+    "/refresh",
+    name="auth:jwt.refresh",
+    response_model=TokenPair,
+    responses={status.HTTP_401_UNAUTHORIZED: {"model": Unauthorized}},
+    description="Обменять refresh-токен на новую пару. Каждый refresh-токен одноразовый.",
+)
+async def refresh(
+    data: RefreshIn,
+    user_service: UserService = Depends(get_user_service),
+) -> TokenPair:
+    rotated = (
+        await refresh_tokens.rotate(
+            data.refresh_token,
+            ttl=settings.auth.AUTH_REFRESH_TOKEN_TTL,
+        )
+        if refresh_tokens.enabled
+        else None
+    )
+    if rotated is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Refresh-токен недействителен",
+        )
+    try:
+        user = await user_service.get(rotated.user_id)
+    except UserNotExists:
+        user = None
+    if user is None or not user.is_active:
+        await refresh_tokens.revoke_family(rotated.family)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Refresh-токен недействителен",
+        )
+    # Роли и компания перечитываются из БД только здесь, раз в ACCESS_TOKEN_EXPIRE_SECONDS
+    return await jwt_strategy.token_pair(
+        user,
+        family=rotated.family,
+        refresh_token=rotated.token,
+    )
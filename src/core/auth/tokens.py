@@ -0,0 +1,153 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, NamedTuple
+from uuid import uuid4
+
+import jwt
+from fastapi import Response, status
+from fastapi.responses import JSONResponse
+from fastapi_users import exceptions
+from fastapi_users.authentication import (
+    AuthenticationBackend,
+    BearerTransport,
+    JWTStrategy,
+)
+from fastapi_users.jwt import decode_jwt, generate_jwt
+
+from src.apps.users.models import User
+from src.core.auth.refresh import refresh_tokens
+from src.core.auth.revocation import token_revocations
+from src.core.auth.schemas import TokenPair
+from src.core.config import get_settings
+
+if TYPE_CHECKING:
+    from fastapi_users.manager import BaseUserManager
+    from fastapi_users.openapi import OpenAPIResponseType
+
+settings = get_settings()
+
+
+class Principal(NamedTuple):
+    """Пользователь, каким его видит подписанный access-токен."""
+
+    user_id: int
+    is_superuser: bool
+    company_id: int | None
+    roles: frozenset[str]
+    jti: str
+    family: str | None
+    expires_at: int
+
+    def is_member(self, role_name: str) -> bool:
+        return role_name in self.roles
+
+
+class ClaimsJWTStrategy(JWTStrategy[User, int]):
+    """
+    Access-токен несет роли и компанию пользователя: права проверяются
+    без обращения к БД. Изменения ролей вступают в силу при следующем обмене
+    refresh-токена, поэтому access-токен живет недолго (ACCESS_TOKEN_EXPIRE_SECONDS).
+    """
+
+    async def write_token(self, user: User, family: str | None = None) -> str:
+        data = {
+            "sub": str(user.id),
+            "aud": self.token_audience,
+            "jti": uuid4().hex,
+            "su": user.is_superuser,
+            "cid": user.employee.company_id if user.employee else None,
+            "roles": sorted(user.roles_set),
+        }
+        if family is not None:
+            data["fam"] = family
+        return generate_jwt(
+            data,
+            self.encode_key,
+            self.lifetime_seconds,
+            algorithm=self.algorithm,
+        )
+
+    def decode(self, token: str) -> Principal:
+        """Проверить подпись и срок; jwt.PyJWTError, KeyError или ValueError - токен негоден."""
+        data = decode_jwt(
+            token,
+            self.decode_key,
+            self.token_audience,
+            algorithms=[self.algorithm],
+        )
+        return Principal(
+            user_id=int(data["sub"]),
+            is_superuser=bool(data.get("su", False)),
+            company_id=data.get("cid"),
+            roles=frozenset(data.get("roles", ())),
+            jti=data["jti"],
+            family=data.get("fam"),
+            expires_at=int(data["exp"]),
+        )
+
+    async def read_principal(self, token: str | None) -> Principal | None:
+        if token is None:
+            return None
+        try:
+            principal = self.decode(token)
+        except (jwt.PyJWTError, KeyError, TypeError, ValueError):
+            return None
+        if token_revocations.enabled and await token_revocations.is_revoked(
+            principal.jti,
+        ):
+            return None
+        return principal
+
+    async def read_token(
+        self,
+        token: str | None,
+        user_manager: BaseUserManager[User, int],
+    ) -> User | None:
+        principal = await self.read_principal(token)
+        if principal is None:
+            return None
+        try:
+            return await user_manager.get(principal.user_id)
+        except exceptions.UserNotExists:
+            return None
+
+    async def destroy_token(self, token: str, user: User) -> None:
+        """Выход: отозвать access-токен и семейство refresh-токенов этого входа."""
+        principal = await self.read_principal(token)
+        if principal is None:
+            return
+        if token_revocations.enabled:
+            await token_revocations.revoke(principal.jti, principal.expires_at)
+        if principal.family and refresh_tokens.enabled:
+            await refresh_tokens.revoke_family(principal.family)
+
+    async def token_pair(
+        self,
+        user: User,
+        family: str | None = None,
+        refresh_token: str | None = None,
+    ) -> TokenPair:
+        if refresh_token is None and refresh_tokens.enabled:
+            refresh_token = await refresh_tokens.issue(
+                user.id,
+                ttl=settings.auth.AUTH_REFRESH_TOKEN_TTL,
+            )
+            family = refresh_tokens.family_of(refresh_token)
+        return TokenPair(
+            access_token=await self.write_token(user, family=family),
+            refresh_token=refresh_token,
+            expires_in=self.lifetime_seconds,
+        )
+
+
+class TokenPairTransport(BearerTransport):
+    @staticmethod
+    def get_openapi_login_responses_success() -> OpenAPIResponseType:
+        return {status.HTTP_200_OK: {"model": TokenPair}}
+
+
+class TokenPairBackend(AuthenticationBackend[User, int]):
+    """Вход выдает пару access/refresh вместо одного токена."""
+
+    async def login(self, strategy: ClaimsJWTStrategy, user: User) -> Response:
+        pair = await strategy.token_pair(user)
+        return JSONResponse(pair.model_dump())
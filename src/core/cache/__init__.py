@@ -0,0 +1,2 @@
+from .backend import CachedResponse, ResponseCache, response_cache
+from .decorators import cache, invalidate, invalidate_after_commit
@@ -0,0 +1,169 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, NamedTuple, Sequence
+import time
+
+from src.core.metrics.collectors import (
+    cache_get_seconds,
+    cache_hits,
+    cache_misses,
+    cache_set_seconds,
+)
+
+if TYPE_CHECKING:
+    from aioredis import Redis
+
+
+LOOKUP_SCRIPT = """
+local versions = {}
+for i, key in ipairs(KEYS) do
+    versions[i] = redis.call('GET', key) or '0'
+end
+local version = table.concat(versions, '.')
+local key = ARGV[1] .. version .. ARGV[2]
+local etag = redis.call('HGET', key, 'etag')
+if not etag then
+    return {version, false, false, false}
+end
+if ARGV[3] ~= '' then
+    local variant = redis.call('HGET', key, ARGV[3])
+    if variant then
+        return {version, etag, variant, ARGV[3]}
+    end
+end
+return {version, etag, redis.call('HGET', key, 'body'), ''}
+"""
+
+SET_VARIANT_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+end
+return 0
+"""
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    etag: str
+    encoding: str | None = None
+
+
+class ResponseCache:
+    """
+    Кэш готовых HTTP-ответов в Redis.
+    Запись - хэш с телом ответа, его ETag и сжатыми вариантами тела (gzip, br),
+    поэтому проверка If-None-Match не требует обращения к БД,
+    а попадание в кэш - ни повторной сериализации, ни повторного сжатия.
+    Инвалидация - инкремент версии пространства имен: старые записи
+    перестают читаться и удаляются по TTL.
+    """
+
+    def __init__(self) -> None:
+        self._redis: Redis | None = None
+        self._prefix: str = ""
+        self._lookup = None
+        self._set_variant = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._redis is not None
+
+    def init(self, redis: Redis, prefix: str = "ywstore-cache") -> None:
+        """!! Клиент должен работать с bytes (decode_responses=False)."""
+        self._redis = redis
+        self._prefix = prefix
+        self._lookup = redis.register_script(LOOKUP_SCRIPT)
+        self._set_variant = redis.register_script(SET_VARIANT_SCRIPT)
+
+    def reset(self) -> None:
+        self._redis = None
+        self._lookup = None
+        self._set_variant = None
+
+    def _version_key(self, namespace: str) -> str:
+        return f"{self._prefix}:{namespace}:version"
+
+    def _entry_key(self, namespaces: Sequence[str], version: str, key: str) -> str:
+        return f"{self._prefix}:{'|'.join(namespaces)}:{version}:{key}"
+
+    async def get(
+        self,
+        namespaces: Sequence[str],
+        key: str,
+        encoding: str | None = None,
+    ) -> tuple[str, CachedResponse | None]:
+        """
+        Вернуть текущую версию пространств имен и запись, если она есть.
+        Если есть вариант тела в запрошенной кодировке - вернется он.
+        """
+        start = time.perf_counter()
+        version, etag, body, found_encoding = await self._lookup(
+            keys=[self._version_key(namespace) for namespace in namespaces],
+            args=[f"{self._prefix}:{'|'.join(namespaces)}:", f":{key}", encoding or ""],
+        )
+        cache_get_seconds.observe(time.perf_counter() - start)
+        version = version.decode()
+        if body is None or etag is None:
+            cache_misses.inc()
+            return version, None
+        cache_hits.inc()
+        return version, CachedResponse(
+            body=body,
+            etag=etag.decode(),
+            encoding=found_encoding.decode() or None,
+        )
+
+    async def set(
+        self,
+        namespaces: Sequence[str],
+        version: str,
+        key: str,
+        entry: CachedResponse,
+        expire: int,
+        variants: dict[str, bytes] | None = None,
+    ) -> None:
+        entry_key = self._entry_key(namespaces, version, key)
+        start = time.perf_counter()
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(
+                entry_key,
+                mapping={"body": entry.body, "etag": entry.etag, **(variants or {})},
+            )
+            pipe.expire(entry_key, expire)
+            await pipe.execute()
+        cache_set_seconds.observe(time.perf_counter() - start)
+
+    async def set_variant(
+        self,
+        namespaces: Sequence[str],
+        version: str,
+        key: str,
+        encoding: str,
+        body: bytes,
+    ) -> None:
+        """Дописать сжатый вариант к существующей записи (TTL записи сохраняется)."""
+        await self._set_variant(
+            keys=[self._entry_key(namespaces, version, key)],
+            args=[encoding, body],
+        )
+
+    async def version(self, namespace: str) -> str:
+        """Текущая версия пространства имен: меняется при каждой инвалидации."""
+        version = await self._redis.get(self._version_key(namespace))
+        return version.decode() if version else "0"
+
+    async def invalidate(self, *namespaces: str) -> None:
+        if not self.enabled or not namespaces:
+            return
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for namespace in namespaces:
+                pipe.incr(self._version_key(namespace))
+            await pipe.execute()
+
+    async def clear(self) -> None:
+        """Удалить все записи кэша (используется в тестах)."""
+        keys = [key async for key in self._redis.scan_iter(match=f"{self._prefix}:*")]
+        if keys:
+            await self._redis.delete(*keys)
+
+
+response_cache = ResponseCache()
@@ -0,0 +1,207 @@
+from __future__ import annotations
+from typing import Any, Awaitable, Callable, Sequence
+import functools
+import hashlib
+import inspect
+import logging
+
+from fastapi import Request, Response, status
+
+from src.apps.users.models import User
+from src.core.cache.backend import CachedResponse, response_cache
+from src.core.cache.utils import etag_matches, make_etag
+from src.core.compression import compress, negotiate, representation_etag
+from src.core.config import get_settings
+from src.core.serializers import TrustedSerializer
+from src.core.sql.replicas import read_from_primary
+from src.core.sql.uow import current_unit_of_work
+from src.core.utils import resolve_signature
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+Endpoint = Callable[..., Awaitable[Any]]
+
+
+def _format_namespaces(namespaces: Sequence[str], kwargs: dict) -> tuple[str, ...]:
+    return tuple(namespace.format(**kwargs) for namespace in namespaces)
+
+
+def _with_request_param(func: Endpoint) -> tuple[inspect.Signature, bool]:
+    signature = resolve_signature(func)
+    if "request" in signature.parameters:
+        return signature, True
+    parameters = list(signature.parameters.values())
+    parameters.append(
+        inspect.Parameter(
+            name="request",
+            kind=inspect.Parameter.KEYWORD_ONLY,
+            annotation=Request,
+        ),
+    )
+    return signature.replace(parameters=parameters), False
+
+
+def _cache_key(request: Request, kwargs: dict, private: bool) -> str:
+    key = request.url.path
+    if request.url.query:
+        key += "?" + "&".join(sorted(request.url.query.split("&")))
+    if private:
+        user = next((v for v in kwargs.values() if isinstance(v, User)), None)
+        key += f"#{user.id if user else 'anonymous'}"
+    return hashlib.md5(key.encode()).hexdigest()  # nosec:B303
+
+
+def cache(
+    expire: int,
+    model: Any,
+    namespace: str | Sequence[str] = "default",
+    private: bool = False,
+) -> Callable[[Endpoint], Endpoint]:
+    """
+    Кэширует сериализованный ответ эндпоинта вместе с ETag и сжатыми вариантами тела
+    и отвечает 304 на If-None-Match без обращения к БД.
+    Пространства имен форматируются аргументами эндпоинта.
+    >>> @router.get("/{company_pk}/employees", response_model=Sequence[EmployeeOut])
+    >>> @cache(expire=60, model=Sequence[EmployeeOut], namespace="employees:{company_pk}")
+    >>> async def get_employees(company_pk: int): ...
+    """
+    serializer = TrustedSerializer(model)
+    namespaces = (namespace,) if isinstance(namespace, str) else tuple(namespace)
+    cache_control = "private, no-cache" if private else "no-cache"
+
+    def wrapper(func: Endpoint) -> Endpoint:
+        signature, has_request = _with_request_param(func)
+
+        @functools.wraps(func)
+        async def inner(*args, **kwargs) -> Response:
+            request: Request = (
+                kwargs["request"] if has_request else kwargs.pop("request")
+            )
+            if_none_match = request.headers.get("if-none-match")
+            encoding = negotiate(request.headers.get("accept-encoding"))
+            use_cache = response_cache.enabled and request.headers.get(
+                "cache-control",
+            ) not in ("no-store", "no-cache")
+
+            if use_cache:
+                key = _cache_key(request, kwargs, private)
+                formatted = _format_namespaces(namespaces, kwargs)
+                try:
+                    version, entry = await response_cache.get(formatted, key, encoding)
+                except Exception:
+                    logger.warning("Не удалось прочитать кэш", exc_info=True)
+                    use_cache, entry = False, None
+                if entry is not None:
+                    if _should_compress(entry, encoding):
+                        entry = entry._replace(
+                            body=compress(entry.body, encoding),
+                            encoding=encoding,
+                        )
+                        try:
+                            await response_cache.set_variant(
+                                formatted,
+                                version,
+                                key,
+                                encoding,
+                                entry.body,
+                            )
+                        except Exception:
+                            logger.warning(
+                                "Не удалось сохранить ответ в кэш",
+                                exc_info=True,
+                            )
+                    return _make_response(entry, if_none_match, cache_control)
+
+            if use_cache:
+                # Промах заполняет общий кэш - данные берутся с основного сервера
+                read_from_primary()
+            result = await func(*args, **kwargs)
+            body = serializer.to_json(result)
+            entry = CachedResponse(body=body, etag=make_etag(body))
+            variants = {}
+            if _should_compress(entry, encoding):
+                variants[encoding] = compress(body, encoding)
+            if use_cache:
+                try:
+                    await response_cache.set(
+                        formatted,
+                        version,
+                        key,
+                        entry,
+                        expire,
+                        variants=variants,
+                    )
+                except Exception:
+                    logger.warning("Не удалось сохранить ответ в кэш", exc_info=True)
+            if variants:
+                entry = entry._replace(body=variants[encoding], encoding=encoding)
+            return _make_response(entry, if_none_match, cache_control)
+
+        inner.__signature__ = signature
+        return inner
+
+    return wrapper
+
+
+def _should_compress(entry: CachedResponse, encoding: str | None) -> bool:
+    return (
+        encoding is not None
+        and entry.encoding is None
+        and len(entry.body) >= settings.compression.COMPRESSION_MINIMUM_SIZE
+    )
+
+
+def _make_response(
+    entry: CachedResponse,
+    if_none_match: str | None,
+    cache_control: str,
+) -> Response:
+    etag = representation_etag(entry.etag, entry.encoding)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": cache_control,
+        "Vary": "Accept-Encoding",
+    }
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if entry.encoding is not None:
+        headers["Content-Encoding"] = entry.encoding
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
+
+async def invalidate_after_commit(*namespaces: str) -> None:
+    """
+    Сбросить пространства имен кэша. Внутри единицы работы сброс откладывается до коммита,
+    иначе параллельный запрос успел бы закэшировать данные, которые еще не изменились.
+    """
+
+    async def drop() -> None:
+        try:
+            await response_cache.invalidate(*namespaces)
+        except Exception:
+            logger.warning("Не удалось сбросить кэш", exc_info=True)
+
+    if uow := current_unit_of_work():
+        uow.after_commit(drop)
+    else:
+        await drop()
+
+
+def invalidate(*namespaces: str) -> Callable[[Endpoint], Endpoint]:
+    """
+    Сбрасывает пространства имен кэша после успешного выполнения эндпоинта.
+    >>> @invalidate("company", "employees:{company_pk}")
+    """
+
+    def wrapper(func: Endpoint) -> Endpoint:
+        @functools.wraps(func)
+        async def inner(*args, **kwargs):
+            result = await func(*args, **kwargs)
+            await invalidate_after_commit(*_format_namespaces(namespaces, kwargs))
+            return result
+
+        inner.__signature__ = resolve_signature(func)
+        return inner
+
+    return wrapper
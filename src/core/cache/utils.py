@@ -0,0 +1,17 @@
+from __future__ import annotations
+import hashlib
+
+
+def make_etag(body: bytes) -> str:
+    """Сильный ETag по содержимому ответа."""
+    return '"%s"' % hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Проверка заголовка If-None-Match (поддерживает списки, * и слабые метки)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return etag in (tag[2:] if tag.startswith("W/") else tag for tag in candidates)
@@ -0,0 +1,165 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from src.core.config import get_settings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+settings = get_settings()
+
+SUPPORTED_ENCODINGS: tuple[str, ...] = ("br", "gzip") if brotli else ("gzip",)
+
+
+def negotiate(accept_encoding: str | None) -> str | None:
+    """Выбрать кодировку из Accept-Encoding с учетом q-значений (br предпочтительнее)."""
+    if not accept_encoding:
+        return None
+    accepted = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                continue
+        accepted[name.strip().lower()] = quality
+    candidates = [
+        encoding
+        for encoding in SUPPORTED_ENCODINGS
+        if accepted.get(encoding, accepted.get("*", 0)) > 0
+    ]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda encoding: accepted.get(encoding, 0))
+
+
+class _Compressor:
+    def __init__(self, encoding: str) -> None:
+        if encoding == "br":
+            self._obj = brotli.Compressor(
+                quality=settings.compression.COMPRESSION_BROTLI_QUALITY,
+            )
+            self.compress, self._finish = self._obj.process, self._obj.finish
+        else:
+            self._obj = zlib.compressobj(
+                settings.compression.COMPRESSION_GZIP_LEVEL,
+                zlib.DEFLATED,
+                zlib.MAX_WBITS | 16,
+            )
+            self.compress, self._finish = self._obj.compress, self._obj.flush
+
+    def finish(self) -> bytes:
+        return self._finish()
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    compressor = _Compressor(encoding)
+    return compressor.compress(data) + compressor.finish()
+
+
+def representation_etag(etag: str, encoding: str | None) -> str:
+    """ETag сжатого представления должен отличаться от ETag исходного."""
+    if encoding is None:
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+class CompressionMiddleware:
+    """
+    Сжимает ответы gzip/brotli по Accept-Encoding, если тело не меньше minimum_size.
+    Ответы, у которых уже есть Content-Encoding (например, сжатые записи кэша),
+    пропускаются без изменений.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = settings.compression.COMPRESSION_MINIMUM_SIZE,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressionResponder(self.app, encoding, self.minimum_size)
+        await responder(scope, receive, send)
+
+
+class _CompressionResponder:
+    def __init__(self, app: ASGIApp, encoding: str, minimum_size: int) -> None:
+        self.app = app
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.send: Send | None = None
+        self.start_message: Message | None = None
+        self.compressor: _Compressor | None = None
+        self.passthrough = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_with_compression)
+
+    async def send_with_compression(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            self.passthrough = "content-encoding" in Headers(raw=message["headers"])
+            return
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+        if self.passthrough:
+            await self._flush_start()
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.compressor is None:
+            if not more_body and len(body) < self.minimum_size:
+                self.passthrough = True
+                await self._flush_start()
+                await self.send(message)
+                return
+            self.compressor = _Compressor(self.encoding)
+            headers = MutableHeaders(raw=self.start_message["headers"])
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            if "etag" in headers:
+                headers["ETag"] = representation_etag(headers["etag"], self.encoding)
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                body = self.compressor.compress(body) + self.compressor.finish()
+                headers["Content-Length"] = str(len(body))
+                await self._flush_start()
+                await self.send({"type": "http.response.body", "body": body})
+                return
+            await self._flush_start()
+
+        chunk = self.compressor.compress(body)
+        if not more_body:
+            chunk += self.compressor.finish()
+        await self.send(
+            {"type": "http.response.body", "body": chunk, "more_body": more_body},
+        )
+
+    async def _flush_start(self) -> None:
+        if self.start_message is not None:
+            await self.send(self.start_message)
+            self.start_message = None
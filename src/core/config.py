@@ -1,8 +1,9 @@
+from functools import lru_cache
 from pydantic_settings import BaseSettings
 import secrets
 from pydantic import Field
 from pathlib import Path
-from typing import Union
+from typing import Literal, Union
 
 
 class YWStoreBaseSettings(BaseSettings):
@@ -25,25 +26,270 @@ class PGSettings(YWStoreBaseSettings):
     POSTGRES_HOST: str = Field("ywstore-postgres", title="Postgres DB host")
     POSTGRES_PORT: int = Field(5432, title="Postgres port")
     POSTGRES_DRIVER: str = "postgresql+asyncpg"
+    POSTGRES_POOL_PREWARM: int = Field(
+        0,
+        title="Сколько соединений пула открыть и прогреть при старте",
+    )
+    POSTGRES_REPLICA_HOSTS: str = Field(
+        "",
+        title="Реплики для чтения через запятую: host или host:port",
+    )
+    POSTGRES_REPLICA_STICKINESS: int = Field(
+        5,
+        title="Сколько секунд после записи клиент читает с основного сервера",
+    )
 
     @property
     def sqlalchemy_db_uri(self) -> str:
         return f"{self.POSTGRES_DRIVER}://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}/{self.POSTGRES_DB}"
 
+    @property
+    def replica_db_uris(self) -> list[str]:
+        return [
+            f"{self.POSTGRES_DRIVER}://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{host.strip()}/{self.POSTGRES_DB}"
+            for host in self.POSTGRES_REPLICA_HOSTS.split(",")
+            if host.strip()
+        ]
+
 
 class RedisSettings(YWStoreBaseSettings):
     REDIS_HOST: str = Field("ywstore-redis", title="Redis host name")
     REDIS_PORT: int = Field(6379, title="Redis connection port")
 
 
+class AuthSettings(YWStoreBaseSettings):
+    AUTH_PREFIX: str = Field("ywstore-auth", title="Префикс ключей токенов в Redis")
+    AUTH_REFRESH_TOKEN_TTL: int = Field(
+        30 * 24 * 60 * 60,
+        title="Refresh-токен без использования живет, сек",
+    )
+    AUTH_REVOCATION_SYNC_INTERVAL: float = Field(
+        1.0,
+        title="Интервал синхронизации фильтра отозванных токенов, сек",
+    )
+    AUTH_REVOCATION_MAX_STALENESS: float = Field(
+        10.0,
+        title="Устаревший дольше фильтр не используется, проверка идет в Redis, сек",
+    )
+    AUTH_REVOCATION_BLOOM_CAPACITY: int = Field(
+        100_000,
+        title="Отозванных токенов, на которые рассчитан фильтр Блума",
+    )
+    AUTH_REVOCATION_BLOOM_ERROR_RATE: float = Field(
+        0.001,
+        title="Доля ложных срабатываний фильтра Блума",
+    )
+
+
+class JobsSettings(YWStoreBaseSettings):
+    JOBS_QUEUE_PREFIX: str = Field("ywstore-jobs", title="Префикс ключей очереди")
+    JOBS_CONCURRENCY: int = Field(4, title="Количество воркеров на очередь")
+    JOBS_MAX_RETRIES: int = Field(5, title="Максимальное количество повторов")
+    JOBS_BACKOFF_BASE: float = Field(1.0, title="Базовая задержка повтора, сек")
+    JOBS_BACKOFF_MAX: float = Field(300.0, title="Максимальная задержка повтора, сек")
+    JOBS_POLL_INTERVAL: float = Field(0.5, title="Интервал опроса пустой очереди, сек")
+    JOBS_VISIBILITY_TIMEOUT: int = Field(300, title="Время аренды задачи, сек")
+    JOBS_DRAIN_TIMEOUT: float = Field(30.0, title="Время на завершение задач, сек")
+
+
+class OutboxSettings(YWStoreBaseSettings):
+    OUTBOX_STREAM_PREFIX: str = Field("ywstore-events", title="Префикс Redis-стримов")
+    OUTBOX_STREAM_MAXLEN: int = Field(100_000, title="Максимальная длина стрима")
+    OUTBOX_BATCH_SIZE: int = Field(500, title="Размер пачки публикуемых событий")
+    OUTBOX_POLL_INTERVAL: float = Field(1.0, title="Интервал опроса outbox, сек")
+
+
+class CompressionSettings(YWStoreBaseSettings):
+    COMPRESSION_MINIMUM_SIZE: int = Field(
+        1024,
+        title="Минимальный размер для сжатия, байт",
+    )
+    COMPRESSION_GZIP_LEVEL: int = Field(6, title="Уровень сжатия gzip")
+    COMPRESSION_BROTLI_QUALITY: int = Field(5, title="Качество сжатия brotli")
+
+
+class ProfilingSettings(YWStoreBaseSettings):
+    PROFILING_INTERVAL: float = Field(0.01, title="Интервал сэмплирования стеков, сек")
+    PROFILING_MAX_SECONDS: float = Field(
+        60.0,
+        title="Максимальная длительность профилирования, сек",
+    )
+    PROFILING_SLOW_REQUESTS: bool = Field(
+        False,
+        title="Профилировать медленные запросы",
+    )
+    PROFILING_SLOW_THRESHOLD: float = Field(1.0, title="Порог медленного запроса, сек")
+    PROFILING_RING_SIZE: int = Field(
+        20,
+        title="Количество хранимых профилей медленных запросов",
+    )
+    PROFILING_BUFFER_SIZE: int = Field(50_000, title="Размер буфера сэмплов")
+
+
+class ServerSettings(YWStoreBaseSettings):
+    SERVER_MODE: Literal["development", "production"] = Field(
+        "development",
+        title="Режим запуска",
+    )
+    SERVER_HOST: str = Field("0.0.0.0", title="Адрес")
+    SERVER_PORT: int = Field(8000, title="Порт")
+    SERVER_WORKERS: int = Field(0, title="Количество воркеров (0 - по числу ядер)")
+    SERVER_BACKLOG: int = Field(2048, title="Очередь входящих соединений")
+    SERVER_KEEPALIVE: int = Field(5, title="Таймаут keep-alive, сек")
+    SERVER_GRACEFUL_TIMEOUT: int = Field(
+        30,
+        title="Время на завершение запросов при остановке, сек",
+    )
+    SERVER_LIMIT_MAX_REQUESTS: int = Field(
+        10_000,
+        title="Перезапуск воркера после N запросов (0 - без перезапуска)",
+    )
+    SERVER_LIMIT_MAX_REQUESTS_JITTER: int = Field(
+        1_000,
+        title="Разброс лимита запросов воркера",
+    )
+    SERVER_MONITOR_INTERVAL: float = Field(1.0, title="Интервал проверки воркеров, сек")
+    SERVER_ACCESS_LOG: bool = Field(False, title="Журнал запросов uvicorn")
+    SERVER_READINESS_TIMEOUT: float = Field(
+        2.0,
+        title="Таймаут проверок готовности, сек",
+    )
+
+
+class RateLimitSettings(YWStoreBaseSettings):
+    RATE_LIMIT_ENABLED: bool = Field(
+        True,
+        title="Включить ограничение частоты запросов",
+    )
+    RATE_LIMIT_PREFIX: str = Field(
+        "ywstore-ratelimit",
+        title="Префикс ключей счетчиков",
+    )
+    RATE_LIMIT_LOGIN: str = Field("10/minute", title="Лимит входа (IP и логин)")
+    RATE_LIMIT_REGISTER: str = Field("5/minute", title="Лимит регистрации (IP)")
+    RATE_LIMIT_CATALOG: str = Field(
+        "300/minute",
+        title="Лимит публичного каталога (IP и пользователь)",
+    )
+    RATE_LIMIT_EXPENSIVE_CONCURRENCY: int = Field(
+        16,
+        title="Одновременных дорогих операций на воркер",
+    )
+
+
+class SearchSettings(YWStoreBaseSettings):
+    SEARCH_REFRESH_INTERVAL: float = Field(
+        2.0,
+        title="Интервал проверки изменений каталога для индекса фасетов, сек",
+    )
+    SEARCH_MAX_AGE: float = Field(
+        300.0,
+        title="Полная пересборка индекса фасетов не реже, сек",
+    )
+    SEARCH_PRICE_BANDS: str = Field(
+        "1000,3000,5000,10000",
+        title="Границы ценовых диапазонов через запятую",
+    )
+
+    @property
+    def price_bands(self) -> list[int]:
+        return sorted(
+            int(bound) for bound in self.SEARCH_PRICE_BANDS.split(",") if bound
+        )
+
+
+class CartSettings(YWStoreBaseSettings):
+    CART_PREFIX: str = Field("ywstore-cart", title="Префикс ключей корзин")
+    CART_TTL: int = Field(
+        14 * 24 * 60 * 60,
+        title="Брошенная корзина удаляется после, сек",
+    )
+    CART_MAX_ITEMS: int = Field(50, title="Позиций в корзине не больше")
+    CART_MAX_QUANTITY: int = Field(99, title="Количество одной позиции не больше")
+
+
+class OrderSettings(YWStoreBaseSettings):
+    ORDER_RESERVATION_TTL: int = Field(
+        15 * 60,
+        title="Резерв неоплаченного заказа держится, сек",
+    )
+    ORDER_SWEEP_INTERVAL: float = Field(
+        30.0,
+        title="Интервал поиска просроченных резервов, сек",
+    )
+    ORDER_SWEEP_BATCH: int = Field(
+        100,
+        title="Просроченных резервов за одну транзакцию",
+    )
+
+
+class EmployeeSettings(YWStoreBaseSettings):
+    EMPLOYEE_ARCHIVE_RETENTION: int = Field(
+        30 * 24 * 60 * 60,
+        title="Деактивированный сотрудник переносится в архив через, сек",
+    )
+    EMPLOYEE_ARCHIVE_INTERVAL: float = Field(
+        60 * 60.0,
+        title="Интервал поиска сотрудников для архивации, сек",
+    )
+    EMPLOYEE_ARCHIVE_BATCH: int = Field(
+        500,
+        title="Сотрудников, переносимых в архив за одну транзакцию",
+    )
+
+
+class IdempotencySettings(YWStoreBaseSettings):
+    IDEMPOTENCY_PREFIX: str = Field(
+        "ywstore-idempotency",
+        title="Префикс ключей идемпотентности",
+    )
+    IDEMPOTENCY_TTL: int = Field(
+        24 * 60 * 60,
+        title="Ответ на запрос с Idempotency-Key хранится, сек",
+    )
+    IDEMPOTENCY_LOCK_TTL: float = Field(
+        30.0,
+        title="Ключ выполняющегося запроса освобождается не позже, сек",
+    )
+    IDEMPOTENCY_WAIT: float = Field(
+        10.0,
+        title="Повтор ждет завершения первого запроса не дольше, сек",
+    )
+    IDEMPOTENCY_POLL_INTERVAL: float = Field(
+        0.05,
+        title="Интервал проверки результата первого запроса, сек",
+    )
+
+
 class YWStoreSettings(YWStoreBaseSettings):
     SECRET_KEY: str = secrets.token_urlsafe(32)
-    ACCESS_TOKEN_EXPIRE_SECONDS: int = 60 * 60
+    ACCESS_TOKEN_EXPIRE_SECONDS: int = 5 * 60
     SQL_ECHO: bool = True
+    SQL_NPLUSONE_THRESHOLD: int = Field(
+        5,
+        title="Число одинаковых запросов, после которого подозревается N+1",
+    )
     DEBUG: bool = Field(True)
-    postgres: PGSettings = PGSettings()
-    redis: RedisSettings = RedisSettings()
+    postgres: PGSettings = Field(default_factory=PGSettings)
+    redis: RedisSettings = Field(default_factory=RedisSettings)
+    auth: AuthSettings = Field(default_factory=AuthSettings)
+    jobs: JobsSettings = Field(default_factory=JobsSettings)
+    outbox: OutboxSettings = Field(default_factory=OutboxSettings)
+    compression: CompressionSettings = Field(default_factory=CompressionSettings)
+    profiling: ProfilingSettings = Field(default_factory=ProfilingSettings)
+    server: ServerSettings = Field(default_factory=ServerSettings)
+    ratelimit: RateLimitSettings = Field(default_factory=RateLimitSettings)
+    search: SearchSettings = Field(default_factory=SearchSettings)
+    cart: CartSettings = Field(default_factory=CartSettings)
+    orders: OrderSettings = Field(default_factory=OrderSettings)
+    idempotency: IdempotencySettings = Field(default_factory=IdempotencySettings)
+    employees: EmployeeSettings = Field(default_factory=EmployeeSettings)
 
 
+@lru_cache
 def get_settings(db_only=False) -> Union[PGSettings, YWStoreSettings]:
-    return PGSettings() if db_only else YWStoreSettings()
+    """
+    Настройки читаются из окружения и .env один раз на процесс.
+    Перечитать (например, в тестах) - get_settings.cache_clear().
+    """
+    return get_settings().postgres if db_only else YWStoreSettings()
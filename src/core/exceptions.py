@@ -11,3 +11,11 @@ class NotFoundError(HTTPException):
 
 class IsOwnerError(HTTPException):
     """Нет доступа к объекту."""
+
+
+class TooManyRequestsError(HTTPException):
+    """Превышен лимит запросов."""
+
+
+class IdempotencyKeyError(HTTPException):
+    """Ключ идемпотентности занят другим запросом."""
@@ -0,0 +1 @@
+from .routes import health_router
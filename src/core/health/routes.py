@@ -0,0 +1,56 @@
+import asyncio
+
+from fastapi import APIRouter, Depends, Request, Response, status
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import get_settings
+from src.core.health.schemas import ReadinessOut
+from src.core.sql.database import get_session
+
+settings = get_settings()
+
+health_router = APIRouter()
+
+
+async def _check(coroutine) -> bool:
+    try:
+        await asyncio.wait_for(
+            coroutine,
+            timeout=settings.server.SERVER_READINESS_TIMEOUT,
+        )
+    except Exception:
+        return False
+    return True
+
+
+@health_router.get(
+    "/live",
+    description="Процесс жив и обрабатывает запросы",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def liveness() -> None:
+    return None
+
+
+@health_router.get(
+    "/ready",
+    description="Воркер запущен, пул соединений с БД и Redis доступны",
+    response_model=ReadinessOut,
+    responses={status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ReadinessOut}},
+    status_code=status.HTTP_200_OK,
+)
+async def readiness(
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_session),
+) -> ReadinessOut:
+    redis = getattr(request.app.state, "redis", None)
+    result = ReadinessOut(
+        ready=getattr(request.app.state, "ready", False),
+        database=await _check(session.execute(text("SELECT 1"))),
+        redis=redis is not None and await _check(redis.ping()),
+    )
+    if not (result.ready and result.database and result.redis):
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return result
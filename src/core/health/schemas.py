@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+
+class ReadinessOut(BaseModel):
+    ready: bool
+    database: bool
+    redis: bool
@@ -27,3 +27,22 @@ class NotFound(BaseErrorModel):
 class NotAllowed(BaseErrorModel):
     class Config:
         json_schema_extra = {"example": {"detail": "У вас недостаточно прав"}}
+
+
+class TooManyRequests(BaseErrorModel):
+    class Config:
+        json_schema_extra = {
+            "example": {"detail": "Слишком много запросов, попробуйте позже."},
+        }
+
+
+class Conflict(BaseErrorModel):
+    class Config:
+        json_schema_extra = {
+            "example": {"detail": "Товары недоступны или их не хватает: TS-BASIC-M-W"},
+        }
+
+
+class BadRequest(BaseErrorModel):
+    class Config:
+        json_schema_extra = {"example": {"detail": "Некорректный запрос"}}
@@ -0,0 +1,2 @@
+from .backend import IdempotencyStore, StoredResponse, idempotency_store
+from .routing import IdempotentRoute, idempotent
@@ -0,0 +1,139 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from aioredis import Redis
+
+# Захват ключа: пустой ответ - ключ наш, иначе состояние уже существующей записи
+BEGIN_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    redis.call('HSET', KEYS[1], 'state', 'pending', 'token', ARGV[1], 'fingerprint', ARGV[2])
+    redis.call('PEXPIRE', KEYS[1], ARGV[3])
+    return false
+end
+return redis.call('HMGET', KEYS[1], 'state', 'fingerprint', 'status', 'media_type', 'body')
+"""
+
+# Записать ответ, только если ключ все еще принадлежит этому запросу
+COMPLETE_SCRIPT = """
+if redis.call('HGET', KEYS[1], 'token') ~= ARGV[1] then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'state', 'done', 'status', ARGV[2], 'media_type', ARGV[3], 'body', ARGV[4])
+redis.call('HDEL', KEYS[1], 'token')
+redis.call('EXPIRE', KEYS[1], ARGV[5])
+return 1
+"""
+
+RELEASE_SCRIPT = """
+if redis.call('HGET', KEYS[1], 'token') == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class StoredResponse(NamedTuple):
+    status_code: int
+    media_type: str
+    body: bytes
+
+
+class IdempotencyRecord(NamedTuple):
+    pending: bool
+    fingerprint: str
+    response: StoredResponse | None = None
+
+
+class IdempotencyStore:
+    """
+    Ответы на запросы с заголовком Idempotency-Key в Redis.
+    Первый запрос атомарно захватывает ключ (запись "pending" с коротким TTL),
+    после коммита сохраняет ответ на IDEMPOTENCY_TTL. Повторы с тем же ключом
+    получают сохраненный ответ; если обработчик упал, ключ освобождается.
+    """
+
+    def __init__(self) -> None:
+        self._redis: Redis | None = None
+        self._prefix: str = ""
+        self._begin = None
+        self._complete = None
+        self._release = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._redis is not None
+
+    def init(self, redis: Redis, prefix: str = "ywstore-idempotency") -> None:
+        self._redis = redis
+        self._prefix = prefix
+        self._begin = redis.register_script(BEGIN_SCRIPT)
+        self._complete = redis.register_script(COMPLETE_SCRIPT)
+        self._release = redis.register_script(RELEASE_SCRIPT)
+
+    def reset(self) -> None:
+        self._redis = None
+        self._begin = self._complete = self._release = None
+
+    async def begin(
+        self,
+        key: str,
+        token: str,
+        fingerprint: str,
+        lock_ttl: float,
+    ) -> IdempotencyRecord | None:
+        """None - ключ захвачен этим запросом, иначе - существующая запись."""
+        values = await self._begin(
+            keys=[f"{self._prefix}:{key}"],
+            args=[token, fingerprint, max(int(lock_ttl * 1000), 1)],
+        )
+        if values is None:
+            return None
+        state, stored_fingerprint, status_code, media_type, body = values
+        stored_fingerprint = _text(stored_fingerprint)
+        if _text(state) == "pending":
+            return IdempotencyRecord(pending=True, fingerprint=stored_fingerprint)
+        return IdempotencyRecord(
+            pending=False,
+            fingerprint=stored_fingerprint,
+            response=StoredResponse(
+                status_code=int(status_code),
+                media_type=_text(media_type),
+                body=body if isinstance(body, bytes) else body.encode(),
+            ),
+        )
+
+    async def complete(
+        self,
+        key: str,
+        token: str,
+        response: StoredResponse,
+        ttl: int,
+    ) -> bool:
+        stored = await self._complete(
+            keys=[f"{self._prefix}:{key}"],
+            args=[
+                token,
+                response.status_code,
+                response.media_type,
+                response.body,
+                ttl,
+            ],
+        )
+        return bool(int(stored))
+
+    async def release(self, key: str, token: str) -> None:
+        await self._release(keys=[f"{self._prefix}:{key}"], args=[token])
+
+    async def clear(self) -> None:
+        """Удалить все записи (используется в тестах)."""
+        keys = [key async for key in self._redis.scan_iter(match=f"{self._prefix}:*")]
+        if keys:
+            await self._redis.delete(*keys)
+
+
+def _text(value: bytes | str) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+idempotency_store = IdempotencyStore()
@@ -0,0 +1,175 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Awaitable, Callable, TypeVar
+from uuid import uuid4
+import asyncio
+import hashlib
+import logging
+
+from fastapi import Response, status
+
+from src.core.config import get_settings
+from src.core.exceptions import IdempotencyKeyError
+from src.core.idempotency.backend import StoredResponse, idempotency_store
+from src.core.ratelimit import by_ip, by_principal
+from src.core.sql.uow import UnitOfWorkRoute
+
+if TYPE_CHECKING:
+    from fastapi import Request
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 128
+
+EndpointT = TypeVar("EndpointT", bound=Callable)
+
+
+def idempotent(func: EndpointT) -> EndpointT:
+    """
+    Отметить эндпоинт как поддерживающий Idempotency-Key.
+    Работает в роутере с route_class=IdempotentRoute.
+    >>> @router.post("")
+    >>> @idempotent
+    >>> async def create(...):
+    """
+    func.idempotent = True
+    return func
+
+
+def _fingerprint(request: Request, body: bytes) -> str:
+    digest = hashlib.sha256(f"{request.method} {request.url}".encode())
+    digest.update(body)
+    return digest.hexdigest()
+
+
+def _replay(stored: StoredResponse) -> Response:
+    return Response(
+        content=stored.body,
+        status_code=stored.status_code,
+        media_type=stored.media_type,
+        headers={REPLAYED_HEADER: "true"},
+    )
+
+
+class IdempotentRoute(UnitOfWorkRoute):
+    """
+    Маршрут единицы работы с поддержкой заголовка Idempotency-Key у отмеченных эндпоинтов.
+    Ответ сохраняется после коммита для пары (пользователь или IP, ключ).
+    Одновременный повтор ждет результата первого запроса и получает его ответ,
+    не выполняя эндпоинт еще раз. Если Redis недоступен, запрос выполняется как обычно.
+    """
+
+    def __init__(self, path: str, endpoint: Callable, **kwargs) -> None:
+        super().__init__(path, endpoint, **kwargs)
+        extra = self.openapi_extra or {}
+        # include_router создает маршрут заново вместе с уже дополненным openapi_extra
+        declared = any(
+            param.alias.lower() == HEADER.lower()
+            for param in self.dependant.header_params
+        ) or any(param.get("name") == HEADER for param in extra.get("parameters", ()))
+        if getattr(self.endpoint, "idempotent", False) and not declared:
+            self.openapi_extra = {
+                **extra,
+                "parameters": [
+                    *extra.get("parameters", ()),
+                    {
+                        "name": HEADER,
+                        "in": "header",
+                        "required": False,
+                        "schema": {"type": "string", "maxLength": MAX_KEY_LENGTH},
+                    },
+                ],
+            }
+
+    def get_route_handler(self) -> Callable[[Request], Awaitable[Response]]:
+        handler = super().get_route_handler()
+        if not getattr(self.endpoint, "idempotent", False):
+            return handler
+
+        async def route_handler(request: Request) -> Response:
+            idempotency_key = request.headers.get(HEADER)
+            if not idempotency_key or not idempotency_store.enabled:
+                return await handler(request)
+            if len(idempotency_key) > MAX_KEY_LENGTH:
+                raise IdempotencyKeyError(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    detail=f"{HEADER} длиннее {MAX_KEY_LENGTH} символов.",
+                )
+            principal = await by_principal(request) or await by_ip(request)
+            key = f"{principal}:{request.method}:{request.url.path}:{idempotency_key}"
+            fingerprint = _fingerprint(request, await request.body())
+            token = uuid4().hex
+            try:
+                stored = await self._acquire(key, token, fingerprint)
+            except IdempotencyKeyError:
+                raise
+            except Exception:
+                logger.exception("Не удалось проверить ключ идемпотентности")
+                return await handler(request)
+            if stored is not None:
+                return _replay(stored)
+
+            try:
+                response = await handler(request)
+            except BaseException:
+                await self._release(key, token)
+                raise
+            # Ошибки не сохраняем: повтор выполнит запрос заново
+            body = getattr(response, "body", None)
+            if response.status_code >= 500 or body is None:
+                await self._release(key, token)
+                return response
+            try:
+                await idempotency_store.complete(
+                    key,
+                    token,
+                    StoredResponse(
+                        status_code=response.status_code,
+                        media_type=response.media_type or "",
+                        body=body,
+                    ),
+                    ttl=settings.idempotency.IDEMPOTENCY_TTL,
+                )
+            except Exception:
+                logger.exception("Не удалось сохранить ответ по ключу идемпотентности")
+            return response
+
+        return route_handler
+
+    @staticmethod
+    async def _acquire(key: str, token: str, fingerprint: str) -> StoredResponse | None:
+        """Захватить ключ или дождаться ответа запроса, который его держит."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.idempotency.IDEMPOTENCY_WAIT
+        while True:
+            record = await idempotency_store.begin(
+                key,
+                token,
+                fingerprint,
+                lock_ttl=settings.idempotency.IDEMPOTENCY_LOCK_TTL,
+            )
+            if record is None:
+                return None
+            if record.fingerprint != fingerprint:
+                raise IdempotencyKeyError(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    detail=f"{HEADER} уже использован с другим запросом.",
+                )
+            if not record.pending:
+                return record.response
+            if loop.time() >= deadline:
+                raise IdempotencyKeyError(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail=f"Запрос с этим {HEADER} еще выполняется.",
+                    headers={"Retry-After": "1"},
+                )
+            await asyncio.sleep(settings.idempotency.IDEMPOTENCY_POLL_INTERVAL)
+
+    @staticmethod
+    async def _release(key: str, token: str) -> None:
+        try:
+            await idempotency_store.release(key, token)
+        except Exception:
+            logger.exception("Не удалось освободить ключ идемпотентности")
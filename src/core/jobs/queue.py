@@ -0,0 +1,87 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import time
+
+from src.core.jobs.schemas import Job
+
+if TYPE_CHECKING:
+    from aioredis import Redis
+
+
+CLAIM_SCRIPT = """
+local payload = redis.call('RPOP', KEYS[1])
+if payload then
+    redis.call('ZADD', KEYS[2], ARGV[1], payload)
+end
+return payload
+"""
+
+PROMOTE_SCRIPT = """
+local items = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+for _, item in ipairs(items) do
+    redis.call('ZREM', KEYS[1], item)
+    redis.call('LPUSH', KEYS[2], item)
+end
+return #items
+"""
+
+
+class RedisJobQueue:
+    """
+    Надежная очередь задач в Redis.
+    pending - список задач, готовых к выполнению;
+    processing - задачи в работе, score - окончание аренды;
+    delayed - отложенные повторы, score - время готовности;
+    dead - задачи, исчерпавшие все попытки.
+    """
+
+    def __init__(self, redis: Redis, prefix: str) -> None:
+        self._redis = redis
+        self._prefix = prefix
+        self._claim = redis.register_script(CLAIM_SCRIPT)
+        self._promote = redis.register_script(PROMOTE_SCRIPT)
+
+    def key(self, queue: str, kind: str) -> str:
+        return f"{self._prefix}:{queue}:{kind}"
+
+    async def push(self, job: Job) -> None:
+        await self._redis.lpush(self.key(job.queue, "pending"), job.model_dump_json())
+
+    async def claim(self, queue: str, lease: int) -> str | None:
+        """Забрать задачу из очереди и взять ее в аренду на lease секунд."""
+        return await self._claim(
+            keys=[self.key(queue, "pending"), self.key(queue, "processing")],
+            args=[time.time() + lease],
+        )
+
+    async def ack(self, queue: str, payload: str) -> None:
+        await self._redis.zrem(self.key(queue, "processing"), payload)
+
+    async def retry(self, job: Job, payload: str, delay: float) -> None:
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.zrem(self.key(job.queue, "processing"), payload)
+            pipe.zadd(
+                self.key(job.queue, "delayed"),
+                {job.model_dump_json(): time.time() + delay},
+            )
+            await pipe.execute()
+
+    async def bury(self, job: Job, payload: str) -> None:
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.zrem(self.key(job.queue, "processing"), payload)
+            pipe.lpush(self.key(job.queue, "dead"), job.model_dump_json())
+            await pipe.execute()
+
+    async def promote(self, queue: str, batch_size: int = 100) -> int:
+        """
+        Вернуть в pending отложенные задачи, время которых пришло,
+        и задачи с истекшей арендой (воркер упал, не успев их выполнить).
+        """
+        now = time.time()
+        promoted = 0
+        for kind in ("delayed", "processing"):
+            promoted += await self._promote(
+                keys=[self.key(queue, kind), self.key(queue, "pending")],
+                args=[now, batch_size],
+            )
+        return promoted
@@ -0,0 +1,169 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, NamedTuple
+import asyncio
+import logging
+import random
+
+from src.core.config import get_settings
+from src.core.jobs.queue import RedisJobQueue
+from src.core.jobs.schemas import Job
+
+if TYPE_CHECKING:
+    from aioredis import Redis
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[..., Awaitable[Any]]
+
+
+class _Registered(NamedTuple):
+    func: JobHandler
+    queue: str
+    max_retries: int
+
+
+class JobRunner:
+    """
+    Исполнитель фоновых задач внутри процесса приложения.
+    Пока раннер не запущен (тесты, скрипты), задачи выполняются сразу при постановке.
+    >>> @job_runner.job(queue="emails")
+    >>> async def send_email(user_pk: int): ...
+
+    >>> await job_runner.enqueue(send_email, user_pk=1)
+    """
+
+    def __init__(self) -> None:
+        self._handlers: dict[str, _Registered] = {}
+        self._concurrency: dict[str, int] = {}
+        self._queue: RedisJobQueue | None = None
+        self._stopping: asyncio.Event | None = None
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def is_running(self) -> bool:
+        return self._queue is not None
+
+    def job(
+        self,
+        name: str | None = None,
+        queue: str = "default",
+        max_retries: int | None = None,
+    ) -> Callable[[JobHandler], JobHandler]:
+        """Зарегистрировать корутину как фоновую задачу."""
+
+        def decorator(func: JobHandler) -> JobHandler:
+            job_name = name or f"{func.__module__}.{func.__name__}"
+            self._handlers[job_name] = _Registered(
+                func=func,
+                queue=queue,
+                max_retries=(
+                    settings.jobs.JOBS_MAX_RETRIES
+                    if max_retries is None
+                    else max_retries
+                ),
+            )
+            func.job_name = job_name
+            return func
+
+        return decorator
+
+    def set_concurrency(self, queue: str, concurrency: int) -> None:
+        """Ограничить количество одновременно выполняемых задач очереди."""
+        self._concurrency[queue] = concurrency
+
+    async def enqueue(self, job: JobHandler | str, **kwargs) -> Job:
+        name = job if isinstance(job, str) else job.job_name
+        registered = self._handlers[name]
+        instance = Job(name=name, queue=registered.queue, kwargs=kwargs)
+        if self._queue is None:
+            await registered.func(**kwargs)
+        else:
+            await self._queue.push(instance)
+        return instance
+
+    async def start(self, redis: Redis) -> None:
+        self._queue = RedisJobQueue(redis, prefix=settings.jobs.JOBS_QUEUE_PREFIX)
+        self._stopping = asyncio.Event()
+        queues = {registered.queue for registered in self._handlers.values()}
+        for queue in queues:
+            concurrency = self._concurrency.get(queue, settings.jobs.JOBS_CONCURRENCY)
+            for _ in range(concurrency):
+                self._tasks.append(asyncio.create_task(self._work(queue)))
+        self._tasks.append(asyncio.create_task(self._promote(queues)))
+
+    async def stop(self) -> None:
+        """Перестать брать новые задачи и дождаться завершения текущих."""
+        if self._stopping is None:
+            return
+        self._stopping.set()
+        if self._tasks:
+            _, pending = await asyncio.wait(
+                self._tasks,
+                timeout=settings.jobs.JOBS_DRAIN_TIMEOUT,
+            )
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+        self._stopping = None
+
+    async def _work(self, queue: str) -> None:
+        while not self._stopping.is_set():
+            try:
+                payload = await self._queue.claim(
+                    queue,
+                    lease=settings.jobs.JOBS_VISIBILITY_TIMEOUT,
+                )
+            except Exception:
+                logger.exception("Не удалось получить задачу из очереди %s", queue)
+                payload = None
+            if payload is None:
+                await self._sleep(settings.jobs.JOBS_POLL_INTERVAL)
+                continue
+            await self._execute(Job.model_validate_json(payload), payload)
+
+    async def _execute(self, job: Job, payload: str) -> None:
+        registered = self._handlers.get(job.name)
+        if registered is None:
+            logger.error("Задача %s не зарегистрирована", job.name)
+            await self._queue.bury(job, payload)
+            return
+        try:
+            await registered.func(**job.kwargs)
+        except Exception:
+            logger.exception("Задача %s (%s) завершилась с ошибкой", job.name, job.id)
+            job.attempts += 1
+            if job.attempts > registered.max_retries:
+                await self._queue.bury(job, payload)
+            else:
+                await self._queue.retry(job, payload, delay=self._backoff(job.attempts))
+        else:
+            await self._queue.ack(job.queue, payload)
+
+    async def _promote(self, queues: set[str]) -> None:
+        while not self._stopping.is_set():
+            for queue in queues:
+                try:
+                    await self._queue.promote(queue)
+                except Exception:
+                    logger.exception("Не удалось перенести отложенные задачи")
+            await self._sleep(settings.jobs.JOBS_POLL_INTERVAL)
+
+    async def _sleep(self, timeout: float) -> None:
+        try:
+            await asyncio.wait_for(self._stopping.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        delay = min(
+            settings.jobs.JOBS_BACKOFF_BASE * 2 ** (attempt - 1),
+            settings.jobs.JOBS_BACKOFF_MAX,
+        )
+        return delay / 2 + random.uniform(0, delay / 2)
+
+
+job_runner = JobRunner()
@@ -0,0 +1,13 @@
+from uuid import uuid4
+
+from pydantic import BaseModel, Field
+
+
+class Job(BaseModel):
+    """Сериализуемое описание фоновой задачи, хранимое в очереди."""
+
+    id: str = Field(default_factory=lambda: uuid4().hex)
+    name: str
+    queue: str = "default"
+    kwargs: dict = Field(default_factory=dict)
+    attempts: int = 0
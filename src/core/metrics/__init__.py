@@ -0,0 +1,3 @@
+from .middleware import MetricsMiddleware
+from .registry import Counter, Gauge, Histogram, MetricsRegistry, registry
+from .routes import metrics
@@ -0,0 +1,65 @@
+from src.core.metrics.registry import registry
+
+http_requests_total = registry.counter(
+    "http_requests_total",
+    "Количество обработанных HTTP-запросов",
+    ("method", "route", "status"),
+)
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds",
+    "Время обработки HTTP-запроса",
+    ("method", "route"),
+)
+http_requests_in_progress = registry.gauge(
+    "http_requests_in_progress",
+    "Количество HTTP-запросов в обработке",
+    ("method",),
+)
+
+db_pool_checkout_seconds = registry.histogram(
+    "db_pool_checkout_seconds",
+    "Время ожидания соединения из пула БД",
+    buckets=(
+        0.0005,
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        5.0,
+        30.0,
+    ),
+).labels()
+db_pool_timeouts_total = registry.counter(
+    "db_pool_timeouts_total",
+    "Количество отказов в выдаче соединения по таймауту пула",
+).labels()
+
+_cache_requests_total = registry.counter(
+    "cache_requests_total",
+    "Обращения к кэшу ответов",
+    ("result",),
+)
+cache_hits = _cache_requests_total.labels("hit")
+cache_misses = _cache_requests_total.labels("miss")
+_cache_operation_seconds = registry.histogram(
+    "cache_operation_duration_seconds",
+    "Время операций с кэшем ответов в Redis",
+    ("operation",),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+cache_get_seconds = _cache_operation_seconds.labels("get")
+cache_set_seconds = _cache_operation_seconds.labels("set")
+
+_password_hash_seconds = registry.histogram(
+    "password_hash_duration_seconds",
+    "Время хэширования и проверки паролей",
+    ("operation",),
+)
+password_hash_seconds = _password_hash_seconds.labels("hash")
+password_verify_seconds = _password_hash_seconds.labels("verify")
@@ -0,0 +1,64 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Callable
+import time
+
+from src.core.metrics.collectors import (
+    http_request_duration_seconds,
+    http_requests_in_progress,
+    http_requests_total,
+)
+
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class MetricsMiddleware:
+    """
+    Длительность, количество и число одновременных HTTP-запросов.
+    Метка route - шаблон пути (/company/{company_pk}), а не сам путь,
+    чтобы количество рядов метрики не росло вместе с идентификаторами.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self._routes: dict[Callable[..., Any], str] | None = None
+
+    def _route(self, scope: Scope) -> str:
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return UNMATCHED_ROUTE
+        if self._routes is None or endpoint not in self._routes:
+            self._routes = {
+                route.endpoint: route.path
+                for route in scope["app"].routes
+                if hasattr(route, "endpoint")
+            }
+        return self._routes.get(endpoint, UNMATCHED_ROUTE)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        in_progress = http_requests_in_progress.labels(method)
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start
+            in_progress.dec()
+            route = self._route(scope)
+            http_request_duration_seconds.labels(method, route).observe(duration)
+            http_requests_total.labels(method, route, str(status_code)).inc()
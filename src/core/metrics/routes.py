@@ -0,0 +1,11 @@
+from starlette.requests import Request
+from starlette.responses import Response
+
+from src.core.metrics.registry import registry
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+async def metrics(request: Request) -> Response:
+    """Метрики процесса в текстовом формате Prometheus."""
+    return Response(registry.render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,3 @@
+from .enums import DomainEvent
+from .relay import OutboxRelay, outbox_relay
+from .utils import add_event
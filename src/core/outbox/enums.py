@@ -0,0 +1,31 @@
+from enum import Enum
+
+
+class DomainEvent(str, Enum):
+    """Доменные события, публикуемые через outbox."""
+
+    COMPANY_CREATED = "company.created"
+    COMPANY_UPDATED = "company.updated"
+    COMPANY_DELETED = "company.deleted"
+    COMPANY_VERIFIED = "company.verified"
+    COMPANY_HIDDEN = "company.hidden"
+    EMPLOYEE_CREATED = "employee.created"
+    EMPLOYEE_UPDATED = "employee.updated"
+    EMPLOYEE_DEACTIVATED = "employee.deactivated"
+    EMPLOYEE_RESTORED = "employee.restored"
+    ROLE_CREATED = "role.created"
+    ROLE_UPDATED = "role.updated"
+    ROLE_DELETED = "role.deleted"
+    USER_ROLES_CHANGED = "user.roles_changed"
+    PRODUCT_CREATED = "product.created"
+    PRODUCT_UPDATED = "product.updated"
+    PRODUCT_DELETED = "product.deleted"
+    STOCK_CHANGED = "stock.changed"
+    ORDER_PLACED = "order.placed"
+    ORDER_CONFIRMED = "order.confirmed"
+    ORDER_CANCELLED = "order.cancelled"
+    ORDER_EXPIRED = "order.expired"
+
+    @property
+    def aggregate(self) -> str:
+        return self.value.split(".", 1)[0]
@@ -0,0 +1,25 @@
+from __future__ import annotations
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.core.mixins import JSONRepresentationMixin
+from src.core.sql.database import Base
+
+
+class OutboxEvent(JSONRepresentationMixin, Base):
+    __tablename__ = "outbox_events"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    event_type: Mapped[str] = mapped_column(String(length=64), nullable=False)
+    aggregate_id: Mapped[str] = mapped_column(String(length=64), nullable=True)
+    payload: Mapped[JSONB] = mapped_column(JSONB, nullable=False, default=dict)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+    )
+
+    def __repr__(self) -> str:
+        return f"OutboxEvent(type={self.event_type}, aggregate={self.aggregate_id})"
@@ -0,0 +1,101 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import asyncio
+import json
+import logging
+
+from sqlalchemy.sql import delete, select
+
+from src.core.config import get_settings
+from src.core.outbox.models import OutboxEvent
+from src.core.sql.database import async_session
+
+if TYPE_CHECKING:
+    from aioredis import Redis
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+class OutboxRelay:
+    """
+    Публикует события из таблицы outbox в Redis-стримы пачками.
+    Доставка "хотя бы один раз": событие удаляется из таблицы только после XADD,
+    поэтому подписчики должны быть идемпотентны.
+    """
+
+    def __init__(self) -> None:
+        self._redis: Redis | None = None
+        self._stopping: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+
+    @staticmethod
+    def stream_name(event_type: str) -> str:
+        aggregate = event_type.split(".", 1)[0]
+        return f"{settings.outbox.OUTBOX_STREAM_PREFIX}:{aggregate}"
+
+    async def publish_batch(self, redis: Redis) -> int:
+        """Опубликовать очередную пачку событий, вернуть их количество."""
+        async with async_session() as session:
+            result = await session.execute(
+                select(OutboxEvent)
+                .order_by(OutboxEvent.id)
+                .limit(settings.outbox.OUTBOX_BATCH_SIZE)
+                .with_for_update(skip_locked=True),
+            )
+            events = result.scalars().all()
+            if not events:
+                return 0
+            async with redis.pipeline(transaction=False) as pipe:
+                for event in events:
+                    pipe.xadd(
+                        self.stream_name(event.event_type),
+                        {
+                            "id": event.id,
+                            "type": event.event_type,
+                            "aggregate_id": event.aggregate_id or "",
+                            "payload": json.dumps(event.payload, default=str),
+                            "created_at": event.created_at.isoformat(),
+                        },
+                        maxlen=settings.outbox.OUTBOX_STREAM_MAXLEN,
+                        approximate=True,
+                    )
+                await pipe.execute()
+            await session.execute(
+                delete(OutboxEvent).where(
+                    OutboxEvent.id.in_([event.id for event in events]),
+                ),
+            )
+            await session.commit()
+            return len(events)
+
+    async def start(self, redis: Redis) -> None:
+        self._redis = redis
+        self._stopping = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stopping.set()
+        await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                published = await self.publish_batch(self._redis)
+            except Exception:
+                logger.exception("Не удалось опубликовать события outbox")
+                published = 0
+            if published < settings.outbox.OUTBOX_BATCH_SIZE:
+                try:
+                    await asyncio.wait_for(
+                        self._stopping.wait(),
+                        timeout=settings.outbox.OUTBOX_POLL_INTERVAL,
+                    )
+                except asyncio.TimeoutError:
+                    pass
+
+
+outbox_relay = OutboxRelay()
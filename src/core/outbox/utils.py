@@ -0,0 +1,27 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any
+
+from src.core.outbox.models import OutboxEvent
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from src.core.outbox.enums import DomainEvent
+
+
+def add_event(
+    session: AsyncSession,
+    event: DomainEvent,
+    aggregate_id: Any = None,
+    **payload,
+) -> OutboxEvent:
+    """
+    !! Добавляет событие в сессию, поэтому оно записывается тем же коммитом,
+    что и изменение, которое его породило.
+    """
+    outbox_event = OutboxEvent(
+        event_type=event.value,
+        aggregate_id=None if aggregate_id is None else str(aggregate_id),
+        payload=payload,
+    )
+    session.add(outbox_event)
+    return outbox_event
@@ -0,0 +1,2 @@
+from .middleware import SlowRequestProfilerMiddleware, slow_request_profiler
+from .sampler import StackSampler, collapse
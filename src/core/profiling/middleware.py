@@ -0,0 +1,98 @@
+from __future__ import annotations
+from collections import deque
+from datetime import datetime
+from itertools import count
+from typing import TYPE_CHECKING, NamedTuple
+import time
+
+from src.core.config import get_settings
+from src.core.profiling.sampler import StackSampler, collapse
+
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp, Receive, Scope, Send
+
+settings = get_settings()
+
+
+class SlowProfile(NamedTuple):
+    id: int
+    method: str
+    path: str
+    duration: float
+    created_at: datetime
+    stacks: str
+
+
+class SlowRequestProfiler:
+    """
+    Профили медленных запросов.
+    Один фоновый сэмплер работает постоянно, а запрос лишь запоминает время начала:
+    если он длился дольше порога, сэмплы за это время сворачиваются в профиль
+    и кладутся в кольцевой буфер. Сэмплы общие для процесса, поэтому в профиль
+    попадают и конкурентные запросы того же воркера.
+    """
+
+    def __init__(self) -> None:
+        self.profiles: deque[SlowProfile] = deque(
+            maxlen=settings.profiling.PROFILING_RING_SIZE,
+        )
+        self._sampler: StackSampler | None = None
+        self._ids = count(1)
+
+    @property
+    def enabled(self) -> bool:
+        return self._sampler is not None
+
+    def start(self) -> None:
+        if self._sampler is not None:
+            return
+        self._sampler = StackSampler(
+            settings.profiling.PROFILING_INTERVAL,
+            maxlen=settings.profiling.PROFILING_BUFFER_SIZE,
+        )
+        self._sampler.start()
+
+    def stop(self) -> None:
+        if self._sampler is not None:
+            self._sampler.stop()
+            self._sampler = None
+
+    def record(self, method: str, path: str, start: float, end: float) -> None:
+        if self._sampler is None:
+            return
+        self.profiles.append(
+            SlowProfile(
+                id=next(self._ids),
+                method=method,
+                path=path,
+                duration=end - start,
+                created_at=datetime.now(),
+                stacks=collapse(self._sampler.stacks(start, end)),
+            ),
+        )
+
+    def get(self, profile_pk: int) -> SlowProfile | None:
+        return next(
+            (profile for profile in self.profiles if profile.id == profile_pk),
+            None,
+        )
+
+
+slow_request_profiler = SlowRequestProfiler()
+
+
+class SlowRequestProfilerMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not slow_request_profiler.enabled:
+            await self.app(scope, receive, send)
+            return
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            end = time.perf_counter()
+            if end - start >= settings.profiling.PROFILING_SLOW_THRESHOLD:
+                slow_request_profiler.record(scope["method"], scope["path"], start, end)
@@ -0,0 +1,86 @@
+import asyncio
+
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import PlainTextResponse
+
+from src.apps.users.models import User
+from src.core.auth.strategy import get_superuser
+from src.core.config import get_settings
+from src.core.exceptions import NotFoundError
+from src.core.http_response_schemas import NotAllowed, NotFound, Unauthorized
+from src.core.profiling.middleware import slow_request_profiler
+from src.core.profiling.sampler import StackSampler, collapse
+from src.core.profiling.schemas import SlowProfileOut
+
+settings = get_settings()
+
+profiling_router = APIRouter()
+
+COLLAPSED_HEADERS = {"Content-Disposition": 'attachment; filename="profile.collapsed"'}
+
+
+@profiling_router.get(
+    "/profile",
+    description="Профилировать текущий воркер заданное количество секунд. "
+    "Возвращает свернутые стеки для flamegraph.pl/speedscope",
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"model": Unauthorized},
+        status.HTTP_403_FORBIDDEN: {"model": NotAllowed},
+    },
+    response_class=PlainTextResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def profile_worker(
+    seconds: float = Query(5.0, gt=0, le=settings.profiling.PROFILING_MAX_SECONDS),
+    _: User = Depends(get_superuser),
+) -> PlainTextResponse:
+    sampler = StackSampler(settings.profiling.PROFILING_INTERVAL)
+    sampler.start()
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        sampler.stop()
+    return PlainTextResponse(collapse(sampler.stacks()), headers=COLLAPSED_HEADERS)
+
+
+@profiling_router.get(
+    "/slow",
+    description="Профили последних медленных запросов текущего воркера",
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"model": Unauthorized},
+        status.HTTP_403_FORBIDDEN: {"model": NotAllowed},
+    },
+    response_model=list[SlowProfileOut],
+    status_code=status.HTTP_200_OK,
+)
+async def slow_profiles(
+    _: User = Depends(get_superuser),
+) -> list[SlowProfileOut]:
+    return [
+        SlowProfileOut.model_validate(profile._asdict())
+        for profile in reversed(slow_request_profiler.profiles)
+    ]
+
+
+@profiling_router.get(
+    "/slow/{profile_pk}",
+    description="Свернутые стеки медленного запроса",
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"model": Unauthorized},
+        status.HTTP_403_FORBIDDEN: {"model": NotAllowed},
+        status.HTTP_404_NOT_FOUND: {"model": NotFound},
+    },
+    response_class=PlainTextResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def slow_profile_detail(
+    profile_pk: int,
+    _: User = Depends(get_superuser),
+) -> PlainTextResponse:
+    profile = slow_request_profiler.get(profile_pk)
+    if profile is None:
+        raise NotFoundError(
+            detail="Профиль с идентификатором %s не найден" % profile_pk,
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
+    return PlainTextResponse(profile.stacks, headers=COLLAPSED_HEADERS)
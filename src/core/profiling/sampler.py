@@ -0,0 +1,79 @@
+from __future__ import annotations
+from collections import Counter, deque
+from types import CodeType, FrameType
+from typing import Iterable
+import sys
+import threading
+import time
+
+Stack = tuple[str, ...]
+
+_labels: dict[CodeType, str] = {}
+
+
+def _label(frame: FrameType) -> str:
+    # Подпись кэшируется по объекту кода: одинаковые кадры разных сэмплов ссылаются на одну строку
+    code = frame.f_code
+    label = _labels.get(code)
+    if label is None:
+        label = _labels[code] = f"{frame.f_globals.get('__name__', '?')}:{code.co_name}"
+    return label
+
+
+def _stack(thread_name: str, frame: FrameType | None) -> Stack:
+    labels = []
+    while frame is not None:
+        labels.append(_label(frame))
+        frame = frame.f_back
+    labels.append(thread_name)
+    return tuple(reversed(labels))
+
+
+def collapse(stacks: Iterable[Stack]) -> str:
+    """Свернутые стеки (формат flamegraph.pl / speedscope): "a;b;c количество" на строку."""
+    counts = Counter(stacks)
+    return "".join(
+        f"{';'.join(stack)} {count}\n" for stack, count in counts.most_common()
+    )
+
+
+class StackSampler(threading.Thread):
+    """
+    Сэмплирующий профилировщик: раз в interval секунд снимает стеки всех потоков
+    процесса (кроме потоков сэмплеров) через sys._current_frames(), не трогая сам код приложения.
+    Сэмплы хранятся в кольцевом буфере с отметкой времени time.perf_counter().
+    """
+
+    def __init__(self, interval: float, maxlen: int | None = None) -> None:
+        super().__init__(name="ywstore-profiler", daemon=True)
+        self.interval = interval
+        self._samples: deque[tuple[float, Stack]] = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            now = time.perf_counter()
+            threads = threading.enumerate()
+            names = {thread.ident: thread.name for thread in threads}
+            samplers = {
+                thread.ident for thread in threads if isinstance(thread, StackSampler)
+            }
+            stacks = [
+                _stack(names.get(ident, str(ident)), frame)
+                for ident, frame in sys._current_frames().items()
+                if ident not in samplers
+            ]
+            with self._lock:
+                self._samples.extend((now, stack) for stack in stacks)
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self.is_alive():
+            self.join()
+
+    def stacks(self, start: float = 0.0, end: float = float("inf")) -> list[Stack]:
+        """Стеки, снятые в промежутке [start, end]."""
+        with self._lock:
+            samples = list(self._samples)
+        return [stack for timestamp, stack in samples if start <= timestamp <= end]
@@ -0,0 +1,11 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class SlowProfileOut(BaseModel):
+    id: int
+    method: str
+    path: str
+    duration: float
+    created_at: datetime
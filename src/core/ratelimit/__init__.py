@@ -0,0 +1,3 @@
+from .backend import Rate, RateLimiter, rate_limiter
+from .dependencies import ConcurrencyLimit, RateLimit, by_ip, by_principal, by_username
+from .limits import catalog_limit, expensive_operations, login_limit, register_limit
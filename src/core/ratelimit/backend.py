@@ -0,0 +1,103 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, NamedTuple
+import re
+
+if TYPE_CHECKING:
+    from aioredis import Redis
+
+# GCRA: в ключе хранится теоретическое время прибытия (TAT) следующего запроса.
+# Время берется из Redis, поэтому часы воркеров не влияют на результат.
+GCRA_SCRIPT = """
+local emission = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then
+    tat = now
+end
+local new_tat = tat + emission
+local allow_at = new_tat - period
+if now < allow_at then
+    return {0, allow_at - now, 0}
+end
+redis.call('SET', KEYS[1], new_tat, 'PX', new_tat - now)
+return {1, 0, math.floor((now - allow_at) / emission)}
+"""
+
+PERIODS: dict[str, int] = {
+    "second": 1,
+    "minute": 60,
+    "hour": 60 * 60,
+    "day": 24 * 60 * 60,
+}
+RATE_PATTERN = re.compile(r"^\s*(\d+)\s*/\s*(second|minute|hour|day)\s*$")
+
+
+class Rate(NamedTuple):
+    limit: int
+    period: int
+
+    @classmethod
+    def parse(cls, value: str) -> Rate:
+        """Разобрать лимит вида "10/minute"."""
+        match = RATE_PATTERN.match(value)
+        if match is None or int(match.group(1)) <= 0:
+            raise ValueError(f"Некорректный лимит запросов: {value!r}")
+        return cls(limit=int(match.group(1)), period=PERIODS[match.group(2)])
+
+    @property
+    def emission_interval_ms(self) -> int:
+        return max(self.period * 1000 // self.limit, 1)
+
+
+class RateLimitResult(NamedTuple):
+    allowed: bool
+    retry_after: float
+    remaining: int
+
+
+class RateLimiter:
+    """
+    Ограничение частоты запросов по алгоритму GCRA.
+    Проверка и обновление состояния - один Lua-скрипт, поэтому лимит
+    соблюдается при любом количестве воркеров.
+    """
+
+    def __init__(self) -> None:
+        self._redis: Redis | None = None
+        self._prefix: str = ""
+        self._gcra = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._redis is not None
+
+    def init(self, redis: Redis, prefix: str = "ywstore-ratelimit") -> None:
+        self._redis = redis
+        self._prefix = prefix
+        self._gcra = redis.register_script(GCRA_SCRIPT)
+
+    def reset(self) -> None:
+        self._redis = None
+        self._gcra = None
+
+    async def hit(self, key: str, rate: Rate) -> RateLimitResult:
+        allowed, retry_after_ms, remaining = await self._gcra(
+            keys=[f"{self._prefix}:{key}"],
+            args=[rate.emission_interval_ms, rate.period * 1000],
+        )
+        return RateLimitResult(
+            allowed=bool(int(allowed)),
+            retry_after=int(retry_after_ms) / 1000,
+            remaining=int(remaining),
+        )
+
+    async def clear(self) -> None:
+        """Удалить все счетчики (используется в тестах)."""
+        keys = [key async for key in self._redis.scan_iter(match=f"{self._prefix}:*")]
+        if keys:
+            await self._redis.delete(*keys)
+
+
+rate_limiter = RateLimiter()
@@ -0,0 +1,31 @@
+from src.core.config import get_settings
+from src.core.ratelimit.dependencies import (
+    ConcurrencyLimit,
+    RateLimit,
+    by_ip,
+    by_principal,
+    by_username,
+)
+
+settings = get_settings()
+
+login_limit = RateLimit(
+    "login",
+    settings.ratelimit.RATE_LIMIT_LOGIN,
+    keys=(by_ip, by_username),
+)
+register_limit = RateLimit(
+    "register",
+    settings.ratelimit.RATE_LIMIT_REGISTER,
+    keys=(by_ip,),
+)
+catalog_limit = RateLimit(
+    "catalog",
+    settings.ratelimit.RATE_LIMIT_CATALOG,
+    keys=(by_ip, by_principal),
+)
+# Хэширование паролей и выдача полного каталога - самые дорогие операции воркера
+expensive_operations = ConcurrencyLimit(
+    "expensive",
+    settings.ratelimit.RATE_LIMIT_EXPENSIVE_CONCURRENCY,
+)
@@ -0,0 +1,11 @@
+from typing import Any
+
+from pydantic_core import to_json
+from starlette.responses import JSONResponse
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON-ответ, кодируемый pydantic-core вместо стандартного json.dumps."""
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
@@ -0,0 +1,88 @@
+from __future__ import annotations
+from collections.abc import Sequence as SequenceABC
+from typing import Any, Callable, Union, get_args, get_origin
+import inspect
+import types
+
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined, to_json
+
+Extractor = Callable[[Any], Any]
+
+_SEQUENCE_ORIGINS = (list, set, frozenset, tuple, SequenceABC)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _sequence_extractor(item: Extractor) -> Extractor:
+    if item is _identity:
+        return lambda value: None if value is None else list(value)
+    return lambda value: None if value is None else [item(v) for v in value]
+
+
+def _model_extractor(model: type[BaseModel]) -> Extractor:
+    fields = [
+        (
+            name,
+            _build_extractor(field.annotation),
+            None if field.default is PydanticUndefined else field.default,
+        )
+        for name, field in model.model_fields.items()
+    ]
+
+    def extract(obj: Any) -> dict | None:
+        if obj is None:
+            return None
+        return {
+            name: extractor(getattr(obj, name, default))
+            for name, extractor, default in fields
+        }
+
+    return extract
+
+
+def _build_extractor(annotation: Any) -> Extractor:
+    origin = get_origin(annotation)
+    if (
+        origin is None
+        and inspect.isclass(annotation)
+        and issubclass(annotation, BaseModel)
+    ):
+        return _model_extractor(annotation)
+    if origin in _SEQUENCE_ORIGINS:
+        args = get_args(annotation)
+        return _sequence_extractor(_build_extractor(args[0]) if args else _identity)
+    if origin in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return _build_extractor(args[0])
+    return _identity
+
+
+class PrerenderedJSON(bytes):
+    """
+    JSON, уже собранный заранее (например, в БД): отдается как есть, без сериализации.
+    >>> PrerenderedJSON(document_text, "utf-8")
+    """
+
+
+class TrustedSerializer:
+    """
+    Сериализует доверенные ORM-объекты в JSON-байты по схеме ответа без валидации:
+    поля схемы читаются атрибутами объекта, кодирование выполняет pydantic-core.
+    !! Только для данных из собственной БД - типы не проверяются и не приводятся.
+    >>> TrustedSerializer(Sequence[CompanyOut]).to_json(companies)
+    """
+
+    def __init__(self, model: Any) -> None:
+        self._extract = _build_extractor(model)
+
+    def to_python(self, obj: Any) -> Any:
+        return self._extract(obj)
+
+    def to_json(self, obj: Any) -> bytes:
+        if isinstance(obj, PrerenderedJSON):
+            return bytes(obj)
+        return to_json(self._extract(obj))
@@ -1,6 +1,9 @@
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from src.core.config import get_settings
+from src.core.sql.pool import MeteredQueuePool, register_pool_metrics
+from src.core.sql.replicas import RoutingSession, replica_router, track_writes
+from src.core.sql.stats import instrument_engine
 
 settings = get_settings()
 
@@ -11,10 +14,31 @@ engine = create_async_engine(
     settings.postgres.sqlalchemy_db_uri,
     echo=settings.SQL_ECHO,
     future=True,
+    poolclass=MeteredQueuePool,
+)
+replica_engines = [
+    create_async_engine(
+        uri,
+        echo=settings.SQL_ECHO,
+        future=True,
+        poolclass=MeteredQueuePool,
+    )
+    for uri in settings.postgres.replica_db_uris
+]
+for _engine in (engine, *replica_engines):
+    instrument_engine(_engine)
+track_writes(engine)
+replica_router.configure(replica_engines)
+register_pool_metrics(engine, *replica_engines)
+
+async_session = sessionmaker(
+    engine,
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    expire_on_commit=False,
 )
 
 
 async def get_session() -> AsyncSession:
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
     async with async_session() as session:
         yield session
@@ -0,0 +1,50 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Iterator
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from src.core.metrics.collectors import db_pool_checkout_seconds, db_pool_timeouts_total
+from src.core.metrics.registry import registry
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+    from sqlalchemy.pool import ConnectionPoolEntry
+
+
+class MeteredQueuePool(AsyncAdaptedQueuePool):
+    """Пул соединений, замеряющий время ожидания соединения и отказы по таймауту."""
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            db_pool_timeouts_total.inc()
+            raise
+        finally:
+            db_pool_checkout_seconds.observe(time.perf_counter() - start)
+
+
+def register_pool_metrics(engine: AsyncEngine, *replicas: AsyncEngine) -> None:
+    """Состояние пулов считывается в момент выгрузки метрик (пул пересоздается при dispose)."""
+    engines = {"primary": engine}
+    engines.update(
+        (f"replica{index}", replica) for index, replica in enumerate(replicas, 1)
+    )
+
+    def collect() -> Iterator[tuple[tuple[str, ...], float]]:
+        for name, pooled in engines.items():
+            pool = pooled.sync_engine.pool
+            yield (name, "size"), pool.size()
+            yield (name, "checked_in"), pool.checkedin()
+            yield (name, "checked_out"), pool.checkedout()
+            yield (name, "overflow"), max(pool.overflow(), 0)
+
+    registry.gauge(
+        "db_pool_connections",
+        "Состояние пулов соединений БД",
+        ("pool", "state"),
+        callback=collect,
+    )
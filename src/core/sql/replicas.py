@@ -0,0 +1,159 @@
+from __future__ import annotations
+from contextvars import ContextVar
+from itertools import cycle
+from typing import TYPE_CHECKING, Any, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+
+from src.core.config import get_settings
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection, Engine, ExecutionContext
+    from sqlalchemy.ext.asyncio import AsyncEngine
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+settings = get_settings()
+
+READ_METHODS = frozenset(("GET", "HEAD"))
+STICKY_COOKIE = "ywstore-primary"
+
+
+class RoutingState:
+    """Состояние маршрутизации одного HTTP-запроса."""
+
+    __slots__ = ("read_only", "wrote")
+
+    def __init__(self, read_only: bool) -> None:
+        self.read_only = read_only
+        self.wrote = False
+
+
+_routing_state: ContextVar[RoutingState | None] = ContextVar(
+    "sql_routing_state",
+    default=None,
+)
+
+
+class ReplicaRouter:
+    """Набор реплик для чтения; реплика выбирается по кругу для каждой сессии."""
+
+    def __init__(self) -> None:
+        self.engines: list[AsyncEngine] = []
+        self._next = None
+
+    def configure(self, engines: Sequence[AsyncEngine]) -> None:
+        self.engines = list(engines)
+        self._next = cycle(self.engines) if self.engines else None
+
+    @property
+    def readable(self) -> bool:
+        """
+        Можно ли сейчас читать с реплики: реплики есть, запрос читающий,
+        клиент недавно ничего не записал и ответ не пойдет в общий кэш.
+        """
+        state = _routing_state.get()
+        return (
+            self._next is not None
+            and state is not None
+            and state.read_only
+            and not state.wrote
+        )
+
+    def choose(self) -> Engine | None:
+        """Реплика для чтения или None, если читать нужно с основного сервера."""
+        if not self.readable:
+            return None
+        return next(self._next).sync_engine
+
+
+replica_router = ReplicaRouter()
+
+
+def read_from_primary() -> None:
+    """
+    Читать с основного сервера до конца запроса. Нужен, когда ответ сохраняется
+    в общий кэш: отстающая реплика вернула бы данные старше последнего сброса
+    кэша, и они хранились бы под новой версией весь срок жизни записи.
+    """
+    state = _routing_state.get()
+    if state is not None:
+        state.read_only = False
+
+
+class RoutingSession(Session):
+    """
+    Сессия, отправляющая SELECT на реплику, а все остальное - на основной сервер.
+    После первой записи или SELECT ... FOR UPDATE сессия до конца читает с основного сервера,
+    чтобы не увидеть данные старше собственных изменений.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kwargs) -> Engine:
+        primary = super().get_bind(mapper=mapper, clause=clause, **kwargs)
+        if self.info.get("primary") or self._flushing:
+            return primary
+        if not isinstance(clause, Select) or clause._for_update_arg is not None:
+            self.info["primary"] = True
+            return primary
+        if "replica" not in self.info:
+            self.info["replica"] = replica_router.choose()
+        if self.info["replica"] is None or not replica_router.readable:
+            return primary
+        return self.info["replica"]
+
+
+def _mark_write(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: ExecutionContext,
+    executemany: bool,
+) -> None:
+    state = _routing_state.get()
+    if state is not None and (context.isinsert or context.isupdate or context.isdelete):
+        state.wrote = True
+
+
+def track_writes(engine: AsyncEngine) -> None:
+    """Отмечать запись в основную БД, чтобы включить чтение своих записей для клиента."""
+    if not event.contains(engine.sync_engine, "before_cursor_execute", _mark_write):
+        event.listen(engine.sync_engine, "before_cursor_execute", _mark_write)
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Разрешает чтение с реплик в GET/HEAD-запросах.
+    После записи клиент получает cookie, и в течение POSTGRES_REPLICA_STICKINESS секунд
+    его запросы читают с основного сервера - реплика могла еще не получить изменения.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not replica_router.engines:
+            await self.app(scope, receive, send)
+            return
+
+        sticky = STICKY_COOKIE in HTTPConnection(scope).cookies
+        state = RoutingState(read_only=scope["method"] in READ_METHODS and not sticky)
+        token = _routing_state.set(state)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and state.wrote:
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Set-Cookie",
+                    f"{STICKY_COOKIE}=1; Max-Age={settings.postgres.POSTGRES_REPLICA_STICKINESS}; "
+                    "Path=/; HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _routing_state.reset(token)
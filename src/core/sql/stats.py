@@ -0,0 +1,168 @@
+from __future__ import annotations
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Iterator
+import logging
+import time
+
+from sqlalchemy import event
+from starlette.datastructures import MutableHeaders
+
+from src.core.config import get_settings
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection, ExecutionContext
+    from sqlalchemy.ext.asyncio import AsyncEngine
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+_collectors: ContextVar[tuple[QueryStats, ...]] = ContextVar(
+    "sql_query_collectors",
+    default=(),
+)
+
+
+class QueryStats:
+    """Статистика SQL-запросов, выполненных в рамках одного запроса (или блока кода)."""
+
+    __slots__ = ("count", "duration", "rows", "statements")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration = 0.0
+        self.rows = 0
+        self.statements: Counter[str] = Counter()
+
+    def add(self, statement: str, duration: float, rows: int) -> None:
+        self.count += 1
+        self.duration += duration
+        self.rows += max(rows, 0)
+        self.statements[statement] += 1
+
+    def repeated(self, threshold: int | None = None) -> dict[str, int]:
+        """Одинаковые запросы, выполненные не менее threshold раз — признак N+1."""
+        threshold = threshold or settings.SQL_NPLUSONE_THRESHOLD
+        return {
+            statement: count
+            for statement, count in self.statements.items()
+            if count >= threshold
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "db_queries": self.count,
+            "db_time_ms": round(self.duration * 1000, 2),
+            "db_rows": self.rows,
+        }
+
+
+@contextmanager
+def collect_queries() -> Iterator[QueryStats]:
+    """
+    Собрать статистику запросов к БД, выполненных внутри блока.
+    Блоки могут быть вложенными: запрос учитывается во всех активных сборщиках.
+    >>> with collect_queries() as stats:
+    >>>     await session.execute(select(User))
+    >>> stats.count
+    1
+    """
+    stats = QueryStats()
+    token = _collectors.set((*_collectors.get(), stats))
+    try:
+        yield stats
+    finally:
+        _collectors.reset(token)
+
+
+def _rowcount(cursor: Any) -> int:
+    # asyncpg-адаптер не заполняет rowcount для SELECT, строки лежат в буфере курсора
+    if cursor.rowcount >= 0:
+        return cursor.rowcount
+    return len(getattr(cursor, "_rows", ()))
+
+
+def _before_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: ExecutionContext,
+    executemany: bool,
+) -> None:
+    if _collectors.get():
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: ExecutionContext,
+    executemany: bool,
+) -> None:
+    collectors = _collectors.get()
+    if not collectors or not conn.info.get("query_start_time"):
+        return
+    duration = time.perf_counter() - conn.info["query_start_time"].pop()
+    rows = _rowcount(cursor)
+    for stats in collectors:
+        stats.add(statement, duration, rows)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Подключить подсчет запросов к движку. Повторный вызов ничего не меняет."""
+    sync_engine = engine.sync_engine
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class QueryStatsMiddleware:
+    """
+    Считает запросы к БД, время и строки на каждый HTTP-запрос.
+    Пишет итог в лог, предупреждает о повторяющихся запросах (N+1),
+    в режиме DEBUG дополнительно отдает статистику в заголовках X-DB-*.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with collect_queries() as stats:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start" and settings.DEBUG:
+                    headers = MutableHeaders(scope=message)
+                    headers["X-DB-Query-Count"] = str(stats.count)
+                    headers["X-DB-Time"] = f"{stats.duration * 1000:.2f}"
+                    headers["X-DB-Rows"] = str(stats.rows)
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+        logger.info(
+            "%s %s: %d запросов к БД за %.2f мс, строк: %d",
+            scope["method"],
+            scope["path"],
+            stats.count,
+            stats.duration * 1000,
+            stats.rows,
+            extra={"method": scope["method"], "path": scope["path"], **stats.as_dict()},
+        )
+        for statement, count in stats.repeated().items():
+            logger.warning(
+                "%s %s: запрос выполнен %d раз, возможна проблема N+1: %s",
+                scope["method"],
+                scope["path"],
+                count,
+                statement,
+            )
@@ -0,0 +1,126 @@
+from __future__ import annotations
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Callable
+import logging
+
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_session as proxying_session
+from sqlalchemy.orm import Session
+
+if TYPE_CHECKING:
+    from fastapi import Request, Response
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.orm import SessionTransaction
+    from sqlalchemy.engine import Connection
+
+logger = logging.getLogger(__name__)
+
+AfterCommit = Callable[[], Awaitable[None]]
+
+
+class UnitOfWork:
+    """
+    Единица работы HTTP-запроса: репозитории только изменяют сессию,
+    а фиксируется все одним коммитом после успешного выполнения эндпоинта.
+    Сессии попадают сюда сами, когда в них начинается транзакция.
+    """
+
+    def __init__(self) -> None:
+        self._sessions: list[AsyncSession] = []
+        self._after_commit: list[AfterCommit] = []
+
+    def register(self, session: AsyncSession) -> None:
+        if session not in self._sessions:
+            self._sessions.append(session)
+
+    def after_commit(self, callback: AfterCommit) -> None:
+        """Выполнить callback после коммита (например, сбросить кэш)."""
+        self._after_commit.append(callback)
+
+    async def commit(self) -> None:
+        for session in self._sessions:
+            if session.in_transaction():
+                await session.commit()
+        for callback in self._after_commit:
+            try:
+                await callback()
+            except Exception:
+                logger.exception("Ошибка в обработчике после коммита")
+
+    async def rollback(self) -> None:
+        for session in self._sessions:
+            if session.in_transaction():
+                await session.rollback()
+
+
+_unit_of_work: ContextVar[UnitOfWork | None] = ContextVar(
+    "sql_unit_of_work",
+    default=None,
+)
+
+
+def current_unit_of_work() -> UnitOfWork | None:
+    return _unit_of_work.get()
+
+
+@asynccontextmanager
+async def unit_of_work() -> AsyncIterator[UnitOfWork]:
+    """Коммит при успешном выходе из блока, откат при исключении."""
+    uow = UnitOfWork()
+    token = _unit_of_work.set(uow)
+    try:
+        yield uow
+    except BaseException:
+        await uow.rollback()
+        raise
+    else:
+        await uow.commit()
+    finally:
+        _unit_of_work.reset(token)
+
+
+@asynccontextmanager
+async def savepoint(session: AsyncSession) -> AsyncIterator[None]:
+    """
+    Вложенная транзакция: ошибка внутри блока откатывает только его,
+    а остальные изменения запроса сохраняются общим коммитом.
+    >>> async with savepoint(session):
+    >>>     session.add(instance)
+    >>>     await session.flush()
+    """
+    async with session.begin_nested():
+        yield
+
+
+@event.listens_for(Session, "after_begin")
+def _register_session(
+    session: Session,
+    transaction: SessionTransaction,
+    connection: Connection,
+) -> None:
+    uow = _unit_of_work.get()
+    if uow is None:
+        return
+    # Синхронная сессия, которой управляет AsyncSession; ее и коммитим
+    proxy = proxying_session(session)
+    if proxy is not None:
+        uow.register(proxy)
+
+
+class UnitOfWorkRoute(APIRoute):
+    """
+    Маршрут, выполняющий эндпоинт в единице работы.
+    Коммит выполняется до отправки ответа: если он не удался, клиент получит ошибку,
+    а не ответ об успехе.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Awaitable[Response]]:
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            async with unit_of_work():
+                return await handler(request)
+
+        return route_handler
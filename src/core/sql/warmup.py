@@ -0,0 +1,79 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Awaitable, Callable
+import asyncio
+import logging
+
+from fastapi_users_db_sqlalchemy import SQLAlchemyUserDatabase
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.apps.company.repository import CompanyRepository
+from src.apps.employee.repository import EmployeeRepository
+from src.apps.roles.repository import RoleRepository
+from src.apps.users.models import User
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+WarmupQuery = Callable[[AsyncSession], Awaitable]
+
+
+async def _get_user(session: AsyncSession):
+    return await SQLAlchemyUserDatabase(session, User).get(0)
+
+
+async def _get_companies(session: AsyncSession):
+    repository = CompanyRepository(session)
+    await repository.get_profiles()
+    await repository.get_profile(0)
+    await repository.exists(0)
+    return await repository.get_by_pk(0)
+
+
+async def _get_employees(session: AsyncSession):
+    return await EmployeeRepository(session).get(company_pk=0, limit=1)
+
+
+async def _get_roles(session: AsyncSession):
+    return await RoleRepository(session).get()
+
+
+# Запросы горячих маршрутов - выполняются теми же методами репозиториев,
+# поэтому совпадают и кэш компиляции SQLAlchemy, и кэш подготовленных выражений asyncpg
+WARMUP_QUERIES: tuple[WarmupQuery, ...] = (
+    _get_user,
+    _get_companies,
+    _get_employees,
+    _get_roles,
+)
+
+
+async def _warm_connection(connection: AsyncConnection) -> None:
+    async with AsyncSession(bind=connection) as session:
+        for query in WARMUP_QUERIES:
+            await query(session)
+        await session.rollback()
+
+
+async def prewarm_pool(engine: AsyncEngine, connections: int) -> int:
+    """
+    Открыть до connections соединений пула и выполнить на каждом запросы горячих маршрутов.
+    Соединения возвращаются в пул, так что первые запросы не ждут подключения к БД.
+    """
+    connections = min(connections, engine.sync_engine.pool.size())
+    opened = await asyncio.gather(
+        *(engine.connect() for _ in range(connections)),
+        return_exceptions=True,
+    )
+    ready = [
+        connection for connection in opened if not isinstance(connection, BaseException)
+    ]
+    try:
+        await asyncio.gather(*(_warm_connection(connection) for connection in ready))
+    except Exception:
+        logger.exception("Не удалось прогреть соединения с БД")
+    finally:
+        for connection in ready:
+            await connection.close()
+    return len(ready)
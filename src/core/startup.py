@@ -0,0 +1,125 @@
+"""
+Замеры холодного старта: время импорта модулей и шагов инициализации.
+Модуль не импортирует ничего тяжелее стандартной библиотеки, чтобы его можно было
+подключить до импорта приложения:
+    STARTUP_PROFILE=1 python -m src.server
+"""
+from __future__ import annotations
+from contextlib import contextmanager
+from importlib.abc import MetaPathFinder
+from importlib.machinery import (
+    ExtensionFileLoader,
+    ModuleSpec,
+    SourceFileLoader,
+    SourcelessFileLoader,
+)
+from importlib.util import find_spec
+from typing import Iterator, Sequence
+import logging
+import os
+import sys
+import time
+
+logger = logging.getLogger(__name__)
+
+FILE_LOADERS = (SourceFileLoader, SourcelessFileLoader, ExtensionFileLoader)
+
+
+class _ImportTimer(MetaPathFinder):
+    """Оборачивает exec_module загрузчиков файловых модулей и считает собственное время импорта."""
+
+    def __init__(self, profiler: StartupProfiler) -> None:
+        self._profiler = profiler
+        self._stack: list[float] = []
+        self._finding: set[str] = set()
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Sequence[str] | None,
+        target=None,
+    ) -> ModuleSpec | None:
+        if fullname in self._finding:
+            return None
+        self._finding.add(fullname)
+        try:
+            spec = find_spec(fullname)
+        except (ImportError, ValueError):
+            return None
+        finally:
+            self._finding.discard(fullname)
+        loader = getattr(spec, "loader", None)
+        # У файловых модулей свой экземпляр загрузчика, его можно обернуть, не задевая другие модули
+        if not isinstance(loader, FILE_LOADERS):
+            return spec
+        exec_module = loader.exec_module
+
+        def timed_exec_module(module) -> None:
+            self._stack.append(0.0)
+            start = time.perf_counter()
+            try:
+                exec_module(module)
+            finally:
+                total = time.perf_counter() - start
+                children = self._stack.pop()
+                if self._stack:
+                    self._stack[-1] += total
+                self._profiler.imports[fullname] = (total, total - children)
+
+        loader.exec_module = timed_exec_module
+        return spec
+
+
+class StartupProfiler:
+    def __init__(self) -> None:
+        self.imports: dict[str, tuple[float, float]] = {}
+        self.phases: list[tuple[str, float]] = []
+        self._timer: _ImportTimer | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._timer is not None
+
+    def install(self) -> None:
+        if self._timer is None:
+            self._timer = _ImportTimer(self)
+            sys.meta_path.insert(0, self._timer)
+
+    def uninstall(self) -> None:
+        if self._timer is not None:
+            sys.meta_path.remove(self._timer)
+            self._timer = None
+
+    def install_from_env(self) -> None:
+        if os.environ.get("STARTUP_PROFILE", "").lower() in ("1", "true", "yes"):
+            self.install()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Замерить шаг инициализации (учитывается всегда, это дешево)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start))
+
+    def report(self, limit: int = 25) -> None:
+        for name, duration in self.phases:
+            logger.info("Старт: %s - %.1f мс", name, duration * 1000)
+        if not self.imports:
+            return
+        slowest = sorted(
+            self.imports.items(),
+            key=lambda item: item[1][1],
+            reverse=True,
+        )
+        for name, (total, own) in slowest[:limit]:
+            logger.info(
+                "Импорт %s: собственное %.1f мс, всего %.1f мс",
+                name,
+                own * 1000,
+                total * 1000,
+            )
+
+
+startup_profiler = StartupProfiler()
@@ -1,6 +1,7 @@
 from __future__ import annotations
-from typing import Optional, Any
+from typing import Optional, Any, Callable
 from copy import deepcopy
+import inspect
 from pydantic import BaseModel, create_model
 from pydantic.fields import FieldInfo
 from src.core.config import get_settings
@@ -34,3 +35,32 @@ def optional(cls: type[BaseModel]) -> type[BaseModel]:
         __module__=cls.__module__,
         **fields_in_partial_mode,
     )
+
+
+def _resolve_annotation(annotation: Any, globalns: dict) -> Any:
+    if not isinstance(annotation, str):
+        return annotation
+    try:
+        return eval(annotation, globalns)  # nosec:B307
+    except NameError:
+        return annotation
+
+
+def resolve_signature(func: Callable) -> inspect.Signature:
+    """
+    !! Вычисляет строковые аннотации (from __future__ import annotations) в модуле
+    самой функции. Нужно декораторам эндпоинтов: FastAPI разрешает аннотации
+    в globals обертки, а не исходной функции.
+    Имена, доступные только под TYPE_CHECKING, остаются строками.
+    """
+    signature = inspect.signature(func)
+    globalns = getattr(inspect.unwrap(func), "__globals__", {})
+    return signature.replace(
+        parameters=[
+            parameter.replace(
+                annotation=_resolve_annotation(parameter.annotation, globalns),
+            )
+            for parameter in signature.parameters.values()
+        ],
+        return_annotation=_resolve_annotation(signature.return_annotation, globalns),
+    )
@@ -1,18 +1,51 @@
 from contextlib import asynccontextmanager
+import asyncio
+import logging
+
 import aioredis
-from fastapi_cache import FastAPICache
-from fastapi import FastAPI
-from fastapi_cache.backends.redis import RedisBackend
-from src.core.sql.database import engine
+from fastapi import Depends, FastAPI
+from src.core.sql.database import engine, replica_engines
+from src.core.sql.replicas import ReplicaRoutingMiddleware
+from src.core.sql.stats import QueryStatsMiddleware
+from src.core.sql.warmup import prewarm_pool
+from src.core.startup import startup_profiler
+from src.core.auth.refresh import refresh_tokens
+from src.core.auth.revocation import token_revocations
 from src.core.auth.strategy import (
-    auth_router,
+    login_router,
+    logout_router,
+    refresh_router,
     register_router,
 )
+from src.core.cache import response_cache
+from src.core.idempotency import idempotency_store
+from src.core.compression import CompressionMiddleware
 from src.core.config import get_settings
+from src.core.responses import FastJSONResponse
+from src.core.jobs import job_runner
+from src.core.metrics import MetricsMiddleware, metrics
+from src.core.health import health_router
+from src.core.outbox import outbox_relay
+from src.core.profiling import SlowRequestProfilerMiddleware, slow_request_profiler
+from src.core.profiling.routes import profiling_router
+from src.core.ratelimit import (
+    expensive_operations,
+    login_limit,
+    rate_limiter,
+    register_limit,
+)
+from src.apps.cart.routes import cart_router
+from src.apps.cart.storage import cart_storage
+from src.apps.catalog.facets import facet_index
+from src.apps.catalog.routes import catalog_router
 from src.apps.company.routes import company_router
+from src.apps.orders.routes import orders_router
+from src.apps.orders.sweeper import reservation_sweeper
+from src.apps.employee.archiver import employee_archiver
 from src.apps.employee.routes import employee_router
 from src.apps.roles.routes import roles_router
 from src.apps.users.routes import users_router
+from src.apps.users.password import password_helper
 
 description = """
 # Статус - в разработке ⚙️
@@ -31,6 +64,7 @@ description = """
 
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
 
 
 class YWStoreAPI(FastAPI):
@@ -39,18 +73,65 @@ class YWStoreAPI(FastAPI):
         self.router.prefix = settings.BASE_API_PREFIX
 
 
+async def prewarm(*redis_clients: aioredis.Redis) -> None:
+    """Открыть соединения с БД и Redis и загрузить backend bcrypt до первых запросов."""
+    warmed = await prewarm_pool(engine, settings.postgres.POSTGRES_POOL_PREWARM)
+    logger.info("Прогрето соединений с БД: %s", warmed)
+    await asyncio.gather(
+        *(client.ping() for client in redis_clients),
+        return_exceptions=True,
+    )
+    password_helper.context.handler().get_backend()
+
+
 @asynccontextmanager
 async def lifespan(app: YWStoreAPI):
-    redis = aioredis.from_url(
-        f"redis://{settings.redis.REDIS_HOST}:{settings.redis.REDIS_PORT}",
-        encoding="utf-8",
-        decode_responses=True,
-    )
-    FastAPICache.init(RedisBackend(redis), prefix="ywstore-cache")
+    redis_url = f"redis://{settings.redis.REDIS_HOST}:{settings.redis.REDIS_PORT}"
+    redis = aioredis.from_url(redis_url, encoding="utf-8", decode_responses=True)
+    cache_redis = aioredis.from_url(redis_url)
+    response_cache.init(cache_redis, prefix="ywstore-cache")
+    if settings.ratelimit.RATE_LIMIT_ENABLED:
+        rate_limiter.init(redis, prefix=settings.ratelimit.RATE_LIMIT_PREFIX)
+    cart_storage.init(redis, prefix=settings.cart.CART_PREFIX)
+    idempotency_store.init(cache_redis, prefix=settings.idempotency.IDEMPOTENCY_PREFIX)
+    token_revocations.init(redis, prefix=settings.auth.AUTH_PREFIX)
+    refresh_tokens.init(redis, prefix=settings.auth.AUTH_PREFIX)
+    app.state.redis = redis
+    if settings.postgres.POSTGRES_POOL_PREWARM:
+        with startup_profiler.phase("prewarm"):
+            await prewarm(redis, cache_redis)
+    with startup_profiler.phase("jobs"):
+        await job_runner.start(redis)
+    with startup_profiler.phase("outbox"):
+        await outbox_relay.start(redis)
+    await token_revocations.start()
+    await facet_index.start()
+    await reservation_sweeper.start()
+    await employee_archiver.start()
+    if settings.profiling.PROFILING_SLOW_REQUESTS:
+        slow_request_profiler.start()
+    startup_profiler.report()
+    app.state.ready = True
     yield
+    app.state.ready = False
+    slow_request_profiler.stop()
+    await facet_index.stop()
+    await token_revocations.stop()
+    await reservation_sweeper.stop()
+    await employee_archiver.stop()
+    await outbox_relay.stop()
+    await job_runner.stop()
+    response_cache.reset()
+    rate_limiter.reset()
+    cart_storage.reset()
+    idempotency_store.reset()
+    token_revocations.reset()
+    refresh_tokens.reset()
+    await cache_redis.close()
     await redis.close()
-    await engine.clear_compiled_cache()
-    await engine.dispose()
+    for _engine in (engine, *replica_engines):
+        _engine.clear_compiled_cache()
+        await _engine.dispose()
 
 
 app = YWStoreAPI(
@@ -60,6 +141,7 @@ app = YWStoreAPI(
     docs_url=settings.BASE_API_PREFIX + "/docs",
     version=str(settings.API_VERSION_INT) + ".0",
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
     contact={
         "name": "Danil Fedorov",
         "url": "https://t.me/youngWishes",
@@ -67,9 +149,33 @@ app = YWStoreAPI(
     },
 )
 
-app.include_router(auth_router, tags=["auth"], prefix="/auth/jwt")
-app.include_router(register_router, tags=["auth"], prefix="/auth")
+app.add_middleware(ReplicaRoutingMiddleware)
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(QueryStatsMiddleware)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(SlowRequestProfilerMiddleware)
+
+app.add_route("/metrics", metrics, include_in_schema=False)
+app.include_router(
+    login_router,
+    tags=["auth"],
+    prefix="/auth/jwt",
+    dependencies=[Depends(login_limit), Depends(expensive_operations)],
+)
+app.include_router(logout_router, tags=["auth"], prefix="/auth/jwt")
+app.include_router(refresh_router, tags=["auth"], prefix="/auth/jwt")
+app.include_router(
+    register_router,
+    tags=["auth"],
+    prefix="/auth",
+    dependencies=[Depends(register_limit), Depends(expensive_operations)],
+)
 app.include_router(company_router, tags=["company"], prefix="/company")
+app.include_router(catalog_router, tags=["catalog"], prefix="/catalog")
+app.include_router(cart_router, tags=["cart"], prefix="/cart")
+app.include_router(orders_router, tags=["orders"], prefix="/orders")
 app.include_router(employee_router, tags=["employees"], prefix="/employees")
 app.include_router(roles_router, tags=["roles"], prefix="/roles")
 app.include_router(users_router, tags=["users"], prefix="/users")
+app.include_router(health_router, tags=["health"], prefix="/health")
+app.include_router(profiling_router, tags=["profiling"], prefix="/profiling")
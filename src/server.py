@@ -0,0 +1,162 @@
+"""
+Запуск приложения.
+    python -m src.server
+
+SERVER_MODE=development - uvicorn с перезагрузкой по изменению файлов, один процесс.
+SERVER_MODE=production - несколько воркеров под управлением супервизора:
+приложение импортируется один раз в мастер-процессе (preload), воркеры создаются fork-ом
+и получают уже загруженные модули и настройки, поэтому у всех воркеров один SECRET_KEY.
+Воркер перезапускается после SERVER_LIMIT_MAX_REQUESTS запросов (с разбросом,
+чтобы воркеры не уходили на перезапуск одновременно) или при аварийном завершении.
+STARTUP_PROFILE=1 - вывести в лог время импорта модулей приложения.
+"""
+from __future__ import annotations
+from src.core.startup import startup_profiler
+
+startup_profiler.install_from_env()
+
+from typing import TYPE_CHECKING  # noqa: E402
+import logging  # noqa: E402
+import multiprocessing  # noqa: E402
+import os  # noqa: E402
+import random  # noqa: E402
+import signal  # noqa: E402
+import threading  # noqa: E402
+
+import uvicorn  # noqa: E402
+from uvicorn.importer import import_from_string  # noqa: E402
+
+from src.core.config import get_settings  # noqa: E402
+
+if TYPE_CHECKING:
+    from multiprocessing.process import BaseProcess
+    from socket import socket
+    from types import FrameType
+
+settings = get_settings()
+logger = logging.getLogger("uvicorn.error")
+
+APP = "src.main:app"
+
+
+def worker_count() -> int:
+    """SERVER_WORKERS или количество доступных процессу ядер."""
+    if settings.server.SERVER_WORKERS:
+        return settings.server.SERVER_WORKERS
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # pragma: no cover
+        return os.cpu_count() or 1
+
+
+def _serve(
+    config: uvicorn.Config,
+    sockets: list[socket],
+    limit_max_requests: int | None,
+) -> None:
+    config.limit_max_requests = limit_max_requests
+    uvicorn.Server(config).run(sockets=sockets)
+
+
+class Supervisor:
+    """Мастер-процесс: держит сокет, создает воркеры и перезапускает завершившиеся."""
+
+    def __init__(self, config: uvicorn.Config, workers: int) -> None:
+        self.config = config
+        self.workers = workers
+        self.processes: list[BaseProcess] = []
+        self._context = multiprocessing.get_context("fork")
+        self._stopping = threading.Event()
+
+    @staticmethod
+    def _limit_max_requests() -> int | None:
+        # У каждого воркера свой лимит запросов, чтобы перезапуски не совпадали по времени
+        limit = settings.server.SERVER_LIMIT_MAX_REQUESTS
+        if not limit:
+            return None
+        jitter = settings.server.SERVER_LIMIT_MAX_REQUESTS_JITTER
+        return limit + random.randint(0, jitter)
+
+    def _spawn(self, sockets: list[socket]) -> BaseProcess:
+        process = self._context.Process(
+            target=_serve,
+            kwargs={
+                "config": self.config,
+                "sockets": sockets,
+                "limit_max_requests": self._limit_max_requests(),
+            },
+        )
+        process.start()
+        logger.info("Запущен воркер [%s]", process.pid)
+        return process
+
+    def _handle_exit(self, sig: int, frame: FrameType | None) -> None:
+        self._stopping.set()
+
+    def run(self) -> None:
+        sockets = [self.config.bind_socket()]
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, self._handle_exit)
+        logger.info("Мастер-процесс [%s], воркеров: %s", os.getpid(), self.workers)
+        self.processes = [self._spawn(sockets) for _ in range(self.workers)]
+        while not self._stopping.wait(settings.server.SERVER_MONITOR_INTERVAL):
+            for index, process in enumerate(self.processes):
+                if not process.is_alive():
+                    logger.info(
+                        "Воркер [%s] завершился с кодом %s",
+                        process.pid,
+                        process.exitcode,
+                    )
+                    process.join()
+                    self.processes[index] = self._spawn(sockets)
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """Мягкая остановка: SIGTERM воркерам, ожидание текущих запросов, затем SIGKILL."""
+        for process in self.processes:
+            if process.is_alive():
+                process.terminate()
+        timeout = (settings.server.SERVER_GRACEFUL_TIMEOUT or 0) + 5
+        for process in self.processes:
+            process.join(timeout)
+            if process.is_alive():
+                logger.warning("Воркер [%s] не завершился вовремя", process.pid)
+                process.kill()
+                process.join()
+
+
+def build_config(**kwargs) -> uvicorn.Config:
+    return uvicorn.Config(
+        APP,
+        host=settings.server.SERVER_HOST,
+        port=settings.server.SERVER_PORT,
+        loop="uvloop",
+        http="httptools",
+        backlog=settings.server.SERVER_BACKLOG,
+        timeout_keep_alive=settings.server.SERVER_KEEPALIVE,
+        timeout_graceful_shutdown=settings.server.SERVER_GRACEFUL_TIMEOUT,
+        proxy_headers=True,
+        **kwargs,
+    )
+
+
+def main() -> None:
+    if settings.server.SERVER_MODE == "development":
+        uvicorn.run(
+            APP,
+            host=settings.server.SERVER_HOST,
+            port=settings.server.SERVER_PORT,
+            reload=True,
+        )
+        return
+    config = build_config(access_log=settings.server.SERVER_ACCESS_LOG)
+    with startup_profiler.phase(f"import {APP}"):
+        config.app = import_from_string(APP)
+    startup_profiler.uninstall()
+    startup_profiler.report()
+    startup_profiler.phases.clear()
+    Supervisor(config, worker_count()).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Sequence
+
+import pytest
+from sqlalchemy import text
+
+from src.apps.employee.models import Employee
+from src.apps.employee.repository import EmployeeRepository
+from src.benchmarks.plans import explain, summarize_plan
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from src.apps.company.models import Company
+    from src.apps.users.models import User
+
+
+def test_summarize_plan():
+    """В сводку попадают только сканирования указанной таблицы"""
+    explained = [
+        {
+            "Plan": {
+                "Node Type": "Nested Loop",
+                "Plans": [
+                    {
+                        "Node Type": "Index Only Scan",
+                        "Relation Name": "employees",
+                        "Index Name": "ix_employees_company_active",
+                        "Heap Fetches": 0,
+                        "Actual Rows": 20,
+                    },
+                    {
+                        "Node Type": "Index Scan",
+                        "Relation Name": "users",
+                        "Index Name": "users_pkey",
+                        "Actual Rows": 1,
+                    },
+                ],
+            },
+            "Execution Time": 0.42,
+        },
+    ]
+    summary = summarize_plan(explained, "employees")
+    assert summary["index_only_scan"] is True
+    assert summary["execution_ms"] == 0.42
+    assert summary["scans"] == [
+        {
+            "node": "Index Only Scan",
+            "index": "ix_employees_company_active",
+            "heap_fetches": 0,
+            "rows": 20,
+        },
+    ]
+    assert summarize_plan(explained, "users")["index_only_scan"] is False
+
+
+@pytest.mark.anyio
+async def test_directory_query_uses_index(
+    session: AsyncSession,
+    create_test_company: Company,
+    create_test_users: Sequence[User],
+):
+    """
+    Справочник читает employees по индексу. extra_data в индекс не входит,
+    поэтому index-only scan невозможен и таблица дочитывается для строк страницы.
+    """
+    for user in create_test_users:
+        session.add(
+            Employee(  # type: ignore[call-arg]
+                company_id=create_test_company.id,
+                user_id=user.id,
+                telegram="@employee",
+                is_active=True,
+            ),
+        )
+    await session.commit()
+    for parameter in ("enable_seqscan", "enable_bitmapscan"):
+        await session.execute(text(f"SET LOCAL {parameter} = off"))
+    repository = EmployeeRepository(session=session)
+    statement = repository.directory_query(create_test_company.id, limit=50)
+    summary = summarize_plan(await explain(session, statement), "employees")
+    await session.rollback()
+    assert summary["scans"]
+    assert all(scan["node"] == "Index Scan" for scan in summary["scans"])
+    assert summary["index_only_scan"] is False
@@ -0,0 +1,40 @@
+from __future__ import annotations
+from random import Random
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.benchmarks.runner import Scenario, percentile, run_scenario
+from src.main import app
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient, Response
+
+
+def test_percentile_nearest_rank():
+    """Перцентили считаются методом ближайшего ранга"""
+    values = [float(value) for value in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 95) == 95.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([], 50) == 0.0
+
+
+@pytest.mark.anyio
+async def test_run_scenario_report(async_client: AsyncClient):
+    """Отчет сценария содержит задержки, пропускную способность и число запросов к БД"""
+
+    async def companies_list(client: AsyncClient, random: Random) -> Response:
+        return await client.get(app.url_path_for("companies_list"))
+
+    report = await run_scenario(
+        async_client,
+        Scenario("companies_list", companies_list),
+        requests=20,
+        concurrency=4,
+    )
+    assert report["requests"] == 20
+    assert report["errors"] == 0
+    assert report["throughput_rps"] > 0
+    assert report["latency_ms"]["p50"] <= report["latency_ms"]["p99"]
+    assert report["queries_per_request"]["max"] >= 1
@@ -0,0 +1,109 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, AsyncGenerator, Callable, ContextManager
+
+import aioredis
+import pytest
+from fastapi import status
+
+from src.apps.cart.storage import cart_storage
+from src.core.config import get_settings
+from src.main import app
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+    from src.apps.catalog.models import Product
+    from src.apps.users.models import User
+    from src.core.sql.stats import QueryStats
+
+settings = get_settings()
+
+
+@pytest.fixture(autouse=True)
+async def storage(create_test_user: User) -> AsyncGenerator[None, None]:
+    redis = aioredis.from_url(
+        f"redis://{settings.redis.REDIS_HOST}:{settings.redis.REDIS_PORT}",
+        decode_responses=True,
+    )
+    cart_storage.init(redis, prefix="ywstore-cart-test")
+    yield
+    await cart_storage.clear(create_test_user.id)
+    cart_storage.reset()
+    await redis.close()
+
+
+@pytest.mark.anyio
+async def test_cart_changes_do_not_touch_database(
+    authorized_client: AsyncClient,
+    query_budget: Callable[[int], ContextManager[QueryStats]],
+):
+    """Клики по корзине идут только в Redis"""
+    with query_budget(0):
+        url = app.url_path_for("add_to_cart")
+        response = await authorized_client.post(url, json={"variant_id": 1})
+        assert response.json() == {"variant_id": 1, "quantity": 1}
+        response = await authorized_client.post(
+            url,
+            json={"variant_id": 1, "quantity": 2},
+        )
+        assert response.json() == {"variant_id": 1, "quantity": 3}
+        url = app.url_path_for("update_cart_item", variant_pk=1)
+        response = await authorized_client.put(url, json={"quantity": 1000})
+        assert response.json()["quantity"] == settings.cart.CART_MAX_QUANTITY
+        url = app.url_path_for("remove_from_cart", variant_pk=1)
+        response = await authorized_client.delete(url)
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+
+@pytest.mark.anyio
+async def test_cart_items_limit(
+    authorized_client: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(settings.cart, "CART_MAX_ITEMS", 2)
+    url = app.url_path_for("add_to_cart")
+    for variant_pk in (1, 2):
+        response = await authorized_client.post(url, json={"variant_id": variant_pk})
+        assert response.status_code == status.HTTP_200_OK
+    response = await authorized_client.post(url, json={"variant_id": 3})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    # Существующую позицию менять можно
+    response = await authorized_client.post(url, json={"variant_id": 2})
+    assert response.json()["quantity"] == 2
+
+
+@pytest.mark.anyio
+async def test_cart_prices_and_checkout(
+    authorized_client: AsyncClient,
+    create_test_product: Product,
+):
+    in_stock, out_of_stock, _ = create_test_product.variants
+    url = app.url_path_for("add_to_cart")
+    await authorized_client.post(url, json={"variant_id": in_stock.id, "quantity": 2})
+    await authorized_client.post(url, json={"variant_id": out_of_stock.id})
+    await authorized_client.post(url, json={"variant_id": 10**6})
+
+    response = await authorized_client.get(app.url_path_for("cart_detail"))
+    cart = response.json()
+    assert [item["status"] for item in cart["items"]] == [
+        "ok",
+        "insufficient_stock",
+        "unavailable",
+    ]
+    assert cart["items"][0]["line_total"] == "1980.00"
+    assert cart["is_valid"] is False
+
+    response = await authorized_client.post(app.url_path_for("cart_checkout"))
+    assert response.status_code == status.HTTP_409_CONFLICT
+
+    for variant_pk in (out_of_stock.id, 10**6):
+        url = app.url_path_for("remove_from_cart", variant_pk=variant_pk)
+        await authorized_client.delete(url)
+    response = await authorized_client.post(app.url_path_for("cart_checkout"))
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["total"] == "1980.00"
+
+
+@pytest.mark.anyio
+async def test_cart_requires_token(async_client: AsyncClient):
+    response = await async_client.get(app.url_path_for("cart_detail"))
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
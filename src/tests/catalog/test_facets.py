@@ -0,0 +1,77 @@
+from __future__ import annotations
+from decimal import Decimal
+
+import pytest
+
+from src.apps.catalog.facets import FacetRow, FacetSnapshot, price_labels
+
+
+def _row(product_id, company_id, size, color, price, in_stock=True, category=1):
+    return FacetRow(
+        product_id=product_id,
+        company_id=company_id,
+        company_name=f"Company {company_id}",
+        category=category,
+        size=size,
+        color=color,
+        price=Decimal(price),
+        in_stock=in_stock,
+    )
+
+
+@pytest.fixture
+def snapshot() -> FacetSnapshot:
+    return FacetSnapshot(
+        [
+            _row(1, 1, "S", "white", 990),
+            _row(1, 1, "M", "white", 990, in_stock=False),
+            _row(1, 1, "M", "black", 1090),
+            _row(2, 1, "L", "black", 4500, category=3),
+            _row(3, 2, "M", "white", 12000, in_stock=False),
+        ],
+        price_bands=[1000, 3000, 5000, 10000],
+    )
+
+
+def _counts(result, facet: str) -> dict:
+    return {count.value: count.count for count in result.facets[facet]}
+
+
+def test_price_labels():
+    assert price_labels([1000, 3000]) == ["0-1000", "1000-3000", "3000+"]
+
+
+def test_products_of_projects_variants_to_products(snapshot: FacetSnapshot):
+    """Товар попадает в выдачу один раз, сколько бы его вариантов ни подошло"""
+    result = snapshot.search({"size": ["M"]})
+    assert (result.total, result.product_ids) == (2, [1, 3])
+    result = snapshot.search({"size": ["M"], "color": ["white"]}, in_stock=True)
+    assert (result.total, result.product_ids) == (0, [])
+
+
+def test_facet_counts_ignore_own_filter(snapshot: FacetSnapshot):
+    result = snapshot.search({"color": ["black"]})
+    assert result.product_ids == [1, 2]
+    assert _counts(result, "color") == {"black": 2, "white": 2}
+    assert _counts(result, "size") == {"L": 1, "M": 1}
+    assert _counts(result, "company") == {1: 2}
+    assert _counts(result, "price") == {"1000-3000": 1, "3000-5000": 1}
+    assert _counts(result, "category") == {1: 1, 3: 1}
+
+
+def test_company_filter_and_pagination(snapshot: FacetSnapshot):
+    result = snapshot.search({"company": [1, 404]}, offset=1, limit=1)
+    assert (result.total, result.product_ids) == (2, [2])
+    assert _counts(result, "company") == {1: 2, 2: 1}
+
+
+def test_selected_values_are_kept_with_zero_count(snapshot: FacetSnapshot):
+    result = snapshot.search({"size": ["L"], "color": ["white"]})
+    assert result.total == 0
+    assert _counts(result, "size") == {"S": 1, "M": 2, "L": 0}
+
+
+def test_empty_snapshot():
+    result = FacetSnapshot([], price_bands=[1000]).search({"size": ["M"]})
+    assert (result.total, result.product_ids) == (0, [])
+    assert all(not counts for counts in result.facets.values())
@@ -0,0 +1,156 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import pytest
+from fastapi import status
+
+from src.apps.catalog.enums import ProductCategory
+from src.apps.catalog.facets import facet_index
+from src.apps.catalog.repository import ProductRepository
+from src.apps.catalog.schemas import ProductIn
+from src.apps.company.models import Company
+from src.main import app
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from src.apps.catalog.models import Product
+
+
+@pytest.mark.anyio
+async def test_create_product(
+    admin_employee_client: AsyncClient,
+    create_test_company: Company,
+    product_init_data: dict,
+):
+    url = app.url_path_for("create_product", company_pk=create_test_company.id)
+    response = await admin_employee_client.post(url, json=product_init_data)
+    assert response.status_code == status.HTTP_201_CREATED
+    product = response.json()
+    assert product["company_id"] == create_test_company.id
+    assert [variant["quantity"] for variant in product["variants"]] == [5, 0, 2]
+
+    response = await admin_employee_client.get(app.url_path_for("products_list"))
+    assert response.status_code == status.HTTP_200_OK
+    (listing,) = response.json()
+    assert listing["product_id"] == product["id"]
+    assert listing["company_name"] == create_test_company.name
+    assert (listing["min_price"], listing["max_price"]) == ("990.00", "1090.00")
+    assert sorted(listing["sizes"]) == ["M", "S"]
+    assert sorted(listing["colors"]) == ["black", "white"]
+    assert listing["in_stock"] is True
+
+
+@pytest.mark.anyio
+async def test_create_product_duplicate_sku(
+    admin_employee_client: AsyncClient,
+    create_test_product: Product,
+    product_init_data: dict,
+):
+    url = app.url_path_for("create_product", company_pk=create_test_product.company_id)
+    response = await admin_employee_client.post(url, json=product_init_data)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.anyio
+async def test_stock_updates_listing(
+    admin_employee_client: AsyncClient,
+    create_test_product: Product,
+):
+    """Когда остатки всех вариантов обнулены, товар в списке помечается отсутствующим"""
+    for variant in create_test_product.variants:
+        url = app.url_path_for(
+            "set_stock",
+            company_pk=create_test_product.company_id,
+            variant_pk=variant.id,
+        )
+        response = await admin_employee_client.put(url, json={"quantity": 0})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"variant_id": variant.id, "quantity": 0}
+    response = await admin_employee_client.get(app.url_path_for("products_list"))
+    assert response.json()[0]["in_stock"] is False
+    url = app.url_path_for("product_detail", product_pk=create_test_product.id)
+    response = await admin_employee_client.get(url)
+    assert {variant["quantity"] for variant in response.json()["variants"]} == {0}
+
+
+@pytest.mark.anyio
+async def test_product_of_another_company(
+    admin_employee_client: AsyncClient,
+    create_test_company: Company,
+    product_init_data: dict,
+    session: AsyncSession,
+):
+    """Администратор компании не может менять товары чужой компании"""
+    other = Company(
+        name="Other",
+        director_fullname="Other",
+        type=1,
+        is_verified=True,
+        is_hidden=False,
+    )  # type: ignore[call-arg]
+    session.add(other)
+    await session.flush()
+    product = await ProductRepository(session=session).create(
+        company_pk=other.id,
+        in_model=ProductIn(**product_init_data),
+    )
+    await session.commit()
+    url = app.url_path_for(
+        "delete_product",
+        company_pk=create_test_company.id,
+        product_pk=product.id,
+    )
+    response = await admin_employee_client.delete(url)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.anyio
+async def test_products_list_filters(
+    async_client: AsyncClient,
+    create_test_product: Product,
+    superuser_client: AsyncClient,
+):
+    url = app.url_path_for("products_list")
+    response = await async_client.get(url, params={"category": ProductCategory.SHOES})
+    assert response.json() == []
+    response = await async_client.get(
+        url,
+        params={
+            "category": ProductCategory.TSHIRTS,
+            "company_pk": create_test_product.company_id,
+        },
+    )
+    assert len(response.json()) == 1
+
+    hide_url = app.url_path_for(
+        "hide_company",
+        company_pk=create_test_product.company_id,
+    )
+    await superuser_client.patch(hide_url, json={"is_hidden": True})
+    response = await async_client.get(url)
+    assert response.json() == []
+
+
+@pytest.mark.anyio
+async def test_products_search(
+    async_client: AsyncClient,
+    create_test_product: Product,
+):
+    await facet_index.rebuild()
+    url = app.url_path_for("products_search")
+    response = await async_client.get(url, params={"size": "M", "in_stock": True})
+    assert response.status_code == status.HTTP_200_OK
+    result = response.json()
+    assert result["total"] == 1
+    assert result["items"][0]["product_id"] == create_test_product.id
+    sizes = {facet["value"]: facet["count"] for facet in result["facets"]["size"]}
+    assert sizes == {"M": 1, "S": 1}
+    prices = {facet["value"]: facet["count"] for facet in result["facets"]["price"]}
+    assert prices == {"0-1000": 1, "1000-3000": 1}
+
+    response = await async_client.get(
+        url,
+        params={"size": "M", "color": "white", "in_stock": True},
+    )
+    assert response.json()["total"] == 0
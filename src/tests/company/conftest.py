@@ -4,6 +4,7 @@ from sqlalchemy.sql import select
 from datetime import datetime
 from src.apps.company.enums import CompanyType
 from src.apps.company.models import Company
+from src.apps.company.repository import refresh_company_profiles
 import random
 
 
@@ -45,6 +46,8 @@ async def create_test_company_many(session: AsyncSession) -> int:
         if data["is_verified"] and not data["is_hidden"]:
             to_response_companies += 1
         session.add(company)
+    await session.flush()
+    await refresh_company_profiles(session)
     await session.commit()
     return to_response_companies
 
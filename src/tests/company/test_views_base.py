@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable, ContextManager
 import pytest
 from fastapi import status
 from src.apps.users.models import User
@@ -14,6 +14,7 @@ from src.apps.company.models import Company
 if TYPE_CHECKING:
     from httpx import AsyncClient
     from sqlalchemy.ext.asyncio import AsyncSession
+    from src.core.sql.stats import QueryStats
 
 
 @pytest.mark.anyio
@@ -240,6 +241,40 @@ async def test_company_detail(
     assert check_object_data(random_company, data=response.json())
 
 
+@pytest.mark.anyio
+async def test_company_detail_from_profile(
+    async_client: AsyncClient,
+    create_test_company: Company,
+    query_budget: Callable[[int], ContextManager[QueryStats]],
+):
+    """Детальное представление читается одной строкой профиля, без соединений"""
+    url = app.url_path_for("company_detail", company_pk=create_test_company.id)
+    with query_budget(1):
+        response = await async_client.get(url, headers={"Cache-Control": "no-cache"})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["id"] == create_test_company.id
+    assert response.json()["employee_count"] == 0
+
+
+@pytest.mark.anyio
+async def test_company_profile_follows_writes(
+    superuser_client: AsyncClient,
+    create_test_company: Company,
+):
+    """Профиль пересобирается той же транзакцией, что и изменение компании"""
+    detail_url = app.url_path_for("company_detail", company_pk=create_test_company.id)
+    response = await superuser_client.get(detail_url)
+    assert response.status_code == status.HTTP_200_OK
+
+    hide_url = app.url_path_for("hide_company", company_pk=create_test_company.id)
+    response = await superuser_client.patch(hide_url, json={"is_hidden": True})
+    assert response.status_code == status.HTTP_200_OK
+    response = await superuser_client.get(detail_url)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    response = await superuser_client.get(app.url_path_for("companies_list"))
+    assert response.json() == []
+
+
 @pytest.mark.anyio
 async def test_verify_company_superuser(
     superuser_client: AsyncClient,
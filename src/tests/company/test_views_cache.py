@@ -0,0 +1,118 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Sequence
+import json
+
+import pytest
+from fastapi import status
+from pydantic import TypeAdapter
+
+from src.apps.company.repository import CompanyRepository
+from src.apps.company.schemas import CompanyOut, CompanyProfileOut
+from src.main import app
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from src.apps.company.models import Company
+
+
+@pytest.mark.anyio
+async def test_companies_list_not_modified(
+    async_client: AsyncClient,
+    create_test_company_many: int,
+):
+    """Повторный запрос с If-None-Match возвращает 304 без тела"""
+    url = app.url_path_for("companies_list")
+    response = await async_client.get(url)
+    etag = response.headers["ETag"]
+    cached_response = await async_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert cached_response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert cached_response.content == b""
+    assert cached_response.headers["ETag"] == etag
+
+
+@pytest.mark.anyio
+async def test_company_detail_etag_changes_after_update(
+    superuser_client: AsyncClient,
+    random_company: Company,
+):
+    """После изменения компании кэш сбрасывается и ETag меняется"""
+    url = app.url_path_for("company_detail", company_pk=random_company.id)
+    response = await superuser_client.get(url)
+    etag = response.headers["ETag"]
+    update_url = app.url_path_for(
+        "update_company_partially",
+        company_pk=random_company.id,
+    )
+    await superuser_client.patch(update_url, json={"name": "Test (Updated)"})
+    updated_response = await superuser_client.get(url, headers={"If-None-Match": etag})
+    assert updated_response.status_code == status.HTTP_200_OK
+    assert updated_response.headers["ETag"] != etag
+    assert updated_response.json()["name"] == "Test (Updated)"
+
+
+@pytest.mark.anyio
+async def test_companies_list_matches_schema_serialization(
+    async_client: AsyncClient,
+    create_test_company_many: int,
+    session: AsyncSession,
+):
+    """Профили, собранные без валидации, совпадают с сериализацией через схему"""
+    url = app.url_path_for("companies_list")
+    response = await async_client.get(url)
+    companies = await CompanyRepository(session=session).get()
+    adapter = TypeAdapter(Sequence[CompanyProfileOut])
+    expected = adapter.dump_json(
+        adapter.validate_python(
+            [
+                {
+                    **CompanyOut.model_validate(
+                        company,
+                        from_attributes=True,
+                    ).model_dump(),
+                    "employee_count": 0,
+                }
+                for company in sorted(companies, key=lambda company: company.id)
+            ],
+        ),
+    )
+    assert json.loads(response.content) == json.loads(expected)
+
+
+@pytest.mark.anyio
+async def test_company_profile_matches_write_response(
+    superuser_client: AsyncClient,
+    random_company: Company,
+):
+    """GET отдает поля компании в том же формате, что и ответ на PATCH"""
+    update_url = app.url_path_for(
+        "update_company_partially",
+        company_pk=random_company.id,
+    )
+    response = await superuser_client.patch(update_url, json={"name": "Test (Updated)"})
+    written = response.json()
+    url = app.url_path_for("company_detail", company_pk=random_company.id)
+    profile = (await superuser_client.get(url)).json()
+    assert {key: profile[key] for key in written} == written
+
+
+@pytest.mark.anyio
+async def test_companies_list_compressed_from_cache(
+    async_client: AsyncClient,
+    create_test_company_many: int,
+):
+    """Большой список сжимается, а сжатый вариант отдается из кэша со своим ETag"""
+    url = app.url_path_for("companies_list")
+    headers = {"Accept-Encoding": "gzip"}
+    response = await async_client.get(url, headers=headers)
+    cached_response = await async_client.get(url, headers=headers)
+    not_modified = await async_client.get(
+        url,
+        headers={**headers, "If-None-Match": response.headers["ETag"]},
+    )
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["ETag"].endswith('-gzip"')
+    assert cached_response.headers["Content-Encoding"] == "gzip"
+    assert cached_response.json() == response.json()
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
@@ -1,12 +1,11 @@
 from __future__ import annotations
 
 import asyncio
+from contextlib import contextmanager
 from copy import copy
-from typing import AsyncGenerator, TYPE_CHECKING, Sequence
+from typing import AsyncGenerator, Callable, ContextManager, TYPE_CHECKING, Sequence
 
 import aioredis
-from fastapi_cache import FastAPICache
-from fastapi_cache.backends.redis import RedisBackend
 import pytest
 from fastapi_users_db_sqlalchemy import SQLAlchemyUserDatabase
 from httpx import AsyncClient
@@ -15,20 +14,27 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import NullPool
 from sqlalchemy.sql import text, select
 
+from src.apps.catalog.enums import ProductCategory
+from src.apps.catalog.repository import ProductRepository
+from src.apps.catalog.schemas import ProductIn
 from src.apps.company.enums import CompanyType
 from src.apps.company.models import Company
+from src.apps.company.repository import refresh_company_profiles
 from src.apps.employee.models import Employee
 from src.apps.roles.enums import CompanyRoles
 from src.core.config import get_settings
-from src.core.sql.database import Base, get_session
+from src.core.sql.database import Base, async_session, get_session
+from src.core.sql.stats import QueryStats, collect_queries, instrument_engine
 from src.apps.users.service import UserService
 from src.apps.users.models import User, Role
 from src.apps.users.schemas import UserIn
+from src.core.cache import ResponseCache, response_cache
 from src.main import app
 from src.tests import defaults
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncEngine
+    from src.apps.catalog.models import Product
     from src.main import YWStoreAPI
 
 settings = get_settings()
@@ -37,6 +43,7 @@ async_engine_main = create_async_engine(
     poolclass=NullPool,
 )
 async_engine_test = create_async_engine(defaults.SQLALCHEMY_DATABASE_TEST_URI)
+instrument_engine(async_engine_test)
 
 
 @pytest.fixture(scope="session")
@@ -69,12 +76,16 @@ def async_session_class(engine: AsyncEngine) -> sessionmaker[AsyncSession]:
 
 
 @pytest.fixture(scope="session")
-def test_app(async_session_class: sessionmaker[AsyncSession]) -> YWStoreAPI:
+def test_app(
+    engine: AsyncEngine,
+    async_session_class: sessionmaker[AsyncSession],
+) -> YWStoreAPI:
     async def get_test_session():
         async with async_session_class() as session:
             yield session
 
     app.dependency_overrides[get_session] = get_test_session
+    async_session.configure(bind=engine)
     return app
 
 
@@ -86,27 +97,49 @@ def event_loop(request):
 
 
 @pytest.fixture(scope="session")
-async def init_redis():
+async def init_redis() -> ResponseCache:
     redis = aioredis.from_url(
         f"redis://{settings.redis.REDIS_HOST}:{settings.redis.REDIS_PORT}",
-        encoding="utf-8",
-        decode_responses=True,
     )
-    FastAPICache.init(RedisBackend(redis), prefix="ywstore-cache")
-    return FastAPICache
+    response_cache.init(redis, prefix="ywstore-cache")
+    return response_cache
 
 
 @pytest.fixture(scope="function", autouse=True)
 async def session(
     async_session_class: sessionmaker[AsyncSession],
-    init_redis: FastAPICache,
+    init_redis: ResponseCache,
 ) -> AsyncGenerator[AsyncSession, None]:
     async with async_session_class() as session:
         yield session
         for table in reversed(Base.metadata.sorted_tables):
             await session.execute(text(f"TRUNCATE {table.name} CASCADE;"))
         await session.commit()
-    await FastAPICache.clear(namespace="ywstore-cache")
+    await init_redis.clear()
+
+
+@pytest.fixture
+def query_budget() -> Callable[[int], ContextManager[QueryStats]]:
+    """
+    Проваливает тест, если внутри блока выполнено больше запросов к БД, чем заявлено.
+    >>> with query_budget(2) as stats:
+    >>>     await client.get(url)
+    """
+
+    @contextmanager
+    def budget(max_queries: int):
+        with collect_queries() as stats:
+            yield stats
+        if stats.count > max_queries:
+            statements = "\n".join(
+                f"{count} x {statement}"
+                for statement, count in stats.statements.items()
+            )
+            pytest.fail(
+                f"Выполнено {stats.count} запросов к БД, бюджет — {max_queries}:\n{statements}",
+            )
+
+    return budget
 
 
 @pytest.fixture
@@ -151,11 +184,21 @@ async def authorized_client(
 async def superuser_client(
     authorized_client: AsyncClient,
     create_test_user: User,
+    get_test_user_data: dict,
     session: AsyncSession,
 ):
     create_test_user.is_superuser = True
     session.add(create_test_user)
     await session.commit()
+    # Права берутся из токена, поэтому после повышения нужен новый вход
+    url = app.url_path_for("auth:jwt.login")
+    credentials = {
+        "username": get_test_user_data.get("email"),
+        "password": get_test_user_data.get("password"),
+    }
+    response = await authorized_client.post(url, data=credentials)
+    access_token = response.json().get("access_token")
+    authorized_client.headers = {"Authorization": f"Bearer {access_token}"}
     return authorized_client
 
 
@@ -263,11 +306,59 @@ async def create_test_company(
 ) -> Company:
     company = Company(**company_init_data, is_verified=True, is_hidden=False)  # type: ignore[call-arg]
     session.add(company)
+    await session.flush()
+    await refresh_company_profiles(session, [company.id])
     await session.commit()
     await session.refresh(company)
     yield company
 
 
+@pytest.fixture
+def product_init_data() -> dict:
+    return {
+        "name": "Футболка basic",
+        "description": "Хлопок 100%",
+        "category": ProductCategory.TSHIRTS,
+        "variants": [
+            {
+                "sku": "TS-BASIC-S-W",
+                "size": "S",
+                "color": "white",
+                "price": "990.00",
+                "quantity": 5,
+            },
+            {
+                "sku": "TS-BASIC-M-W",
+                "size": "M",
+                "color": "white",
+                "price": "990.00",
+                "quantity": 0,
+            },
+            {
+                "sku": "TS-BASIC-M-B",
+                "size": "M",
+                "color": "black",
+                "price": "1090.00",
+                "quantity": 2,
+            },
+        ],
+    }
+
+
+@pytest.fixture
+async def create_test_product(
+    product_init_data: dict,
+    create_test_company: Company,
+    session: AsyncSession,
+) -> Product:
+    product = await ProductRepository(session=session).create(
+        company_pk=create_test_company.id,
+        in_model=ProductIn(**product_init_data),
+    )
+    await session.commit()
+    return product
+
+
 @pytest.fixture
 async def create_company_roles(session: AsyncSession) -> None:
     for role_name in CompanyRoles.list():
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from datetime import datetime, timedelta, timezone
+import secrets
+from typing import TYPE_CHECKING, Callable, ContextManager, Sequence
 
 import pytest
 from fastapi import status
 from sqlalchemy.orm import selectinload
-from sqlalchemy.sql import select
+from sqlalchemy.sql import select, update
 
 from src.apps.company.models import Company
-from src.apps.employee.models import Employee
+from src.apps.employee.archiver import employee_archiver
+from src.apps.employee.models import Employee, EmployeeArchive
 from src.apps.employee.schemas import EmployeeIn, EmployeeOptional
 
 from src.main import app
@@ -17,6 +20,7 @@ from src.tests.helpers import check_object_data
 if TYPE_CHECKING:
     from httpx import AsyncClient
     from sqlalchemy.ext.asyncio import AsyncSession
+    from src.core.sql.stats import QueryStats
 
 
 @pytest.mark.anyio
@@ -195,3 +199,164 @@ async def test_add_new_employee_by_superuser(
     employees_count_after = len(company.employees)
     assert response.status_code == status.HTTP_201_CREATED
     assert employees_count_before == employees_count_after - 1
+
+
+@pytest.mark.anyio
+async def test_get_employees_query_budget(
+    superuser_client: AsyncClient,
+    create_employees_many: Sequence[Employee],
+    query_budget: Callable[[int], ContextManager[QueryStats]],
+):
+    """Список сотрудников загружается фиксированным числом запросов, без N+1"""
+    url = app.url_path_for(
+        "get_employees",
+        company_pk=create_employees_many[0].company_id,
+    )
+    with query_budget(3) as stats:
+        response = await superuser_client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()) == len(create_employees_many)
+    assert not stats.repeated(threshold=2)
+    assert int(response.headers["X-DB-Query-Count"]) == stats.count
+
+
+@pytest.mark.anyio
+async def test_get_employees_long_extra_data(
+    superuser_client: AsyncClient,
+    create_employees_many: Sequence[Employee],
+    session: AsyncSession,
+):
+    """
+    extra_data не входит в ix_employees_company_active: текст длиннее предела
+    строки индекса сохраняется и отдается справочником без изменений
+    """
+    employee = next(e for e in create_employees_many if e.is_active)
+    extra_data = secrets.token_urlsafe(6000)
+    await session.execute(
+        update(Employee)
+        .where(
+            Employee.company_id == employee.company_id,
+            Employee.user_id == employee.user_id,
+        )
+        .values(extra_data=extra_data),
+    )
+    await session.commit()
+    url = app.url_path_for("get_employees", company_pk=employee.company_id)
+    response = await superuser_client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    assert {item["user"]["id"]: item["extra_data"] for item in response.json()}[
+        employee.user_id
+    ] == extra_data
+
+
+@pytest.mark.anyio
+async def test_get_employees_keyset_pages(
+    superuser_client: AsyncClient,
+    create_employees_many: Sequence[Employee],
+):
+    """Страницы по after=user.id последнего сотрудника не теряют и не повторяют записи"""
+    url = app.url_path_for(
+        "get_employees",
+        company_pk=create_employees_many[0].company_id,
+    )
+    active = sorted(e.user_id for e in create_employees_many if e.is_active)
+    seen, params = [], {"limit": 2}
+    while True:
+        response = await superuser_client.get(url, params=params)
+        assert response.status_code == status.HTTP_200_OK
+        page = [employee["user"]["id"] for employee in response.json()]
+        assert len(page) <= 2
+        if not page:
+            break
+        seen.extend(page)
+        params["after"] = page[-1]
+    assert seen == active
+
+
+@pytest.mark.anyio
+async def test_get_employees_search(
+    superuser_client: AsyncClient,
+    create_employees_many: Sequence[Employee],
+    get_test_user_data: dict,
+):
+    """Поиск по ФИО или email и фильтр по роли сужают список"""
+    url = app.url_path_for(
+        "get_employees",
+        company_pk=create_employees_many[0].company_id,
+    )
+    response = await superuser_client.get(
+        url,
+        params={"search": get_test_user_data["first_name"] + "3"},
+    )
+    assert [employee["user"]["id"] for employee in response.json()] == [
+        create_employees_many[2].user_id,
+    ]
+    response = await superuser_client.get(url, params={"role": "Модератор"})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == []
+
+
+@pytest.mark.anyio
+async def test_archive_inactive_employees(
+    session: AsyncSession,
+    superuser_client: AsyncClient,
+    create_employees_many: Sequence[Employee],
+    inactive_employees: Sequence[Employee],
+):
+    """Давно деактивированные сотрудники переносятся в архив, активные остаются"""
+    company_pk = create_employees_many[0].company_id
+    await session.execute(
+        update(Employee)
+        .where(Employee.is_active.is_(False))
+        .values(deactivated_at=datetime.now(timezone.utc) - timedelta(days=365)),
+    )
+    await session.commit()
+
+    assert await employee_archiver.archive_inactive() == len(inactive_employees)
+    assert await employee_archiver.archive_inactive() == 0
+    result = await session.execute(select(Employee.user_id, Employee.is_active))
+    assert all(is_active for _, is_active in result.all())
+
+    url = app.url_path_for("get_archived_employees", company_pk=company_pk)
+    response = await superuser_client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    assert [employee["user_id"] for employee in response.json()] == sorted(
+        employee.user_id for employee in inactive_employees
+    )
+
+
+@pytest.mark.anyio
+async def test_restore_archived_employee(
+    session: AsyncSession,
+    superuser_client: AsyncClient,
+    create_employee: Employee,
+):
+    """Сотрудник из архива возвращается в компанию активным, повторно - нельзя"""
+    delete_url = app.url_path_for(
+        "delete_employee",
+        company_pk=create_employee.company_id,
+        user_pk=create_employee.user_id,
+    )
+    assert (await superuser_client.delete(delete_url)).status_code == 204
+    await session.execute(
+        update(Employee).values(
+            deactivated_at=datetime.now(timezone.utc) - timedelta(days=365),
+        ),
+    )
+    await session.commit()
+    assert await employee_archiver.archive_inactive() == 1
+
+    url = app.url_path_for(
+        "restore_employee",
+        company_pk=create_employee.company_id,
+        user_pk=create_employee.user_id,
+    )
+    response = await superuser_client.post(url)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["is_active"] is True
+    assert response.json()["user"]["id"] == create_employee.user_id
+    archived = await session.execute(select(EmployeeArchive))
+    assert archived.scalars().all() == []
+
+    response = await superuser_client.post(url)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
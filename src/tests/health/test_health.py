@@ -0,0 +1,50 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import aioredis
+import pytest
+from fastapi import status
+
+from src.core.config import get_settings
+from src.main import app
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+    from src.main import YWStoreAPI
+
+settings = get_settings()
+
+
+@pytest.fixture
+async def ready_app(test_app: YWStoreAPI) -> YWStoreAPI:
+    redis = aioredis.from_url(
+        f"redis://{settings.redis.REDIS_HOST}:{settings.redis.REDIS_PORT}",
+    )
+    test_app.state.redis = redis
+    test_app.state.ready = True
+    yield test_app
+    test_app.state.ready = False
+    del test_app.state.redis
+    await redis.close()
+
+
+@pytest.mark.anyio
+async def test_liveness(async_client: AsyncClient):
+    response = await async_client.get(app.url_path_for("liveness"))
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+
+@pytest.mark.anyio
+async def test_readiness_before_startup(async_client: AsyncClient):
+    """До завершения старта приложения воркер не готов принимать трафик"""
+    response = await async_client.get(app.url_path_for("readiness"))
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.json()["ready"] is False
+
+
+@pytest.mark.anyio
+async def test_readiness(ready_app: YWStoreAPI, async_client: AsyncClient):
+    """После старта проверяются соединения с БД и Redis"""
+    response = await async_client.get(app.url_path_for("readiness"))
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"ready": True, "database": True, "redis": True}
@@ -0,0 +1,94 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, AsyncGenerator
+import asyncio
+
+import aioredis
+import pytest
+from fastapi import status
+
+from src.apps.company.models import Company
+from src.core.config import get_settings
+from src.core.idempotency import idempotency_store
+from src.main import app
+from src.tests.helpers import get_objects_count
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+settings = get_settings()
+
+
+@pytest.fixture
+async def store() -> AsyncGenerator[None, None]:
+    redis = aioredis.from_url(
+        f"redis://{settings.redis.REDIS_HOST}:{settings.redis.REDIS_PORT}",
+    )
+    idempotency_store.init(redis, prefix="ywstore-idempotency-test")
+    await idempotency_store.clear()
+    yield
+    await idempotency_store.clear()
+    idempotency_store.reset()
+    await redis.close()
+
+
+@pytest.mark.anyio
+async def test_concurrent_retries_create_one_company(
+    company_init_data: dict,
+    superuser_client: AsyncClient,
+    session: AsyncSession,
+    store: None,
+):
+    """
+    Повторы с тем же Idempotency-Key, пришедшие одновременно с первым запросом,
+    получают его ответ, а компания создается один раз
+    """
+    url = app.url_path_for("register_company")
+    headers = {"Idempotency-Key": "company-1"}
+    responses = await asyncio.gather(
+        *(
+            superuser_client.post(url, json=company_init_data, headers=headers)
+            for _ in range(4)
+        ),
+    )
+    assert {response.status_code for response in responses} == {status.HTTP_201_CREATED}
+    assert len({response.content for response in responses}) == 1
+    replayed = [response.headers.get("Idempotent-Replayed") for response in responses]
+    assert replayed.count("true") == 3
+    assert await get_objects_count(Company, session) == 1
+
+
+@pytest.mark.anyio
+async def test_key_reused_with_other_payload(
+    company_init_data: dict,
+    superuser_client: AsyncClient,
+    store: None,
+):
+    """Тот же ключ с другим телом запроса - 422, а не чужой ответ"""
+    url = app.url_path_for("register_company")
+    headers = {"Idempotency-Key": "company-1"}
+    response = await superuser_client.post(url, json=company_init_data, headers=headers)
+    assert response.status_code == status.HTTP_201_CREATED
+    other = {**company_init_data, "name": "Other"}
+    response = await superuser_client.post(url, json=other, headers=headers)
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.anyio
+async def test_failed_request_is_not_stored(
+    company_init_data: dict,
+    superuser_client: AsyncClient,
+    create_test_company: Company,
+    session: AsyncSession,
+    store: None,
+):
+    """Ошибка не сохраняется: повтор после устранения причины выполняется заново"""
+    url = app.url_path_for("register_company")
+    headers = {"Idempotency-Key": "company-1"}
+    response = await superuser_client.post(url, json=company_init_data, headers=headers)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    await session.delete(create_test_company)
+    await session.commit()
+    response = await superuser_client.post(url, json=company_init_data, headers=headers)
+    assert response.status_code == status.HTTP_201_CREATED
+    assert "Idempotent-Replayed" not in response.headers
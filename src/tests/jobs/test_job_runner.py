@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import asyncio
+
+import aioredis
+import pytest
+
+from src.core.config import get_settings
+from src.core.jobs import JobRunner
+
+settings = get_settings()
+
+TEST_QUEUE: str = "test"
+
+
+@pytest.fixture
+async def redis():
+    client = aioredis.from_url(
+        f"redis://{settings.redis.REDIS_HOST}:{settings.redis.REDIS_PORT}",
+        encoding="utf-8",
+        decode_responses=True,
+    )
+    yield client
+    keys = await client.keys(f"{settings.jobs.JOBS_QUEUE_PREFIX}:{TEST_QUEUE}:*")
+    if keys:
+        await client.delete(*keys)
+    await client.close()
+
+
+@pytest.fixture
+def runner() -> JobRunner:
+    return JobRunner()
+
+
+@pytest.mark.anyio
+async def test_enqueue_without_start_runs_inline(runner: JobRunner):
+    """Пока раннер не запущен, задача выполняется сразу при постановке в очередь"""
+    calls = []
+
+    @runner.job(queue=TEST_QUEUE)
+    async def collect(value: int):
+        calls.append(value)
+
+    await runner.enqueue(collect, value=1)
+    assert calls == [1]
+
+
+@pytest.mark.anyio
+async def test_job_executed_by_worker(runner: JobRunner, redis):
+    """Тест проверяет выполнение задачи воркером из очереди в Redis"""
+    done = asyncio.Event()
+
+    @runner.job(queue=TEST_QUEUE)
+    async def mark_done():
+        done.set()
+
+    await runner.start(redis)
+    await runner.enqueue(mark_done)
+    await asyncio.wait_for(done.wait(), timeout=10)
+    await runner.stop()
+    assert (
+        await redis.zcard(f"{settings.jobs.JOBS_QUEUE_PREFIX}:{TEST_QUEUE}:processing")
+        == 0
+    )
+
+
+@pytest.mark.anyio
+async def test_failed_job_retried(runner: JobRunner, redis):
+    """Тест проверяет повторное выполнение задачи после ошибки"""
+    attempts = []
+    done = asyncio.Event()
+
+    @runner.job(queue=TEST_QUEUE, max_retries=3)
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) < 2:
+            raise RuntimeError
+        done.set()
+
+    await runner.start(redis)
+    await runner.enqueue(flaky)
+    await asyncio.wait_for(done.wait(), timeout=10)
+    await runner.stop()
+    assert len(attempts) == 2
+
+
+@pytest.mark.anyio
+async def test_job_buried_after_max_retries(runner: JobRunner, redis):
+    """Задача, исчерпавшая попытки, попадает в список dead"""
+    failed = asyncio.Event()
+
+    @runner.job(queue=TEST_QUEUE, max_retries=0)
+    async def broken():
+        failed.set()
+        raise RuntimeError
+
+    await runner.start(redis)
+    await runner.enqueue(broken)
+    await asyncio.wait_for(failed.wait(), timeout=10)
+    await runner.stop()
+    assert await redis.llen(f"{settings.jobs.JOBS_QUEUE_PREFIX}:{TEST_QUEUE}:dead") == 1
+
+
+@pytest.mark.anyio
+async def test_stop_drains_running_job(runner: JobRunner, redis):
+    """При остановке раннер дожидается завершения выполняемой задачи"""
+    started = asyncio.Event()
+    finished = []
+
+    @runner.job(queue=TEST_QUEUE)
+    async def slow():
+        started.set()
+        await asyncio.sleep(0.5)
+        finished.append(1)
+
+    await runner.start(redis)
+    await runner.enqueue(slow)
+    await asyncio.wait_for(started.wait(), timeout=10)
+    await runner.stop()
+    assert finished == [1]
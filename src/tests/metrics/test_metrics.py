@@ -0,0 +1,53 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import pytest
+from fastapi import status
+
+from src.core.metrics import MetricsRegistry
+from src.main import app
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+    from src.apps.company.models import Company
+
+
+def test_histogram_render():
+    """Бакеты гистограммы выгружаются накопительно, с +Inf, суммой и количеством"""
+    registry = MetricsRegistry()
+    histogram = registry.histogram("test_seconds", "Test", ("route",), buckets=(0.1, 1))
+    child = histogram.labels("/test")
+    for value in (0.05, 0.1, 0.5, 3):
+        child.observe(value)
+    rendered = registry.render().decode()
+    assert 'test_seconds_bucket{route="/test",le="0.1"} 2' in rendered
+    assert 'test_seconds_bucket{route="/test",le="1"} 3' in rendered
+    assert 'test_seconds_bucket{route="/test",le="+Inf"} 4' in rendered
+    assert 'test_seconds_sum{route="/test"} 3.65' in rendered
+    assert 'test_seconds_count{route="/test"} 4' in rendered
+
+
+@pytest.mark.anyio
+async def test_metrics_route_template(
+    async_client: AsyncClient,
+    create_test_company: Company,
+):
+    """Запросы учитываются по шаблону маршрута, а не по конкретному пути"""
+    url = app.url_path_for("companies_list")
+    await async_client.get(url)
+    detail_url = app.url_path_for("company_detail", company_pk=create_test_company.id)
+    await async_client.get(detail_url)
+    response = await async_client.get("/metrics")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    route = app.url_path_for("company_detail", company_pk="{company_pk}")
+    assert (
+        f'http_requests_total{{method="GET",route="{url}",status="200"}}'
+        in response.text
+    )
+    assert (
+        f'http_requests_total{{method="GET",route="{route}",status="200"}}'
+        in response.text
+    )
+    assert "db_pool_connections" in response.text
+    assert 'cache_requests_total{result="miss"}' in response.text
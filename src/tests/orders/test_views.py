@@ -0,0 +1,176 @@
+from __future__ import annotations
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+
+import pytest
+from fastapi import status
+from sqlalchemy.sql import select, update
+
+from src.apps.catalog.models import Stock
+from src.apps.orders.enums import OrderStatus
+from src.apps.orders.models import Order
+from src.apps.orders.sweeper import reservation_sweeper
+from src.core.cache import response_cache
+from src.main import app
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from src.apps.catalog.models import Product
+
+
+async def _stock(session: AsyncSession, variant_pk: int) -> int:
+    quantity = await session.execute(
+        select(Stock.quantity)
+        .where(Stock.variant_id == variant_pk)
+        .execution_options(populate_existing=True),
+    )
+    return quantity.scalar_one()
+
+
+@pytest.mark.anyio
+async def test_place_order_is_idempotent(
+    authorized_client: AsyncClient,
+    create_test_product: Product,
+    session: AsyncSession,
+):
+    variant = create_test_product.variants[0]
+    url = app.url_path_for("place_order")
+    payload = {"items": [{"variant_id": variant.id, "quantity": 2}]}
+    headers = {"Idempotency-Key": "order-1"}
+    response = await authorized_client.post(url, json=payload, headers=headers)
+    assert response.status_code == status.HTTP_201_CREATED
+    order = response.json()
+    assert order["status"] == OrderStatus.RESERVED
+    assert order["total"] == "1980.00"
+
+    response = await authorized_client.post(url, json=payload, headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["id"] == order["id"]
+    assert await _stock(session, variant.id) == 3
+
+
+@pytest.mark.anyio
+async def test_order_refreshes_cached_stock(
+    authorized_client: AsyncClient,
+    create_test_product: Product,
+):
+    """
+    Карточка товара показывает остатки после каждого списания,
+    а каталог сбрасывается, только когда вариант закончился
+    """
+    available, _, last = create_test_product.variants
+    detail_url = app.url_path_for("product_detail", product_pk=create_test_product.id)
+    order_url = app.url_path_for("place_order")
+
+    def quantities(response) -> dict[int, int]:
+        return {
+            variant["id"]: variant["quantity"]
+            for variant in response.json()["variants"]
+        }
+
+    await authorized_client.get(detail_url)
+    catalog_version = await response_cache.version("catalog")
+    payload = {"items": [{"variant_id": available.id, "quantity": 1}]}
+    await authorized_client.post(order_url, json=payload)
+    assert quantities(await authorized_client.get(detail_url))[available.id] == 4
+    assert await response_cache.version("catalog") == catalog_version
+
+    # Товар еще есть в другом размере, но вариант закончился - меняется индекс фасетов
+    payload = {"items": [{"variant_id": last.id, "quantity": 2}]}
+    await authorized_client.post(order_url, json=payload)
+    assert quantities(await authorized_client.get(detail_url))[last.id] == 0
+    assert await response_cache.version("catalog") != catalog_version
+
+
+@pytest.mark.anyio
+async def test_place_order_insufficient_stock(
+    authorized_client: AsyncClient,
+    create_test_product: Product,
+    session: AsyncSession,
+):
+    """Если одной позиции не хватает, не списывается ничего"""
+    available, sold_out, _ = create_test_product.variants
+    url = app.url_path_for("place_order")
+    payload = {
+        "items": [
+            {"variant_id": available.id, "quantity": 1},
+            {"variant_id": sold_out.id, "quantity": 1},
+        ],
+    }
+    response = await authorized_client.post(url, json=payload)
+    assert response.status_code == status.HTTP_409_CONFLICT
+    assert await _stock(session, available.id) == 5
+    orders = await session.execute(select(Order))
+    assert orders.scalars().all() == []
+
+
+@pytest.mark.anyio
+async def test_flash_sale_does_not_oversell(
+    authorized_client: AsyncClient,
+    create_test_product: Product,
+    session: AsyncSession,
+):
+    variant = create_test_product.variants[0]
+    url = app.url_path_for("place_order")
+    payload = {"items": [{"variant_id": variant.id, "quantity": 1}]}
+    responses = await asyncio.gather(
+        *(authorized_client.post(url, json=payload) for _ in range(8)),
+    )
+    codes = sorted(response.status_code for response in responses)
+    assert codes == [status.HTTP_201_CREATED] * 5 + [status.HTTP_409_CONFLICT] * 3
+    assert await _stock(session, variant.id) == 0
+
+
+@pytest.mark.anyio
+async def test_cancel_and_confirm(
+    authorized_client: AsyncClient,
+    create_test_product: Product,
+    session: AsyncSession,
+):
+    variant = create_test_product.variants[0]
+    url = app.url_path_for("place_order")
+    payload = {"items": [{"variant_id": variant.id, "quantity": 5}]}
+    cancelled = (await authorized_client.post(url, json=payload)).json()
+    assert await _stock(session, variant.id) == 0
+
+    url = app.url_path_for("cancel_order", order_pk=cancelled["id"])
+    response = await authorized_client.post(url)
+    assert response.json()["status"] == OrderStatus.CANCELLED
+    assert await _stock(session, variant.id) == 5
+    url = app.url_path_for("confirm_order", order_pk=cancelled["id"])
+    response = await authorized_client.post(url)
+    assert response.status_code == status.HTTP_409_CONFLICT
+
+    url = app.url_path_for("place_order")
+    confirmed = (await authorized_client.post(url, json=payload)).json()
+    url = app.url_path_for("confirm_order", order_pk=confirmed["id"])
+    response = await authorized_client.post(url)
+    assert response.json()["status"] == OrderStatus.CONFIRMED
+    assert await _stock(session, variant.id) == 0
+
+
+@pytest.mark.anyio
+async def test_sweeper_releases_expired_reservations(
+    authorized_client: AsyncClient,
+    create_test_product: Product,
+    session: AsyncSession,
+):
+    variant = create_test_product.variants[0]
+    url = app.url_path_for("place_order")
+    payload = {"items": [{"variant_id": variant.id, "quantity": 4}]}
+    order = (await authorized_client.post(url, json=payload)).json()
+    await session.execute(
+        update(Order)
+        .where(Order.id == order["id"])
+        .values(expires_at=datetime.now(timezone.utc) - timedelta(seconds=1)),
+    )
+    await session.commit()
+
+    assert await reservation_sweeper.release_expired() == 1
+    assert await reservation_sweeper.release_expired() == 0
+    assert await _stock(session, variant.id) == 5
+    url = app.url_path_for("order_detail", order_pk=order["id"])
+    response = await authorized_client.get(url)
+    assert response.json()["status"] == OrderStatus.EXPIRED
@@ -0,0 +1,67 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import aioredis
+import pytest
+from fastapi import status
+from sqlalchemy.sql import select
+
+from src.core.config import get_settings
+from src.core.outbox import DomainEvent, OutboxRelay
+from src.core.outbox.models import OutboxEvent
+from src.main import app
+from src.tests.helpers import get_objects_count
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from src.apps.company.models import Company
+
+settings = get_settings()
+
+
+@pytest.fixture
+async def redis():
+    client = aioredis.from_url(
+        f"redis://{settings.redis.REDIS_HOST}:{settings.redis.REDIS_PORT}",
+        encoding="utf-8",
+        decode_responses=True,
+    )
+    yield client
+    await client.delete(OutboxRelay.stream_name(DomainEvent.COMPANY_VERIFIED))
+    await client.close()
+
+
+@pytest.mark.anyio
+async def test_verify_company_writes_outbox_event(
+    superuser_client: AsyncClient,
+    session: AsyncSession,
+    create_test_company: Company,
+):
+    """Событие верификации записывается в outbox вместе с изменением компании"""
+    url = app.url_path_for("verify_company", company_pk=create_test_company.id)
+    response = await superuser_client.patch(url, json={"is_verified": False})
+    result = await session.execute(select(OutboxEvent))
+    event = result.scalar_one()
+    assert response.status_code == status.HTTP_200_OK
+    assert event.event_type == DomainEvent.COMPANY_VERIFIED
+    assert event.aggregate_id == str(create_test_company.id)
+    assert event.payload == {"is_verified": False}
+
+
+@pytest.mark.anyio
+async def test_relay_publishes_events_to_stream(
+    superuser_client: AsyncClient,
+    session: AsyncSession,
+    create_test_company: Company,
+    redis,
+):
+    """Релей публикует события в Redis-стрим и удаляет их из outbox"""
+    url = app.url_path_for("hide_company", company_pk=create_test_company.id)
+    await superuser_client.patch(url, json={"is_hidden": True})
+    published = await OutboxRelay().publish_batch(redis)
+    stream = OutboxRelay.stream_name(DomainEvent.COMPANY_HIDDEN)
+    messages = await redis.xrange(stream)
+    assert published == 1
+    assert messages[-1][1]["type"] == DomainEvent.COMPANY_HIDDEN
+    assert await get_objects_count(OutboxEvent, session) == 0
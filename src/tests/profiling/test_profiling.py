@@ -0,0 +1,38 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import pytest
+from fastapi import status
+
+from src.core.profiling import StackSampler, collapse
+from src.main import app
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+
+
+def test_collapse_counts_identical_stacks():
+    """Одинаковые стеки сворачиваются в одну строку с количеством сэмплов"""
+    stacks = [("MainThread", "a", "b"), ("MainThread", "a", "b"), ("MainThread", "a")]
+    assert collapse(stacks) == "MainThread;a;b 2\nMainThread;a 1\n"
+
+
+@pytest.mark.anyio
+async def test_profile_worker_forbidden(authorized_client: AsyncClient):
+    """Профилирование доступно только суперпользователю"""
+    url = app.url_path_for("profile_worker")
+    response = await authorized_client.get(url, params={"seconds": 0.1})
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.anyio
+async def test_profile_worker(superuser_client: AsyncClient):
+    """Суперпользователь получает свернутые стеки текущего воркера"""
+    url = app.url_path_for("profile_worker")
+    response = await superuser_client.get(url, params={"seconds": 0.1})
+    assert response.status_code == status.HTTP_200_OK
+    lines = response.text.splitlines()
+    assert lines
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert any(line.startswith("MainThread;") for line in lines)
+    assert not any(StackSampler.__module__ + ":run" in line for line in lines)
@@ -0,0 +1,108 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, AsyncGenerator
+
+import aioredis
+import pytest
+from fastapi import status
+
+from src.core.config import get_settings
+from src.core.exceptions import TooManyRequestsError
+from src.core.ratelimit import (
+    ConcurrencyLimit,
+    Rate,
+    catalog_limit,
+    login_limit,
+    rate_limiter,
+)
+from src.main import app
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+    from src.apps.users.models import User
+
+settings = get_settings()
+
+
+@pytest.fixture
+async def limiter() -> AsyncGenerator[None, None]:
+    redis = aioredis.from_url(
+        f"redis://{settings.redis.REDIS_HOST}:{settings.redis.REDIS_PORT}",
+    )
+    rate_limiter.init(redis, prefix="ywstore-ratelimit-test")
+    await rate_limiter.clear()
+    yield
+    await rate_limiter.clear()
+    rate_limiter.reset()
+    await redis.close()
+
+
+def test_rate_parse():
+    assert Rate.parse("10/minute") == Rate(limit=10, period=60)
+    assert Rate.parse("5 / second").emission_interval_ms == 200
+    with pytest.raises(ValueError):
+        Rate.parse("10/week")
+
+
+@pytest.mark.anyio
+async def test_concurrency_limit_sheds_load():
+    """Запрос сверх лимита одновременных операций сразу получает 429"""
+    limit = ConcurrencyLimit("test", limit=1)
+    first = limit()
+    await first.__anext__()
+    with pytest.raises(TooManyRequestsError) as error:
+        await limit().__anext__()
+    assert error.value.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert error.value.headers["Retry-After"] == "1"
+    await first.aclose()
+    assert limit.active == 0
+
+
+@pytest.mark.anyio
+async def test_catalog_rate_limit(
+    async_client: AsyncClient,
+    limiter: None,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """После исчерпания лимита каталог отвечает 429 с Retry-After"""
+    monkeypatch.setattr(catalog_limit, "rate", Rate.parse("2/minute"))
+    url = app.url_path_for("companies_list")
+    for _ in range(2):
+        response = await async_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+    response = await async_client.get(url)
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert 0 < int(response.headers["Retry-After"]) <= 30
+    assert response.headers["X-RateLimit-Limit"] == "2/60"
+
+
+@pytest.mark.anyio
+async def test_login_limit_skips_logout(
+    async_client: AsyncClient,
+    create_test_user: User,
+    get_test_user_data: dict,
+    limiter: None,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Лимит входа не распространяется на выход"""
+    monkeypatch.setattr(login_limit, "rate", Rate.parse("1/minute"))
+    credentials = {
+        "username": get_test_user_data["email"],
+        "password": get_test_user_data["password"],
+    }
+    response = await async_client.post(
+        app.url_path_for("auth:jwt.login"),
+        data=credentials,
+    )
+    assert response.status_code == status.HTTP_200_OK
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    for _ in range(2):
+        response = await async_client.post(
+            app.url_path_for("auth:jwt.logout"),
+            headers=headers,
+        )
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+    response = await async_client.post(
+        app.url_path_for("auth:jwt.login"),
+        data=credentials,
+    )
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
@@ -0,0 +1,109 @@
+from __future__ import annotations
+from typing import Generator
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy import delete, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from src.apps.company.models import Company
+from src.core.config import get_settings
+from src.core.sql.replicas import (
+    STICKY_COOKIE,
+    ReplicaRoutingMiddleware,
+    RoutingSession,
+    RoutingState,
+    _routing_state,
+    read_from_primary,
+    replica_router,
+)
+
+settings = get_settings()
+
+
+@pytest.fixture
+def engines() -> Generator[tuple[AsyncEngine, AsyncEngine], None, None]:
+    """Движки не подключаются к БД, пока не выполнен запрос, поэтому сервер не нужен."""
+    primary = create_async_engine(settings.postgres.sqlalchemy_db_uri)
+    replica = create_async_engine(settings.postgres.sqlalchemy_db_uri)
+    replica_router.configure([replica])
+    yield primary, replica
+    replica_router.configure([])
+    _routing_state.set(None)
+
+
+def _route(read_only: bool, wrote: bool = False) -> RoutingState:
+    state = RoutingState(read_only=read_only)
+    state.wrote = wrote
+    _routing_state.set(state)
+    return state
+
+
+def test_select_goes_to_replica(engines):
+    primary, replica = engines
+    _route(read_only=True)
+    session = RoutingSession(bind=primary.sync_engine)
+    assert session.get_bind(clause=select(Company)) is replica.sync_engine
+    assert (
+        session.get_bind(clause=select(Company).with_for_update())
+        is primary.sync_engine
+    )
+    # После записи или блокировки сессия больше не читает с реплики
+    assert session.get_bind(clause=select(Company)) is primary.sync_engine
+
+
+def test_cache_fill_reads_primary(engines):
+    """Ответ, который пойдет в общий кэш, читается с основного сервера даже после выбора реплики"""
+    primary, replica = engines
+    _route(read_only=True)
+    session = RoutingSession(bind=primary.sync_engine)
+    assert session.get_bind(clause=select(Company)) is replica.sync_engine
+    read_from_primary()
+    assert session.get_bind(clause=select(Company)) is primary.sync_engine
+    assert (
+        RoutingSession(bind=primary.sync_engine).get_bind(
+            clause=select(Company),
+        )
+        is primary.sync_engine
+    )
+
+
+@pytest.mark.parametrize(
+    ("read_only", "wrote"),
+    [(False, False), (True, True)],
+    ids=["write-request", "sticky-after-write"],
+)
+def test_select_stays_on_primary(engines, read_only: bool, wrote: bool):
+    primary, _ = engines
+    _route(read_only=read_only, wrote=wrote)
+    session = RoutingSession(bind=primary.sync_engine)
+    assert session.get_bind(clause=select(Company)) is primary.sync_engine
+    assert session.get_bind(clause=delete(Company)) is primary.sync_engine
+    assert session.get_bind(clause=text("SELECT 1")) is primary.sync_engine
+
+
+@pytest.mark.anyio
+async def test_sticky_cookie_after_write(engines):
+    """После записи клиент получает cookie и следующие GET-запросы идут на основной сервер"""
+    seen: list[bool] = []
+
+    async def endpoint(request: Request) -> PlainTextResponse:
+        state = _routing_state.get()
+        seen.append(state.read_only)
+        if request.method == "POST":
+            state.wrote = True
+        return PlainTextResponse("ok")
+
+    app = Starlette(routes=[Route("/", endpoint, methods=["GET", "POST"])])
+    app.add_middleware(ReplicaRoutingMiddleware)
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        assert (await client.get("/")).status_code == status.HTTP_200_OK
+        response = await client.post("/")
+        assert STICKY_COOKIE in response.cookies
+        await client.get("/")
+    assert seen == [True, False, False]
@@ -0,0 +1,31 @@
+from __future__ import annotations
+import sys
+
+from src.core.config import get_settings
+from src.core.startup import StartupProfiler
+
+
+def test_settings_are_cached():
+    """Настройки создаются один раз на процесс"""
+    assert get_settings() is get_settings()
+    assert get_settings(db_only=True) is get_settings().postgres
+
+
+def test_import_timing(tmp_path, monkeypatch):
+    """Время импорта учитывается отдельно для модуля и для его вложенных импортов"""
+    (tmp_path / "startup_child.py").write_text("import time\ntime.sleep(0.02)\n")
+    (tmp_path / "startup_parent.py").write_text("import startup_child\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    profiler = StartupProfiler()
+    profiler.install()
+    try:
+        import startup_parent  # noqa: F401
+    finally:
+        profiler.uninstall()
+        sys.modules.pop("startup_parent", None)
+        sys.modules.pop("startup_child", None)
+    parent_total, parent_own = profiler.imports["startup_parent"]
+    child_total, child_own = profiler.imports["startup_child"]
+    assert child_own >= 0.02
+    assert parent_total >= child_total
+    assert parent_own < child_own
@@ -0,0 +1,69 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy.sql import select
+
+from src.apps.roles.repository import RoleRepository
+from src.apps.roles.schemas import RoleIn
+from src.apps.users.models import Role
+from src.core.outbox.models import OutboxEvent
+from src.core.sql.uow import current_unit_of_work, savepoint, unit_of_work
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.orm import sessionmaker
+
+
+async def _role_names(session_class: sessionmaker[AsyncSession]) -> set[str]:
+    async with session_class() as session:
+        roles = await session.execute(select(Role.name))
+        return set(roles.scalars().all())
+
+
+@pytest.mark.anyio
+async def test_commit_once_at_exit(async_session_class: sessionmaker[AsyncSession]):
+    """Изменения и события outbox фиксируются одним коммитом в конце блока"""
+    committed: list[set[str]] = []
+    async with async_session_class() as session:
+        async with unit_of_work() as uow:
+            repository = RoleRepository(session=session)
+            await repository.create(in_model=RoleIn(name="first"))
+            await repository.create(in_model=RoleIn(name="second"))
+            assert await _role_names(async_session_class) == set()
+
+            async def after_commit() -> None:
+                committed.append(await _role_names(async_session_class))
+
+            uow.after_commit(after_commit)
+    assert committed == [{"first", "second"}]
+    assert current_unit_of_work() is None
+    async with async_session_class() as session:
+        events = await session.execute(select(OutboxEvent))
+        assert len(events.scalars().all()) == 2
+
+
+@pytest.mark.anyio
+async def test_rollback_on_error(async_session_class: sessionmaker[AsyncSession]):
+    async with async_session_class() as session:
+        with pytest.raises(RuntimeError):
+            async with unit_of_work():
+                await RoleRepository(session=session).create(
+                    in_model=RoleIn(name="lost"),
+                )
+                raise RuntimeError
+    assert await _role_names(async_session_class) == set()
+
+
+@pytest.mark.anyio
+async def test_savepoint(async_session_class: sessionmaker[AsyncSession]):
+    """Ошибка внутри savepoint откатывает только вложенный блок"""
+    async with async_session_class() as session:
+        async with unit_of_work():
+            repository = RoleRepository(session=session)
+            await repository.create(in_model=RoleIn(name="kept"))
+            with pytest.raises(RuntimeError):
+                async with savepoint(session):
+                    await repository.create(in_model=RoleIn(name="nested"))
+                    raise RuntimeError
+    assert await _role_names(async_session_class) == {"kept"}
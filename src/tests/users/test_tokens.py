@@ -0,0 +1,149 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, AsyncGenerator
+from uuid import uuid4
+import time
+
+import aioredis
+import pytest
+from fastapi import status
+
+from src.apps.employee.models import Employee
+from src.apps.roles.enums import CompanyRoles
+from src.core.auth.bloom import BloomFilter
+from src.core.auth.refresh import refresh_tokens
+from src.core.auth.revocation import TokenRevocationList, token_revocations
+from src.core.auth.strategy import jwt_strategy
+from src.core.config import get_settings
+from src.main import app
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+    from src.apps.users.models import User
+
+settings = get_settings()
+
+
+@pytest.fixture
+async def token_stores() -> AsyncGenerator[None, None]:
+    redis = aioredis.from_url(
+        f"redis://{settings.redis.REDIS_HOST}:{settings.redis.REDIS_PORT}",
+        decode_responses=True,
+    )
+    refresh_tokens.init(redis, prefix="ywstore-auth-test")
+    token_revocations.init(redis, prefix="ywstore-auth-test")
+    await refresh_tokens.clear()
+    await token_revocations.clear()
+    yield
+    await refresh_tokens.clear()
+    await token_revocations.clear()
+    refresh_tokens.reset()
+    token_revocations.reset()
+    await redis.close()
+
+
+async def login(client: AsyncClient, user_data: dict) -> dict:
+    response = await client.post(
+        app.url_path_for("auth:jwt.login"),
+        data={"username": user_data["email"], "password": user_data["password"]},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    return response.json()
+
+
+@pytest.mark.anyio
+async def test_access_token_carries_claims(
+    async_client: AsyncClient,
+    employee_admin: Employee,
+    get_test_user_data: dict,
+):
+    """Access-токен содержит компанию и роли, права проверяются по нему"""
+    pair = await login(async_client, get_test_user_data)
+    principal = jwt_strategy.decode(pair["access_token"])
+    assert principal.user_id == employee_admin.user_id
+    assert principal.company_id == employee_admin.company_id
+    assert principal.is_member(CompanyRoles.ADMIN)
+    assert not principal.is_superuser
+    assert pair["expires_in"] == settings.ACCESS_TOKEN_EXPIRE_SECONDS
+
+
+@pytest.mark.anyio
+async def test_refresh_token_rotation(
+    async_client: AsyncClient,
+    create_test_user: User,
+    get_test_user_data: dict,
+    token_stores: None,
+):
+    """Refresh-токен одноразовый: повторное предъявление отзывает все семейство"""
+    pair = await login(async_client, get_test_user_data)
+    url = app.url_path_for("auth:jwt.refresh")
+
+    response = await async_client.post(
+        url,
+        json={"refresh_token": pair["refresh_token"]},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    rotated = response.json()
+    assert rotated["refresh_token"] != pair["refresh_token"]
+    assert jwt_strategy.decode(rotated["access_token"]).user_id == create_test_user.id
+
+    response = await async_client.post(
+        url,
+        json={"refresh_token": pair["refresh_token"]},
+    )
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    response = await async_client.post(
+        url,
+        json={"refresh_token": rotated["refresh_token"]},
+    )
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.anyio
+async def test_logout_revokes_tokens(
+    async_client: AsyncClient,
+    create_test_user: User,
+    get_test_user_data: dict,
+    token_stores: None,
+):
+    """После выхода access-токен и refresh-токен этого входа недействительны"""
+    pair = await login(async_client, get_test_user_data)
+    headers = {"Authorization": f"Bearer {pair['access_token']}"}
+    response = await async_client.post(
+        app.url_path_for("auth:jwt.logout"),
+        headers=headers,
+    )
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    response = await async_client.get(app.url_path_for("cart_detail"), headers=headers)
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    response = await async_client.post(
+        app.url_path_for("auth:jwt.refresh"),
+        json={"refresh_token": pair["refresh_token"]},
+    )
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_bloom_filter():
+    """Добавленные элементы всегда находятся, посторонние - почти никогда"""
+    items = [uuid4().hex for _ in range(1000)]
+    bloom = BloomFilter.from_items(items, capacity=1000, error_rate=0.01)
+    assert all(item in bloom for item in items)
+    false_positives = sum(uuid4().hex in bloom for _ in range(1000))
+    assert false_positives < 50
+
+
+@pytest.mark.anyio
+async def test_revocation_filter_sync(token_stores: None, monkeypatch):
+    """Отзыв из другого воркера виден после синхронизации, чистые токены проверяются без Redis"""
+    worker = TokenRevocationList()
+    worker.init(token_revocations._redis, prefix="ywstore-auth-test")
+    await worker.sync()
+    await token_revocations.revoke("revoked-jti", time.time() + 60)
+    await worker.sync()
+    assert await worker.is_revoked("revoked-jti")
+
+    async def no_redis(*args):
+        raise AssertionError("Проверка чистого токена не должна ходить в Redis")
+
+    monkeypatch.setattr(token_revocations._redis, "exists", no_redis)
+    assert not await worker.is_revoked(uuid4().hex)